@@ -31,6 +31,9 @@ def process(db: Database, interview_id: str):
             f"Interview {interview_id} is in {interview.status} status, not in {InterviewStatus.PENDING_APPROVAL} status, skipping")
         return
 
+    # don't hold a pooled connection through cognito, bedrock and s3
+    db.release()
+
     # fetch username from cognito
     logging.info(
         f"fetching users from cognito to lookup user: {interview.user_id}")
@@ -95,6 +98,19 @@ def process(db: Database, interview_id: str):
         logging.error(f"Error handling document archival: {str(e)}")
         raise e
 
+    # Update interview status, and point the topic at the new document
+    # (both commit together with the event's session)
+    logging.info("updating interview status in db")
+    if not db.transition_interview(
+            interview_id, [InterviewStatus.PENDING_APPROVAL], InterviewStatus.APPROVED):
+        logging.warning(
+            f"Interview {interview_id} left {InterviewStatus.PENDING_APPROVAL} status while processing")
+        return
+    db.set_kb_document(interview.topic_id, interview.id,
+                       doc_key, interview.approved_on)
+    logging.info(
+        f"Interview {interview_id} processed and status updated to {InterviewStatus.APPROVED}")
+
     # sync the KB datasource
     try:
         logging.info(f"Starting KB ingestion job for interview {interview_id}")
@@ -123,16 +139,9 @@ def process(db: Database, interview_id: str):
 
     except Exception as e:
         logging.error(f"Error starting KB ingestion job: {str(e)}")
-        # Don't raise the exception here to allow the interview status update to proceed
+        # Don't raise the exception here, the interview is already approved
         # This is a non-critical operation that can be retried later if needed
 
-    # Update interview status
-    interview.status = InterviewStatus.APPROVED
-    logging.info("updating interview in db")
-    db.update_interview(interview)
-    logging.info(
-        f"Interview {interview_id} processed and status updated to {InterviewStatus.APPROVED}")
-
 
 def get_username(user_id: str) -> str:
     """
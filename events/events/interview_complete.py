@@ -25,6 +25,9 @@ def process(db: Database, interview_id: str):
             f"Interview {interview_id} is in {interview.status} status, not in {InterviewStatus.PROCESSING} status, skipping")
         return
 
+    # don't hold a pooled connection while bedrock summarizes
+    db.release()
+
     # 2. Call LLM to generate interview summary
     logging.info(
         f"Calling LLM to generate summary for interview {interview_id}")
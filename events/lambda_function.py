@@ -45,8 +45,12 @@ def lambda_handler(event, context):
             # Parse the message body
             message_body = json.loads(body)
 
-            # Process the message based on event type
-            process_message(db, message_body)
+            # Process the message based on event type in a single
+            # unit of work (one connection, committed once). Pinned to the
+            # writer since the event was raised by a write a replica may
+            # not have replayed yet.
+            with db.session(pinned=True):
+                process_message(db, message_body)
 
             logging.info(f"Successfully processed message {message_id}")
 
@@ -1,6 +1,12 @@
 #!/bin/bash
 set -e
 
+# Applies pending migrations from shared/data/migrations to Aurora
+# through the RDS Data API and records them in schema_migrations.
+# Locally, use: cd web && python -m shared.data.migrate
+
+MIGRATIONS="$(dirname "$0")/../shared/data/migrations"
+
 function sql() {
   echo $1
   aws rds-data execute-statement \
@@ -12,34 +18,45 @@ function sql() {
   echo ""
 }
 
-sql "ALTER TABLE interview
-ADD COLUMN IF NOT EXISTS voice_mode BOOLEAN DEFAULT FALSE;
-" $ADMIN
-
-sql "ALTER TABLE interview
-ADD COLUMN IF NOT EXISTS voice_session_metadata JSONB DEFAULT '{}'::jsonb;
-" $ADMIN
-
-sql "CREATE INDEX IF NOT EXISTS idx_interview_voice_mode ON interview(voice_mode);
-" $ADMIN
-
-sql "CREATE INDEX IF NOT EXISTS idx_interview_voice_session_metadata ON interview USING GIN(voice_session_metadata);
-" $ADMIN
-
-sql "COMMENT ON COLUMN interview.voice_session_metadata IS 'JSON metadata for voice sessions including session IDs, connection status, audio quality metrics, and session timestamps';
-" $ADMIN
-
-sql "CREATE TABLE IF NOT EXISTS settings (
-  key VARCHAR(255) PRIMARY KEY,
-  value TEXT NOT NULL,
-  created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
-  updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+sql "CREATE TABLE IF NOT EXISTS schema_migrations (
+  version INTEGER PRIMARY KEY,
+  name VARCHAR NOT NULL,
+  applied_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
 );
 " $ADMIN
 
-sql "INSERT INTO settings (key, value) VALUES ('talk_mode_enabled', 'true')
-ON CONFLICT (key) DO NOTHING;
-" $ADMIN
-
-sql "COMMENT ON TABLE settings IS 'System-wide configuration settings stored as key-value pairs';
-" $ADMIN
+applied=$(aws rds-data execute-statement \
+  --resource-arn ${CLUSTER_ARN} \
+  --secret-arn $ADMIN \
+  --database ${DB_NAME} \
+  --sql "SELECT version FROM schema_migrations" \
+  --query 'records[*][0].longValue' \
+  --output text)
+
+for file in "$MIGRATIONS"/[0-9]*.sql; do
+  name=$(basename "$file" .sql)
+  version=$((10#${name%%_*}))
+
+  if echo " $applied " | tr '\t' ' ' | grep -q " $version "; then
+    echo "already applied: $name"
+    continue
+  fi
+
+  echo "applying: $name"
+
+  # the Data API runs one statement per call, statements are separated
+  # by a line ending in ";" outside $$ quoted function bodies and
+  # full-line comments are dropped (same rules as shared/data/migrate.py)
+  awk 'BEGIN { ORS = "\0" }
+       !quoted && /^[ \t]*--/ { next }
+       { out = out $0 "\n"; if (gsub(/\$\$/, "&") % 2) quoted = !quoted }
+       !quoted && /;[ \t]*$/ { sub(/;[ \t]*\n$/, "\n", out); if (out ~ /[^ \t\n]/) print out; out = "" }
+       END { if (out ~ /[^ \t\n]/) print out }' "$file" |
+    while IFS= read -r -d '' statement; do
+      sql "$statement" $ADMIN
+    done
+
+  sql "INSERT INTO schema_migrations (version, name) VALUES ($version, '$name');" $ADMIN
+done
+
+echo "done"
@@ -33,10 +33,24 @@ class Config:
         self._flask_secret_key_name = os.getenv("FLASK_SECRET_KEY_NAME")
         self._s3_bucket_name = os.getenv("S3_BUCKET_NAME")
         self._postgres_host = os.getenv("POSTGRES_HOST")
+        self._postgres_reader_host = os.getenv("POSTGRES_READER_HOST")
+        self._db_read_your_writes_seconds = os.getenv(
+            "DB_READ_YOUR_WRITES_SECONDS", "5")
         self._postgres_dbname = os.getenv("POSTGRES_DB")
         self._postgres_user = os.getenv("POSTGRES_USER")
         self._postgres_password = os.getenv("POSTGRES_PASSWORD")
         self._postgres_secret_arn = os.getenv("DB_SECRET_ARN")
+        self._db_pool_min_size = os.getenv("DB_POOL_MIN_SIZE", "1")
+        self._db_pool_max_size = os.getenv("DB_POOL_MAX_SIZE", "10")
+        self._db_pool_timeout = os.getenv("DB_POOL_TIMEOUT", "30")
+        self._db_pool_max_idle = os.getenv("DB_POOL_MAX_IDLE", "300")
+        self._db_pool_max_lifetime = os.getenv("DB_POOL_MAX_LIFETIME", "3600")
+        self._settings_cache_ttl = os.getenv("SETTINGS_CACHE_TTL", "60")
+        self._catalog_cache_ttl = os.getenv("CATALOG_CACHE_TTL", "300")
+        self._archive_after_months = os.getenv("ARCHIVE_AFTER_MONTHS", "12")
+        self._partition_months_ahead = os.getenv(
+            "PARTITION_MONTHS_AHEAD", "3")
+        self._archive_dir = os.getenv("ARCHIVE_DIR")
         self._sqs_queue_url = os.getenv("SQS_QUEUE_URL")
         self._voice_lambda_function_name = os.getenv(
             "VOICE_LAMBDA_FUNCTION_NAME")
@@ -159,6 +173,11 @@ class Config:
     def postgres_host(self) -> str:
         return self._postgres_host
 
+    # optional read replica endpoint, reads go to postgres_host when unset
+    @property
+    def postgres_reader_host(self) -> str:
+        return self._postgres_reader_host
+
     @property
     def postgres_dbname(self) -> str:
         return self._postgres_dbname
@@ -171,6 +190,60 @@ class Config:
     def postgres_password(self) -> str:
         return self._postgres_password
 
+    # connection pool sizing and lifetimes (seconds)
+
+    @property
+    def db_pool_min_size(self) -> int:
+        return int(self._db_pool_min_size)
+
+    @property
+    def db_pool_max_size(self) -> int:
+        return int(self._db_pool_max_size)
+
+    @property
+    def db_pool_timeout(self) -> float:
+        return float(self._db_pool_timeout)
+
+    @property
+    def db_pool_max_idle(self) -> float:
+        return float(self._db_pool_max_idle)
+
+    @property
+    def db_pool_max_lifetime(self) -> float:
+        return float(self._db_pool_max_lifetime)
+
+    # how long a user's reads stay on the writer after they write
+    @property
+    def db_read_your_writes_seconds(self) -> float:
+        return float(self._db_read_your_writes_seconds)
+
+    # how long cached settings are trusted without a change notification,
+    # 0 disables the settings cache
+    @property
+    def settings_cache_ttl(self) -> float:
+        return float(self._settings_cache_ttl)
+
+    # same for scopes and topics
+    @property
+    def catalog_cache_ttl(self) -> float:
+        return float(self._catalog_cache_ttl)
+
+    # conversation and interview months older than this are archived
+    # by python -m shared.data.archive
+    @property
+    def archive_after_months(self) -> int:
+        return int(self._archive_after_months)
+
+    # monthly partitions the archive job creates ahead of time
+    @property
+    def partition_months_ahead(self) -> int:
+        return int(self._partition_months_ahead)
+
+    # optional local directory archives are written to instead of S3
+    @property
+    def archive_dir(self) -> str:
+        return self._archive_dir
+
 
 # Create a singleton instance
 config = Config()
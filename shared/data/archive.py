@@ -0,0 +1,337 @@
+"""
+Archives old conversation and interview months to cold storage.
+
+usage (from web/ or events/):
+    python -m shared.data.archive            create upcoming partitions and archive old months
+    python -m shared.data.archive status     list live partitions and archived months
+    python -m shared.data.archive partitions create upcoming partitions only
+
+conversation and interview are partitioned by created month (see
+migrations/0010_partition_by_month.sql). Each run creates the partitions for
+the current month and the PARTITION_MONTHS_AHEAD months after it, then
+archives every month that ended ARCHIVE_AFTER_MONTHS or more months ago:
+
+1. the month's rows (with their turns) are exported from one snapshot to
+   shared.data.archive_store, S3 or ARCHIVE_DIR, with a checksum of the rows
+2. the month is checked against the checksum again and its ids are recorded
+   in archived_record. Live rows are read first, so the archived records
+   only take over once the partition is gone
+3. the partition is detached with DETACH PARTITION ... CONCURRENTLY, which
+   doesn't block reads or writes on the table
+4. the detached table is checked against the checksum a last time (nothing
+   can write to it any more), its turns are deleted and it's dropped
+
+A month that changed in between is put back as it was (re-attached, its
+archived records removed) and left for the next run, as is a month whose
+detach an earlier run didn't finish. Interview months that still hold open
+interviews or a topic's current kb document are skipped. Database.get() and
+get_interview() read archived records back through archived_record.
+"""
+import os
+import re
+import sys
+import logging
+import tempfile
+from datetime import date, datetime, timezone
+
+from psycopg import sql
+
+from shared.config import config
+from shared.data import queries, archive_store
+from shared.data.database import Database
+
+# rows fetched per round trip while exporting
+EXPORT_BATCH = 1000
+
+TABLES = {
+    "conversation": {
+        "turns": "conversation_turn",
+        "turn_key": "conversation_id",
+        "export": queries.ARCHIVE_CONVERSATION_EXPORT,
+        "checksum": queries.ARCHIVE_CONVERSATION_CHECKSUM,
+        "records": queries.ARCHIVE_CONVERSATION_RECORDS,
+        "blockers": None,
+    },
+    "interview": {
+        "turns": "interview_turn",
+        "turn_key": "interview_id",
+        "export": queries.ARCHIVE_INTERVIEW_EXPORT,
+        "checksum": queries.ARCHIVE_INTERVIEW_CHECKSUM,
+        "records": queries.ARCHIVE_INTERVIEW_RECORDS,
+        "blockers": queries.ARCHIVE_INTERVIEW_BLOCKERS,
+    },
+}
+
+
+class ArchiveConflict(Exception):
+    """A month changed between its export and its removal"""
+    pass
+
+
+def add_months(month: date, n: int) -> date:
+    """the first day of the month n months after month"""
+    index = month.year * 12 + month.month - 1 + n
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def month_bounds(month: date) -> tuple:
+    """[start, end) of month in UTC, the partition's bounds"""
+    start = datetime(month.year, month.month, 1, tzinfo=timezone.utc)
+    end = add_months(month, 1)
+    return start, datetime(end.year, end.month, 1, tzinfo=timezone.utc)
+
+
+def create_partitions(db: Database, now: datetime) -> list:
+    """creates any missing partitions from now's month ahead, returns their names"""
+
+    this_month = date(now.year, now.month, 1)
+    names = []
+    with db.connect() as conn:
+        for table in TABLES:
+            for n in range(config.partition_months_ahead + 1):
+                values = (table, add_months(this_month, n))
+                names.append(queries.PARTITION_CREATE.run(
+                    conn, values).fetchone()[0])
+    return names
+
+
+def partitions(db: Database, table) -> list:
+    """(month, partition name) of table's monthly partitions, oldest first"""
+
+    pattern = re.compile(rf"^{table}_(\d{{4}})_(\d{{2}})$")
+    with db.connect() as conn:
+        records = queries.PARTITION_LIST.run(conn, (table,)).fetchall()
+
+    months = []
+    for (name,) in records:
+        match = pattern.match(name)
+        if match:
+            months.append((date(int(match[1]), int(match[2]), 1), name))
+    return sorted(months)
+
+
+def blockers(conn, table, bounds) -> int:
+    """rows that keep the month from being archived"""
+    query = TABLES[table]["blockers"]
+    if query is None:
+        return 0
+    return query.run(conn, bounds).fetchone()[0]
+
+
+def export_month(db: Database, table, month, path) -> tuple:
+    """
+    writes table's month to a gzip NDJSON file at path from one snapshot,
+    returns (rows, turns, checksum)
+    """
+
+    spec = TABLES[table]
+    bounds = month_bounds(month)
+    turns = 0
+
+    with db.connect() as conn:
+        conn.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+        checksum = tuple(spec["checksum"].run(conn, bounds).fetchone())
+
+        with conn.cursor(name=f"archive_{table}") as cursor:
+            cursor.itersize = EXPORT_BATCH
+            cursor.execute(spec["export"], bounds)
+
+            def lines():
+                nonlocal turns
+                for line, count in cursor:
+                    turns += count
+                    yield line
+
+            rows = archive_store.write_lines(path, lines())
+
+    return rows, turns, checksum
+
+
+def record_month(db: Database, table, month, partition, key, rows, checksum):
+    """
+    checks the exported month hasn't changed and records its ids as
+    archived, without locking the table (ArchiveConflict if it changed)
+    """
+
+    spec = TABLES[table]
+    bounds = month_bounds(month)
+
+    with db.connect() as conn:
+        if tuple(spec["checksum"].run(conn, bounds).fetchone()) != checksum:
+            raise ArchiveConflict(f"{partition} changed while it was exported")
+        if blockers(conn, table, bounds):
+            raise ArchiveConflict(f"{partition} can no longer be archived")
+
+        spec["records"].run(conn, (month, *bounds))
+        queries.ARCHIVE_PARTITION_INSERT.run(conn, (table, month, key, rows))
+
+
+def detach_pending(conn, partition):
+    """True while partition's detach is pending, None once it's detached"""
+    record = queries.PARTITION_DETACH_PENDING.run(conn, (partition,)).fetchone()
+    return record[0] if record else None
+
+
+def detach(db: Database, table, partition):
+    """
+    detaches partition from table without blocking the table's reads and
+    writes. DETACH ... CONCURRENTLY can't run inside a transaction, and
+    waits for the queries already using the partition to finish
+    """
+
+    with db.connect() as conn:
+        conn.autocommit = True
+        try:
+            conn.execute(sql.SQL("ALTER TABLE {} DETACH PARTITION {} CONCURRENTLY").format(
+                sql.Identifier(table), sql.Identifier(partition)))
+        finally:
+            conn.autocommit = False
+
+
+def drop_month(db: Database, table, partition, turns, checksum):
+    """
+    deletes a detached month's turns and drops it, unless it changed
+    before it was detached (ArchiveConflict)
+    """
+
+    spec = TABLES[table]
+    names = {
+        "partition": sql.Identifier(partition),
+        "turns": sql.Identifier(spec["turns"]),
+        "key": sql.Identifier(spec["turn_key"]),
+    }
+
+    with db.connect() as conn:
+        detached = conn.execute(sql.SQL(
+            queries.ARCHIVE_DETACHED_CHECKSUM).format(**names)).fetchone()
+        if tuple(detached) != checksum:
+            raise ArchiveConflict(f"{partition} changed while it was exported")
+
+        deleted = conn.execute(sql.SQL(
+            queries.ARCHIVE_DETACHED_TURNS_DELETE).format(**names)).rowcount
+        if deleted != turns:
+            raise ArchiveConflict(
+                f"{partition} has {deleted} turns, {turns} were exported")
+
+        conn.execute(sql.SQL("DROP TABLE {}").format(names["partition"]))
+
+
+def restore(db: Database, table, month, partition):
+    """puts back a month whose removal didn't finish: its partition and no archived records"""
+
+    start, end = month_bounds(month)
+    with db.connect() as conn:
+        conn.autocommit = True
+        try:
+            pending = detach_pending(conn, partition)
+            if pending:
+                conn.execute(sql.SQL("ALTER TABLE {} DETACH PARTITION {} FINALIZE").format(
+                    sql.Identifier(table), sql.Identifier(partition)))
+            if pending is not False:
+                conn.execute(sql.SQL(
+                    "ALTER TABLE {} ATTACH PARTITION {} FOR VALUES FROM ({}) TO ({})").format(
+                    sql.Identifier(table), sql.Identifier(partition),
+                    sql.Literal(start), sql.Literal(end)))
+        finally:
+            conn.autocommit = False
+
+        queries.ARCHIVE_RECORDS_DELETE.run(conn, (table, month))
+        queries.ARCHIVE_PARTITION_DELETE.run(conn, (table, month))
+    logging.info(f"restored {partition}")
+
+
+def archive_month(db: Database, store, table, month, partition) -> int:
+    """archives one month of table, returns its row count (None if skipped)"""
+
+    with db.connect() as conn:
+        pending = detach_pending(conn, partition)
+        count = blockers(conn, table, month_bounds(month))
+    if pending:
+        # an earlier run stopped part way through detaching it
+        restore(db, table, month, partition)
+        raise ArchiveConflict(f"{partition} was left detaching by an earlier run")
+    if count:
+        logging.warning(
+            f"skipping {partition}: {count} interviews are open or current kb documents")
+        return None
+
+    key = archive_store.archive_key(table, month)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, os.path.basename(key))
+        rows, turns, checksum = export_month(db, table, month, path)
+        location = store.put(key, path)
+    logging.info(f"exported {partition} ({rows} rows) to {location}")
+
+    record_month(db, table, month, partition, key, rows, checksum)
+    try:
+        detach(db, table, partition)
+        drop_month(db, table, partition, turns, checksum)
+    except Exception:
+        restore(db, table, month, partition)
+        raise
+    return rows
+
+
+def archive(db: Database, store, now: datetime) -> list:
+    """archives every month that's old enough, returns (table, month, rows)"""
+
+    if config.archive_after_months <= 0:
+        return []
+
+    cutoff = add_months(date(now.year, now.month, 1),
+                        -config.archive_after_months)
+    archived = []
+    for table in TABLES:
+        for month, partition in partitions(db, table):
+            if add_months(month, 1) > cutoff:
+                break
+            try:
+                rows = archive_month(db, store, table, month, partition)
+            except ArchiveConflict as e:
+                logging.warning(f"{e}, leaving it for the next run")
+                continue
+            if rows is not None:
+                archived.append((table, month, rows))
+
+    return archived
+
+
+def status(db: Database) -> tuple:
+    """(live partition names, archived_partition rows)"""
+
+    live = [name for table in TABLES for _, name in partitions(db, table)]
+    with db.connect() as conn:
+        archived = queries.ARCHIVE_PARTITION_LIST.run(conn).fetchall()
+    return live, archived
+
+
+def main():
+    db = Database()
+    try:
+        if len(sys.argv) > 1 and sys.argv[1] == "status":
+            live, archived = status(db)
+            for name in live:
+                print(f"live      {name}")
+            for record in archived:
+                print(f"archived  {record['kind']}_{record['month']:%Y_%m}  "
+                      f"({record['row_count']} rows, {record['location']})")
+            return
+
+        now = datetime.now(timezone.utc)
+        created = create_partitions(db, now)
+        if len(sys.argv) > 1 and sys.argv[1] == "partitions":
+            for name in created:
+                print(f"live      {name}")
+            return
+
+        archived = archive(db, archive_store.get_store(), now)
+        for table, month, rows in archived:
+            print(f"archived  {table}_{month:%Y_%m}  ({rows} rows)")
+        if not archived:
+            print("nothing to archive")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Cold storage for archived conversation and interview months.
+
+python -m shared.data.archive exports each month it archives as one gzip
+compressed NDJSON object, db-archive/<kind>/<yyyy>-<mm>.ndjson.gz, in the S3
+bucket, or under ARCHIVE_DIR when it's set (a local stand-in for development).
+Each line is a JSON object with the row's id and created, and as "record"
+what Database.get() or get_interview() returned for it while it was live.
+
+Archives are NDJSON rather than Parquet: an archived record is read back by
+scanning its month for one id with the standard library (find_record), and
+neither the web image nor the events lambda ship pyarrow.
+"""
+import os
+import copy
+import gzip
+import json
+import shutil
+import functools
+from contextlib import closing
+
+from shared import s3
+from shared.config import config
+
+ARCHIVE_PREFIX = "db-archive"
+
+
+def archive_key(kind, month) -> str:
+    """object key for kind's archived month (a date)"""
+    return f"{ARCHIVE_PREFIX}/{kind}/{month:%Y-%m}.ndjson.gz"
+
+
+class S3ArchiveStore:
+    """Archives in the app's S3 bucket"""
+
+    def put(self, key, path) -> str:
+        """uploads the file at path as key, returns its location"""
+        return s3.upload_file(path, key)
+
+    def open(self, key):
+        """binary stream of the object at key"""
+        return closing(s3.open_object(key))
+
+
+class LocalArchiveStore:
+    """Archives under a local directory"""
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def put(self, key, path) -> str:
+        """copies the file at path to key, returns its location"""
+        dest = os.path.join(self.directory, key)
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        shutil.copyfile(path, dest)
+        return dest
+
+    def open(self, key):
+        """binary stream of the file at key"""
+        return open(os.path.join(self.directory, key), "rb")
+
+
+def get_store():
+    """the configured archive store"""
+    if config.archive_dir:
+        return LocalArchiveStore(config.archive_dir)
+    return S3ArchiveStore()
+
+
+def write_lines(path, lines) -> int:
+    """writes JSON lines to a gzip NDJSON file at path, returns how many"""
+    count = 0
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        for line in lines:
+            f.write(line)
+            f.write("\n")
+            count += 1
+    return count
+
+
+@functools.lru_cache(maxsize=256)
+def _find_record(key, id):
+    with get_store().open(key) as f, gzip.open(f, "rt", encoding="utf-8") as lines:
+        for line in lines:
+            # only parse the lines that can match
+            if id not in line:
+                continue
+            entry = json.loads(line)
+            if entry["id"] == id:
+                return entry["record"]
+    return None
+
+
+def find_record(key, id) -> dict:
+    """
+    the archived record for id in the object at key (None if it isn't there).
+    archives never change, so recent lookups are cached.
+    """
+    return copy.deepcopy(_find_record(key, str(id)))
@@ -0,0 +1,299 @@
+import json
+import asyncio
+import logging
+import psycopg
+from psycopg_pool import AsyncConnectionPool
+
+from shared.config import config
+from shared.data import queries
+from shared.data.database import (
+    Database, load_credentials, refresh_after_auth_failure, is_auth_failure)
+from shared.data.data_models import Interview
+
+
+class AsyncRefreshingConnection(psycopg.AsyncConnection):
+    """Async counterpart to RefreshingConnection"""
+
+    @classmethod
+    async def connect(cls, conninfo="", **kwargs):
+        try:
+            return await super().connect(conninfo, **kwargs)
+        except psycopg.OperationalError as e:
+            if config.postgres_secret_arn is None or not is_auth_failure(e):
+                raise
+            user, password = await asyncio.to_thread(
+                refresh_after_auth_failure,
+                config.postgres_secret_arn, kwargs.get("password"))
+            AsyncDatabase._rotate_pool_credentials(user, password)
+            return await super().connect(
+                conninfo, **{**kwargs, "user": user, "password": password})
+
+
+class AsyncDatabase():
+    """
+    Async counterpart to Database for code that wants to overlap
+    database reads with other I/O (e.g. Bedrock calls).
+    Shares query text and row mapping with Database via shared.data.queries.
+    """
+
+    # Class-level async pool shared by all instances on the event loop
+    _pool = None
+
+    def __init__(self):
+        self.host = config.postgres_host
+        self.dbname = config.postgres_dbname
+        self.user = config.postgres_user
+        self.password = config.postgres_password
+        self.secret_arn = config.postgres_secret_arn
+
+    async def _get_pool(self) -> AsyncConnectionPool:
+        """Return the shared async pool, creating it on first use and rotating credentials"""
+
+        if self.secret_arn is not None and not Database._credential_cache.has_credentials():
+            # secrets manager is a blocking call, keep it off the event loop
+            user, password = await asyncio.to_thread(
+                load_credentials, self.secret_arn, self.user, self.password)
+        else:
+            user, password = load_credentials(
+                self.secret_arn, self.user, self.password)
+        self.user, self.password = user, password
+
+        if AsyncDatabase._pool is None:
+            logging.info(
+                f"opening async connection pool (min={config.db_pool_min_size}, max={config.db_pool_max_size})")
+            pool = AsyncConnectionPool(
+                kwargs=Database._connect_kwargs(self, self.host, user, password),
+                min_size=config.db_pool_min_size,
+                max_size=config.db_pool_max_size,
+                timeout=config.db_pool_timeout,
+                max_idle=config.db_pool_max_idle,
+                max_lifetime=config.db_pool_max_lifetime,
+                check=AsyncDatabase._check_connection,
+                connection_class=AsyncRefreshingConnection,
+                name="scribe-async",
+                open=False,
+            )
+            await pool.open()
+            if AsyncDatabase._pool is None:
+                AsyncDatabase._pool = pool
+            else:
+                # another task opened one while we were awaiting
+                await pool.close()
+
+        AsyncDatabase._rotate_pool_credentials(user, password)
+        return AsyncDatabase._pool
+
+    @staticmethod
+    def _rotate_pool_credentials(user, password):
+        """Points the async pool at refreshed credentials"""
+        pool = AsyncDatabase._pool
+        if pool is None:
+            return
+        if pool.kwargs.get("user") != user or pool.kwargs.get("password") != password:
+            logging.info(
+                "database credentials changed, rotating async pooled connections")
+            pool.kwargs = {**pool.kwargs, "user": user, "password": password}
+
+    @staticmethod
+    async def _check_connection(conn):
+        """Discards connections opened with rotated credentials, then pings"""
+        password = AsyncDatabase._pool.kwargs.get("password")
+        if password is not None and conn.info.password != password:
+            raise psycopg.OperationalError(
+                "connection opened with rotated credentials")
+        await AsyncConnectionPool.check_connection(conn)
+
+    async def _fetchone(self, query, values):
+        logging.info(f"query: {query}")
+        logging.info(f"values: {values}")
+        pool = await self._get_pool()
+        async with pool.connection() as conn:
+            cur = await query.run_async(conn, values)
+            return await cur.fetchone()
+
+    async def _fetchall(self, query, values):
+        logging.info(f"query: {query}")
+        logging.info(f"values: {values}")
+        pool = await self._get_pool()
+        async with pool.connection() as conn:
+            cur = await query.run_async(conn, values)
+            return await cur.fetchall()
+
+    async def _execute(self, query, values):
+        logging.info(f"query: {query}")
+        logging.info(f"values: {values}")
+        pool = await self._get_pool()
+        async with pool.connection() as conn:
+            cur = await query.run_async(conn, values)
+            return cur.rowcount
+
+    async def _append_turn(self, lock, query, values, id) -> bool:
+        """runs a turn insert after its advisory lock, in one transaction"""
+        logging.info(f"query: {query}")
+        logging.info(f"values: {values}")
+        pool = await self._get_pool()
+        async with pool.connection() as conn:
+            await lock.run_async(conn, (id,))
+            cur = await query.run_async(conn, values)
+            return cur.rowcount == 1
+
+    async def close(self):
+        """Closes the shared async pool"""
+        if AsyncDatabase._pool is not None:
+            await AsyncDatabase._pool.close()
+            AsyncDatabase._pool = None
+
+    async def get_interview(self, id) -> Interview:
+        """fetch an interview by id with all fields and topic information"""
+        record = await self._fetchone(queries.INTERVIEW_GET_BY_ID, (id,))
+        if record:
+            return record.to_interview()
+
+        # archived records are read from S3, a blocking call
+        archived = await asyncio.to_thread(Database().get_archived, "interview", id)
+        return queries.archived_interview(archived).to_interview() if archived else None
+
+    async def list_interviews(self, top):
+        """fetch a list of interview summaries (without questions)"""
+        records = await self._fetchall(queries.INTERVIEW_LIST, (top,))
+        return [record.to_interview() for record in records]
+
+    async def update_interview(self, interview):
+        """updates an interview object"""
+        await self._execute(queries.INTERVIEW_UPDATE,
+                            queries.interview_update_values(interview))
+
+    async def transition_interview(self, interview_id, from_statuses, to_status) -> bool:
+        """moves an interview to to_status if it's currently in one of from_statuses"""
+        rows = await self._execute(queries.INTERVIEW_TRANSITION_STATUS,
+                                   queries.interview_transition_values(
+                                       interview_id, from_statuses, to_status))
+        return rows == 1
+
+    async def get(self, conversation_id):
+        """fetch a conversation by id"""
+        record = await self._fetchone(
+            queries.CONVERSATION_GET_BY_ID, (conversation_id,))
+        if record:
+            return record[0]
+
+        # archived conversations are read-only
+        conversation = await asyncio.to_thread(
+            Database().get_archived, "conversation", conversation_id)
+        if conversation is not None:
+            conversation["archived"] = True
+        return conversation
+
+    async def update(self, conversation):
+        """updates a conversation's header, see add_conversation_turn()"""
+        values = (queries.conversation_header(conversation),
+                  conversation.get("scope_id"),
+                  conversation["conversationId"])
+        await self._execute(queries.CONVERSATION_UPDATE, values)
+
+    async def add_conversation_turn(self, conversation_id, question, answer, created) -> bool:
+        """
+        appends a Q&A to a conversation without rewriting earlier ones
+        Returns: False if the conversation doesn't exist
+        """
+        return await self._append_turn(
+            queries.CONVERSATION_TURN_LOCK, queries.CONVERSATION_TURN_INSERT,
+            queries.conversation_turn_values(
+                conversation_id, question, answer, created),
+            conversation_id)
+
+    async def append_voice_transcription_entry(self, interview_id, question, answer) -> bool:
+        """
+        Appends a new transcription entry to existing interview data
+        Returns: False if the interview doesn't exist
+        """
+        return await self._append_turn(
+            queries.INTERVIEW_TURN_LOCK, queries.INTERVIEW_TURN_INSERT,
+            queries.interview_turn_values(interview_id, question, answer),
+            interview_id)
+
+    async def get_voice_conversation_history(self, interview_id, max_characters=40960):
+        """Gets formatted conversation history for voice sessions with character limit"""
+        return await self._fetchall(
+            queries.VOICE_GET_CONVERSATION_HISTORY, (interview_id, max_characters))
+
+    async def update_voice_session_metadata(self, interview_id, metadata):
+        """Updates voice session metadata for an interview"""
+        await self._execute(queries.VOICE_UPDATE_SESSION_METADATA,
+                            (json.dumps(metadata, default=str), interview_id))
+
+    async def patch_voice_session_metadata(self, interview_id, patch):
+        """Merges top-level keys into an interview's voice session metadata"""
+        await self._execute(queries.VOICE_PATCH_SESSION_METADATA,
+                            (json.dumps(patch, default=str), interview_id))
+
+    async def update_voice_session_status(self, interview_id, session_id, status):
+        """Updates voice session status for a specific session"""
+        await self._execute(queries.VOICE_UPDATE_SESSION_STATUS,
+                            queries.voice_session_status_values(interview_id, session_id, status))
+
+    async def initialize_voice_session(self, interview_id, session_id, metadata):
+        """Initializes voice session metadata for an interview"""
+        await self._execute(queries.VOICE_INITIALIZE_SESSION,
+                            queries.voice_session_init_values(interview_id, session_id, metadata))
+
+    async def get_voice_session_metadata(self, interview_id, session_id=None):
+        """Gets voice session metadata for an interview"""
+        record = await self._fetchone(
+            queries.VOICE_GET_SESSION_METADATA, (interview_id,))
+        if not record:
+            return None
+        metadata = record[0] or {}
+        if session_id:
+            return metadata.get(session_id)
+        return metadata
+
+    async def enable_voice_mode(self, interview_id):
+        """Enables voice mode for an interview"""
+        await self._execute(queries.VOICE_ENABLE_MODE, (interview_id,))
+
+    async def get_interview_voice_info(self, interview_id):
+        """Gets basic interview info for voice session validation"""
+        record = await self._fetchone(
+            queries.VOICE_GET_INTERVIEW_INFO, (interview_id,))
+        return record
+
+    async def get_setting(self, key: str) -> str:
+        """Retrieve a setting value by key, through the settings cache shared with Database"""
+        ttl = config.settings_cache_ttl
+        generation = None
+        if ttl > 0:
+            Database._change_listener.start(Database())
+            found, value, generation = Database._settings_cache.lookup(key, ttl)
+            if found:
+                return value
+
+        try:
+            record = await self._fetchone(queries.SETTING_GET, (key,))
+            value = record[0] if record else None
+        except Exception as e:
+            logging.error(f"Error retrieving setting '{key}': {e}")
+            raise
+
+        if generation is not None:
+            Database._settings_cache.store(key, value, generation)
+        return value
+
+    async def set_setting(self, key: str, value: str) -> None:
+        """Set or update a setting value"""
+        try:
+            await self._execute(queries.SETTING_UPSERT, (key, value))
+        except Exception as e:
+            logging.error(f"Error setting '{key}' to '{value}': {e}")
+            raise
+        Database._settings_cache.invalidate(key)
+
+    async def get_talk_mode_enabled(self) -> bool:
+        """Get talk mode enabled status with default fallback to True"""
+        try:
+            value = await self.get_setting('talk_mode_enabled')
+            return queries.talk_mode_from_setting(value)
+        except Exception as e:
+            logging.error(f"Error retrieving talk mode setting: {e}")
+            # Return default True on any error for backward compatibility
+            return True
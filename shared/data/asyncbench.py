@@ -0,0 +1,149 @@
+"""
+Benchmarks AsyncDatabase against Database.
+
+usage (from web/ or events/, against a local database only):
+    python -m shared.data.asyncbench [interviews]     default: 20
+
+Seeds that many interviews with turns, then times side by side:
+
+  reads     fetching every interview, one after another with Database
+            and concurrently with AsyncDatabase
+  overlap   fetching one interview while waiting on OTHER_IO_MS of other
+            I/O (a stand-in for a Bedrock call), in turn with Database
+            and overlapped with AsyncDatabase
+
+Both clients use the same pool sizes (DB_POOL_MIN_SIZE, DB_POOL_MAX_SIZE),
+so concurrent reads are capped at DB_POOL_MAX_SIZE connections. Seeded
+rows are removed afterwards.
+"""
+import sys
+import time
+import uuid
+import asyncio
+import statistics
+from datetime import datetime, timezone
+
+from shared.config import config
+from shared.data.database import Database
+from shared.data.async_database import AsyncDatabase
+
+RUNS = 20
+
+SEED_PREFIX = "asyncbench"
+
+# simulated latency of the I/O a request overlaps with its reads
+OTHER_IO_MS = 50
+
+SEED_INTERVIEWS = """
+    INSERT INTO interview (id, created, topic_id, user_id, status)
+    SELECT gen_random_uuid(), %(created)s, %(topic_id)s, %(user_id)s, 'started'
+    FROM generate_series(1, %(interviews)s)
+    RETURNING id
+"""
+
+SEED_TURNS = """
+    INSERT INTO interview_turn (interview_id, seq, q, a)
+    SELECT i, n, 'question ' || n, repeat('answer ' || n || ' ', 20)
+    FROM unnest(%(ids)s::uuid[]) i, generate_series(0, 9) n
+"""
+
+
+def timed(fn) -> float:
+    """median milliseconds over RUNS calls"""
+    samples = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+async def timed_async(fn) -> float:
+    """median milliseconds over RUNS awaits of fn()"""
+    samples = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def seed(db: Database, topic_id, interviews) -> list:
+    """creates interviews with 10 turns each, returns their ids"""
+    values = {
+        "created": datetime.now(timezone.utc),
+        "topic_id": topic_id,
+        "user_id": f"{SEED_PREFIX}-user",
+        "interviews": interviews,
+    }
+    with db.connect() as conn:
+        ids = [str(id) for (id,) in conn.execute(SEED_INTERVIEWS, values).fetchall()]
+        conn.execute(SEED_TURNS, {"ids": ids})
+    return ids
+
+
+async def run(db: Database, adb: AsyncDatabase, interviews) -> list:
+    """returns (case, sync_ms, async_ms) per case"""
+
+    now = datetime.now(timezone.utc)
+    scope = db.create_scope(f"{SEED_PREFIX} scope", "", now)
+    topic = db.create_topic(f"{SEED_PREFIX} topic", "", [], scope["id"], now)
+
+    try:
+        ids = seed(db, topic["id"], interviews)
+
+        # open both pools and warm the prepared statements first
+        db.get_interview(ids[0])
+        await adb.get_interview(ids[0])
+
+        def reads():
+            for id in ids:
+                db.get_interview(id)
+
+        async def reads_async():
+            await asyncio.gather(*(adb.get_interview(id) for id in ids))
+
+        def overlap():
+            db.get_interview(ids[0])
+            time.sleep(OTHER_IO_MS / 1000)
+
+        async def overlap_async():
+            await asyncio.gather(adb.get_interview(ids[0]),
+                                 asyncio.sleep(OTHER_IO_MS / 1000))
+
+        return [
+            (f"reads ({interviews})", timed(reads), await timed_async(reads_async)),
+            (f"overlap ({OTHER_IO_MS} ms)", timed(overlap), await timed_async(overlap_async)),
+        ]
+    finally:
+        # deleting the interviews deletes their turns
+        with db.connect() as conn:
+            conn.execute("DELETE FROM interview WHERE topic_id = %s", (topic["id"],))
+        db.delete_topic(topic["id"])
+        db.delete_scope(scope["id"])
+
+
+async def bench(interviews) -> list:
+    db, adb = Database(), AsyncDatabase()
+    try:
+        return await run(db, adb, interviews)
+    finally:
+        await adb.close()
+        db.close()
+
+
+def main():
+    if config.postgres_secret_arn:
+        sys.exit("asyncbench only runs against a local database")
+
+    interviews = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    results = asyncio.run(bench(interviews))
+
+    print(f"{'case':<18}  {'sync ms':>8}  {'async ms':>8}  {'speedup':>7}")
+    for case, sync_ms, async_ms in results:
+        print(f"{case:<18}  {sync_ms:>8.2f}  {async_ms:>8.2f}  "
+              f"{sync_ms / async_ms:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Benchmarks voice conversation history for long voice transcripts.
+
+usage (from web/ or events/, against a local database only):
+    python -m shared.data.benchmark [turns ...]     default: 100 1000 5000
+
+For each size, an interview with that many voice turns is seeded and
+get_voice_conversation_history() is timed against fetching the whole
+transcript. Truncation happens in SQL, so the history is bounded by
+max_characters however long the transcript grows. Seeded rows are
+removed afterwards.
+"""
+import sys
+import time
+import uuid
+import statistics
+from datetime import datetime, timezone
+
+from shared.config import config
+from shared.data.database import Database
+
+RUNS = 20
+
+SEED_PREFIX = "benchmark"
+
+SEED_TURNS = """
+    INSERT INTO interview_turn (interview_id, seq, q, a)
+    SELECT %(id)s, n,
+           repeat('question ' || n || ' ', 1 + n %% 40),
+           repeat('answer ' || n || ' ', 1 + n %% 300)
+    FROM generate_series(0, %(turns)s - 1) n
+"""
+
+FULL_TRANSCRIPT = """
+    SELECT q, a
+    FROM interview_turn
+    WHERE interview_id = %s
+    ORDER BY seq
+"""
+
+
+def timed(fn) -> float:
+    """median milliseconds over RUNS calls"""
+    samples = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def seed(db: Database, topic_id, turns) -> str:
+    """creates an interview with a voice transcript of turns Q&As"""
+    id = str(uuid.uuid4())
+    with db.connect() as conn:
+        conn.execute(
+            """INSERT INTO interview (id, created, topic_id, user_id, status, voice_mode)
+               VALUES (%s, %s, %s, %s, 'started', true)""",
+            (id, datetime.now(timezone.utc), topic_id, f"{SEED_PREFIX}-user"))
+        conn.execute(SEED_TURNS, {"id": id, "turns": turns})
+    return id
+
+
+def run(db: Database, sizes, max_characters=40960) -> list:
+    """returns (turns, history_ms, history_rows, history_chars, full_ms, full_chars) per size"""
+
+    now = datetime.now(timezone.utc)
+    scope = db.create_scope(f"{SEED_PREFIX} scope", "", now)
+    topic = db.create_topic(f"{SEED_PREFIX} topic", "", [], scope["id"], now)
+
+    results = []
+    try:
+        for turns in sizes:
+            id = seed(db, topic["id"], turns)
+
+            history = db.get_voice_conversation_history(id, max_characters)
+            chars = sum(len(h["q"]) + len(h["a"]) for h in history)
+            if chars > max_characters:
+                raise AssertionError(
+                    f"{turns} turns: history has {chars} characters, limit is {max_characters}")
+
+            def full():
+                with db.connect() as conn:
+                    return conn.execute(FULL_TRANSCRIPT, (id,)).fetchall()
+
+            full_chars = sum(len(q) + len(a) for q, a in full())
+            results.append((
+                turns,
+                timed(lambda: db.get_voice_conversation_history(id, max_characters)),
+                len(history),
+                chars,
+                timed(full),
+                full_chars,
+            ))
+    finally:
+        with db.connect() as conn:
+            conn.execute("""DELETE FROM interview_turn WHERE interview_id IN
+                            (SELECT id FROM interview WHERE topic_id = %s)""",
+                         (topic["id"],))
+            conn.execute("DELETE FROM interview WHERE topic_id = %s", (topic["id"],))
+        db.delete_topic(topic["id"])
+        db.delete_scope(scope["id"])
+
+    return results
+
+
+def main():
+    if config.postgres_secret_arn:
+        sys.exit("benchmark only runs against a local database")
+
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100, 1000, 5000]
+
+    db = Database()
+    try:
+        results = run(db, sizes)
+    finally:
+        db.close()
+
+    print(f"{'turns':>6}  {'history ms':>10}  {'rows':>5}  {'chars':>6}  "
+          f"{'full ms':>8}  {'full chars':>10}")
+    for turns, ms, rows, chars, full_ms, full_chars in results:
+        print(f"{turns:>6}  {ms:>10.2f}  {rows:>5}  {chars:>6}  "
+              f"{full_ms:>8.2f}  {full_chars:>10}")
+
+
+if __name__ == "__main__":
+    main()
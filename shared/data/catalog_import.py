@@ -0,0 +1,235 @@
+"""
+Imports scopes, topics and their areas in bulk from YAML, JSON or CSV.
+
+usage (from web/):
+    python -m shared.data.catalog_import FILE     (.yaml, .yml, .json or .csv)
+
+YAML and JSON files hold a list of scopes, or a mapping with one:
+
+    scopes:
+      - name: Engineering
+        description: How we build and run our services
+        topics:
+          - name: Deployments
+            description: Shipping changes to production
+            areas:
+              - Release process
+              - Rollbacks
+
+CSV files have one topic per row, with required scope, topic and areas
+columns (areas separated by new lines or "|", every topic needs at least
+one) and optional scope_description and description columns. A row without
+a topic only creates its scope.
+
+Scopes are matched by name and topics by name within their scope. Matches
+are updated and the rest are created, and a description that isn't given
+is left as it is. The whole file is validated before anything is written,
+then imported in one transaction (Database.import_catalog). Admins can
+upload the same files at /admin/import.
+"""
+import io
+import csv
+import sys
+import json
+
+import yaml
+
+from shared.data.database import Database
+
+FORMATS = {
+    ".yaml": "yaml",
+    ".yml": "yaml",
+    ".json": "json",
+    ".csv": "csv",
+}
+
+# largest import accepted at once
+MAX_TOPICS = 5000
+
+
+class CatalogImportError(ValueError):
+    """An import that doesn't validate, with every problem found in it"""
+
+    def __init__(self, errors):
+        super().__init__("; ".join(errors))
+        self.errors = errors
+
+
+def format_of(filename) -> str:
+    """the import format for a file name, by its extension"""
+    for extension, format in FORMATS.items():
+        if filename.lower().endswith(extension):
+            return format
+    raise CatalogImportError(
+        [f"{filename}: expected a {', '.join(FORMATS)} file"])
+
+
+def read_csv(text) -> list:
+    """scopes from CSV rows, in the order they first appear"""
+    reader = csv.DictReader(io.StringIO(text))
+    columns = {name.strip().lower() for name in reader.fieldnames or [] if name}
+    if not {"scope", "topic", "areas"} <= columns:
+        raise CatalogImportError(
+            ["the CSV needs a header row with scope, topic and areas columns"])
+
+    scopes = {}
+    for record in reader:
+        record = {key.strip().lower(): (value or "").strip()
+                  for key, value in record.items() if key}
+        if not any(record.values()):
+            continue
+        scope = scopes.setdefault(record["scope"], {
+            "name": record["scope"], "description": None, "topics": []})
+        if record.get("scope_description") and not scope["description"]:
+            scope["description"] = record["scope_description"]
+        if record["topic"]:
+            scope["topics"].append({
+                "name": record["topic"],
+                "description": record.get("description") or None,
+                "areas": record["areas"].replace("|", "\n"),
+            })
+    return list(scopes.values())
+
+
+def parse(text, format):
+    """the import payload in text"""
+    try:
+        if format == "yaml":
+            return yaml.safe_load(text)
+        if format == "json":
+            return json.loads(text)
+        return read_csv(text)
+    except (yaml.YAMLError, json.JSONDecodeError, csv.Error) as e:
+        raise CatalogImportError([f"not valid {format}: {e}"])
+
+
+def text_field(errors, where, item, key, required=False):
+    """item's stripped string field, None when it's missing or blank"""
+    value = item.get(key)
+    if value is not None and not isinstance(value, str):
+        errors.append(f"{where}: {key} must be text")
+        return None
+    value = value.strip() if value else None
+    if required and not value:
+        errors.append(f"{where}: {key} is required")
+    return value
+
+
+def areas_field(errors, where, topic) -> list:
+    """a topic's areas, given as a list or as text with one per line"""
+    areas = topic.get("areas")
+    if isinstance(areas, str):
+        areas = areas.split("\n")
+    if not isinstance(areas, list) or not all(isinstance(a, str) for a in areas):
+        errors.append(f"{where}: areas must be a list of text")
+        return []
+    areas = [area.strip() for area in areas if area.strip()]
+    if not areas:
+        errors.append(f"{where}: at least one area is required")
+    return areas
+
+
+def validate(payload) -> list:
+    """
+    checks a parsed import and returns its scopes as
+    [{"name", "description", "topics": [{"name", "description", "areas"}]}],
+    raises CatalogImportError listing every problem
+    """
+    if isinstance(payload, dict):
+        payload = payload.get("scopes")
+    if not isinstance(payload, list) or not payload:
+        raise CatalogImportError(["expected a list of scopes"])
+
+    errors = []
+    scopes = []
+    scope_names = set()
+    topic_count = 0
+    for i, item in enumerate(payload):
+        where = f"scopes[{i}]"
+        if not isinstance(item, dict):
+            errors.append(f"{where}: expected a scope")
+            continue
+        name = text_field(errors, where, item, "name", required=True)
+        if name and name in scope_names:
+            errors.append(f"{where}: scope {name} is listed more than once")
+        scope_names.add(name)
+
+        topics_payload = item.get("topics") or []
+        if not isinstance(topics_payload, list):
+            errors.append(f"{where}: topics must be a list")
+            topics_payload = []
+
+        topics = []
+        topic_names = set()
+        for j, topic in enumerate(topics_payload):
+            topic_where = f"{where}.topics[{j}]"
+            if not isinstance(topic, dict):
+                errors.append(f"{topic_where}: expected a topic")
+                continue
+            topic_name = text_field(
+                errors, topic_where, topic, "name", required=True)
+            if topic_name and topic_name in topic_names:
+                errors.append(
+                    f"{topic_where}: topic {topic_name} is listed more than once in {name}")
+            topic_names.add(topic_name)
+            topics.append({
+                "name": topic_name,
+                "description": text_field(errors, topic_where, topic, "description"),
+                "areas": areas_field(errors, topic_where, topic),
+            })
+
+        topic_count += len(topics)
+        scopes.append({
+            "name": name,
+            "description": text_field(errors, where, item, "description"),
+            "topics": topics,
+        })
+
+    if topic_count > MAX_TOPICS:
+        errors.append(f"at most {MAX_TOPICS} topics can be imported at once")
+    if errors:
+        raise CatalogImportError(errors)
+    return scopes
+
+
+def load(text, format) -> list:
+    """the validated scopes of an import file's text"""
+    return validate(parse(text, format))
+
+
+def summary(result) -> dict:
+    """created, updated and unchanged counts of an import's scopes and topics"""
+    counts = {}
+    for kind in ("scopes", "topics"):
+        counts[kind] = {"created": 0, "updated": 0, "unchanged": 0}
+        for row in result[kind]:
+            counts[kind][row["result"]] += 1
+    return counts
+
+
+def main():
+    if len(sys.argv) != 2:
+        sys.exit("usage: python -m shared.data.catalog_import FILE")
+    path = sys.argv[1]
+
+    try:
+        with open(path, encoding="utf-8-sig") as f:
+            scopes = load(f.read(), format_of(path))
+    except CatalogImportError as e:
+        for error in e.errors:
+            print(error, file=sys.stderr)
+        sys.exit(1)
+
+    db = Database()
+    try:
+        counts = summary(db.import_catalog(scopes))
+    finally:
+        db.close()
+
+    for kind, results in counts.items():
+        print(f"{kind}: {results['created']} created, {results['updated']} updated, "
+              f"{results['unchanged']} unchanged")
+
+
+if __name__ == "__main__":
+    main()
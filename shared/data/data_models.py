@@ -2,7 +2,6 @@ import uuid
 from datetime import datetime, timezone
 from enum import Enum
 import json
-import logging
 
 
 class InterviewStatus(Enum):
@@ -20,6 +19,8 @@ class InterviewStatus(Enum):
 class Question:
     """Question domain object"""
 
+    __slots__ = ("question", "answer")
+
     def __init__(self, question, answer=None):
         self.question = question
         self.answer = answer
@@ -28,6 +29,27 @@ class Question:
 class InterviewRecord:
     """Database record representation"""
 
+    __slots__ = (
+        "id",
+        "created",
+        "topic_id",
+        "user_id",
+        "status",
+        "data",
+        "completed",
+        "summary",
+        "topic_name",
+        "topic_description",
+        "topic_areas",
+        "scope_name",
+        "approved_by_user_id",
+        "approved_on",
+        "voice_mode",
+        "voice_session_metadata",
+        "question_count",
+        "initial_question",
+    )
+
     def __init__(
         self,
         id,
@@ -46,6 +68,8 @@ class InterviewRecord:
         approved_on=None,
         voice_mode=None,
         voice_session_metadata=None,
+        question_count=None,
+        initial_question=None,
     ):
         """
         Initialize an InterviewRecord object that maps to the interview database table.
@@ -62,9 +86,13 @@ class InterviewRecord:
             voice_mode BOOLEAN DEFAULT FALSE,
             voice_session_metadata JSONB DEFAULT '{}'::jsonb
         );
-        """
-        logging.info(f"creating interview record: {id}")
 
+        Built directly by the interview_row row factory from columns
+        selected with INTERVIEW_COLUMNS (or a subset of them).
+        data is assembled from the interview_turn rows, ordered by seq.
+        Summary rows (INTERVIEW_SUMMARY_COLUMNS) carry question_count and
+        initial_question instead of data.
+        """
         self.id = id
         self.created = created
         self.topic_id = topic_id
@@ -81,12 +109,11 @@ class InterviewRecord:
         self.approved_on = approved_on
         self.voice_mode = voice_mode
         self.voice_session_metadata = voice_session_metadata
+        self.question_count = question_count
+        self.initial_question = initial_question
 
     def to_interview(self) -> 'Interview':
         """Convert database record to domain object"""
-        logging.info(
-            f"converting interview record to domain object: {self.id}")
-
         result = Interview(
             id=self.id,
             created=self.created,
@@ -102,6 +129,8 @@ class InterviewRecord:
             approved_on=self.approved_on,
             voice_mode=self.voice_mode,
             voice_session_metadata=self.voice_session_metadata,
+            question_count=self.question_count,
+            initial_question=self.initial_question,
         )
 
         # convert status string to enum
@@ -109,14 +138,10 @@ class InterviewRecord:
 
         # psycopg should return a list of dicts
         # convert list of dicts into list of Question objects
-        result.questions = []
-        if self.data:
-            for q in self.data:
-                question = Question(
-                    question=q["q"],
-                    answer=q.get("a", ""),
-                )
-                result.questions.append(question)
+        result.questions = [
+            Question(question=q["q"], answer=q.get("a", ""))
+            for q in self.data or []
+        ]
 
         # handle voice_session_metadata deserialization
         if isinstance(self.voice_session_metadata, str):
@@ -154,9 +179,9 @@ class Interview():
         approved_on=None,
         voice_mode=None,
         voice_session_metadata=None,
+        question_count=None,
+        initial_question=None,
     ):
-        logging.info(f"creating interview domain object: {id}")
-
         self.id = id
         self.created = created
         self.user_id = user_id
@@ -175,6 +200,10 @@ class Interview():
         self.voice_mode = voice_mode if voice_mode is not None else False
         self.voice_session_metadata = voice_session_metadata if voice_session_metadata is not None else {}
 
+        # set on list summaries, which don't load questions
+        self.question_count = question_count
+        self.initial_question = initial_question
+
     @staticmethod
     def new(topic_id, user_id):
         """Create and return a new Interview object with default values"""
@@ -193,7 +222,6 @@ class Interview():
     def to_record(self) -> InterviewRecord:
         """Convert an Interview to an InterviewRecord"""
 
-        logging.info(f"converting interview to record: {self.id}")
         result = InterviewRecord(
             id=self.id,
             created=self.created,
@@ -1,31 +1,58 @@
 import os
+import copy
 import uuid
 import logging
 import json
 import time
+import random
 import threading
+import contextvars
 import psycopg
 import boto3
-from datetime import datetime, timezone
+from contextlib import contextmanager, ExitStack
+from datetime import datetime, timedelta, timezone
+from psycopg_pool import ConnectionPool
 from opentelemetry.instrumentation.psycopg import PsycopgInstrumentor
 
 from shared.config import config
-from shared.data.data_models import InterviewRecord, Interview, InterviewStatus
+from shared.data import queries, registry, archive_store
+from shared.data.data_models import Interview, InterviewStatus
 
 PsycopgInstrumentor().instrument()
 secrets_manager = boto3.client("secretsmanager")
 
 
 class CredentialCache:
-    """Thread-safe cache for database credentials"""
-
-    def __init__(self, ttl_seconds=3600):  # Default TTL: 1 hour
+    """
+    Thread-safe cache for database credentials.
+    Credentials are due for a background refresh at refresh_ratio of the
+    TTL (less some jitter so processes don't refresh in lockstep) and
+    keep being served after that until a refresh succeeds.
+    """
+
+    def __init__(self, ttl_seconds=3600, refresh_ratio=0.75, jitter_ratio=0.1):  # Default TTL: 1 hour
         self.username = None
         self.password = None
         self.last_refresh = 0
+        self.refresh_at = 0
         self.ttl_seconds = ttl_seconds
+        self.refresh_ratio = refresh_ratio
+        self.jitter_ratio = jitter_ratio
         self.lock = threading.RLock()  # Reentrant lock for thread safety
 
+        # refresh metrics
+        self.refreshes = 0
+        self.failures = 0
+        self.auth_failure_refreshes = 0
+        self.refresh_ms_total = 0.0
+        self.refresh_ms_max = 0.0
+        self.last_error = None
+
+    def has_credentials(self):
+        """Check if any credentials (even expired ones) are cached"""
+        with self.lock:
+            return bool(self.username and self.password)
+
     def is_valid(self):
         """Check if cached credentials are still valid"""
         with self.lock:
@@ -34,18 +61,613 @@ class CredentialCache:
             current_time = time.time()
             return (current_time - self.last_refresh) < self.ttl_seconds
 
+    def needs_refresh(self):
+        """Check if cached credentials are due for a refresh"""
+        with self.lock:
+            return not self.has_credentials() or time.time() >= self.refresh_at
+
+    def seconds_until_refresh(self):
+        """Seconds until cached credentials are due for a refresh"""
+        with self.lock:
+            return max(self.refresh_at - time.time(), 0)
+
     def update(self, username, password):
         """Update cached credentials in a thread-safe manner"""
         with self.lock:
             self.username = username
             self.password = password
             self.last_refresh = time.time()
+            jitter = random.uniform(0, self.jitter_ratio) * self.ttl_seconds
+            self.refresh_at = self.last_refresh + \
+                self.ttl_seconds * self.refresh_ratio - jitter
 
     def get_credentials(self):
         """Get current credentials in a thread-safe manner"""
         with self.lock:
             return (self.username, self.password)
 
+    def record_refresh(self, elapsed_ms, auth_failure=False):
+        """Record a successful secrets manager fetch"""
+        with self.lock:
+            self.refreshes += 1
+            self.auth_failure_refreshes += auth_failure
+            self.refresh_ms_total += elapsed_ms
+            self.refresh_ms_max = max(self.refresh_ms_max, elapsed_ms)
+
+    def record_failure(self, error):
+        """Record a failed secrets manager fetch"""
+        with self.lock:
+            self.failures += 1
+            self.last_error = str(error)
+
+    def snapshot(self):
+        """Return the refresh counters as a dict"""
+        with self.lock:
+            now = time.time()
+            avg = self.refresh_ms_total / self.refreshes if self.refreshes else 0.0
+            cached = bool(self.username and self.password)
+            return {
+                "cached": cached,
+                "age_s": round(now - self.last_refresh, 1) if cached else None,
+                "expired": cached and now - self.last_refresh >= self.ttl_seconds,
+                "refresh_in_s": round(max(self.refresh_at - now, 0), 1) if cached else None,
+                "refreshes": self.refreshes,
+                "failures": self.failures,
+                "auth_failure_refreshes": self.auth_failure_refreshes,
+                "refresh_ms_avg": round(avg, 3),
+                "refresh_ms_max": round(self.refresh_ms_max, 3),
+                "last_error": self.last_error,
+            }
+
+
+class PoolMetrics:
+    """Thread-safe checkout latency counters for the connection pool"""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.checkout_ms_total = 0.0
+        self.checkout_ms_max = 0.0
+        self.lock = threading.Lock()
+
+    def record_checkout(self, elapsed_ms):
+        """Record how long a caller waited to get a connection"""
+        with self.lock:
+            self.checkouts += 1
+            self.checkout_ms_total += elapsed_ms
+            self.checkout_ms_max = max(self.checkout_ms_max, elapsed_ms)
+
+    def snapshot(self):
+        """Return the counters as a dict"""
+        with self.lock:
+            avg = self.checkout_ms_total / self.checkouts if self.checkouts else 0.0
+            return {
+                "checkouts": self.checkouts,
+                "checkout_ms_avg": round(avg, 3),
+                "checkout_ms_max": round(self.checkout_ms_max, 3),
+            }
+
+
+def fetch_credentials(secret_arn, auth_failure=False):
+    """
+    Fetch credentials from secrets manager into the shared cache.
+    Callers hold Database._refresh_lock so only one fetch runs at a time.
+    """
+    cache = Database._credential_cache
+    logging.debug("fetching database credentials from secrets manager")
+    start = time.monotonic()
+    try:
+        secret = secrets_manager.get_secret_value(SecretId=secret_arn)
+        creds = json.loads(secret["SecretString"])
+    except Exception as e:
+        logging.error(f"Error fetching credentials: {e}")
+        cache.record_failure(e)
+        raise
+    logging.debug("secret successfully fetched")
+    cache.update(creds["username"], creds["password"])
+    cache.record_refresh((time.monotonic() - start) * 1000, auth_failure)
+    return creds["username"], creds["password"]
+
+
+class CredentialRefresher:
+    """
+    Renews the cached credentials in a background thread before they
+    are due, so requests never wait on secrets manager once the first
+    credentials are loaded. Failed refreshes are retried with backoff
+    while the cached credentials keep being served.
+    """
+
+    max_backoff_seconds = 60
+
+    def __init__(self):
+        self.secret_arn = None
+        self._wake = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self, secret_arn):
+        """Starts the refresh thread (again after a fork, where threads don't survive)"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self.secret_arn = secret_arn
+            self._thread = threading.Thread(
+                target=self._run, name="db-credential-refresh", daemon=True)
+            self._thread.start()
+
+    def trigger(self):
+        """Asks the refresh thread to check the cache now"""
+        self._wake.set()
+
+    def _run(self):
+        cache = Database._credential_cache
+        failures = 0
+        while True:
+            if failures:
+                delay = min(2 ** failures, self.max_backoff_seconds)
+                delay += random.uniform(0, 1)
+            else:
+                delay = cache.seconds_until_refresh()
+            self._wake.wait(delay)
+            self._wake.clear()
+
+            if not cache.needs_refresh():
+                continue
+            try:
+                with Database._refresh_lock:
+                    if cache.needs_refresh():
+                        fetch_credentials(self.secret_arn)
+                failures = 0
+            except Exception as e:
+                failures += 1
+                logging.warning(
+                    f"background credential refresh failed ({failures}), serving cached credentials: {e}")
+
+
+def load_credentials(secret_arn, user, password):
+    """
+    Resolve database credentials.
+    In AWS these come from secrets manager via the shared credential cache,
+    locally the configured user/password are returned as-is.
+    Once credentials are cached they are returned immediately, even when
+    due for a refresh (the background refresher renews them), so only the
+    first call in a process waits on secrets manager.
+    """
+
+    if secret_arn is None:
+        return user, password
+
+    cache = Database._credential_cache
+    Database._credential_refresher.start(secret_arn)
+
+    if cache.has_credentials():
+        if cache.needs_refresh():
+            Database._credential_refresher.trigger()
+            if not cache.is_valid():
+                logging.warning(
+                    "serving expired database credentials while refreshing")
+        logging.debug("using cached database credentials")
+        return cache.get_credentials()
+
+    # nothing cached yet, the first caller fetches and the rest wait for it
+    with Database._refresh_lock:
+        if not cache.has_credentials():
+            return fetch_credentials(secret_arn)
+    return cache.get_credentials()
+
+
+def refresh_after_auth_failure(secret_arn, failed_password):
+    """
+    Refresh credentials after a connection was refused with failed_password.
+    Concurrent failures coalesce into a single fetch: callers that find the
+    cache already holds a different password reuse it.
+    """
+    cache = Database._credential_cache
+    with Database._refresh_lock:
+        user, password = cache.get_credentials()
+        if password is not None and password != failed_password:
+            return user, password
+        logging.warning(
+            "database authentication failed, refreshing credentials")
+        return fetch_credentials(secret_arn, auth_failure=True)
+
+
+def is_auth_failure(error) -> bool:
+    """Check if a connection error means the credentials were rejected"""
+    if getattr(error, "sqlstate", None) in ("28P01", "28000"):
+        return True
+    return "authentication failed" in str(error)
+
+
+class RefreshingConnection(psycopg.Connection):
+    """
+    Pool connection that reconnects once with refreshed credentials
+    when the server rejects the cached ones (e.g. after a secret rotation).
+    """
+
+    @classmethod
+    def connect(cls, conninfo="", **kwargs):
+        try:
+            return super().connect(conninfo, **kwargs)
+        except psycopg.OperationalError as e:
+            if config.postgres_secret_arn is None or not is_auth_failure(e):
+                raise
+            user, password = refresh_after_auth_failure(
+                config.postgres_secret_arn, kwargs.get("password"))
+            Database._rotate_pool_credentials(user, password)
+            return super().connect(
+                conninfo, **{**kwargs, "user": user, "password": password})
+
+
+class NotifiedCache:
+    """
+    In-process read-through cache shared by all Database instances.
+    Entries are dropped as soon as ChangeListener hears that the rows
+    behind them changed, and expire after a ttl in case a notification
+    was missed (e.g. a Lambda frozen between invocations).
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self._entries = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def lookup(self, key, ttl):
+        """Returns (found, value, generation), pass generation to store() on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[1] < ttl:
+                self.hits += 1
+                return True, entry[0], self._generation
+            self.misses += 1
+            return False, None, self._generation
+
+    def store(self, key, value, generation):
+        """Caches a value read at generation, unless a change was heard since"""
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = (value, time.monotonic())
+
+    def invalidate(self, key=None):
+        """Drops one entry, or all of them when key is None"""
+        with self._lock:
+            self._generation += 1
+            self.invalidations += 1
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "listening": Database._change_listener.listening,
+            }
+
+
+class ChangeListener:
+    """
+    LISTENs for change notifications on a dedicated writer connection
+    (notifications are not sent to read replicas) and drops what changed
+    from the NotifiedCaches. Reconnects with backoff, clearing the caches
+    since changes made while disconnected were missed.
+    """
+
+    max_backoff_seconds = 60
+
+    def __init__(self):
+        self.db = None
+        self.listening = False
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self, db):
+        """Starts the listener thread (again after a fork, where threads don't survive)"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self.db = db
+            self._thread = threading.Thread(
+                target=self._run, name="db-change-listener", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        settings, catalog = Database._settings_cache, Database._catalog_cache
+        handlers = {
+            # the payload is the changed setting's key
+            queries.SETTINGS_CHANNEL: lambda key: settings.invalidate(key or None),
+            # the payload is the changed table, lists span both so drop everything
+            queries.CATALOG_CHANNEL: lambda table: catalog.invalidate(),
+        }
+        failures = 0
+        while True:
+            try:
+                with self.db._listen_connection() as conn:
+                    for channel in handlers:
+                        conn.execute(f"LISTEN {channel}")
+                    settings.invalidate()
+                    catalog.invalidate()
+                    self.listening = True
+                    failures = 0
+                    for notify in conn.notifies():
+                        logging.debug(
+                            f"change notification: {notify.channel} {notify.payload}")
+                        handlers[notify.channel](notify.payload)
+            except Exception as e:
+                failures += 1
+                logging.warning(
+                    f"change listener disconnected ({failures}), falling back to cache ttls: {e}")
+            finally:
+                self.listening = False
+
+            delay = min(2 ** failures, self.max_backoff_seconds)
+            time.sleep(delay + random.uniform(0, 1))
+
+
+_current_session = contextvars.ContextVar("db_session", default=None)
+
+
+def read_only_session(view):
+    """
+    Marks a view as read-only so its request session runs in
+    autocommit mode instead of holding a transaction open.
+    """
+    view.read_only_session = True
+    return view
+
+
+class Session:
+    """
+    A request-scoped unit of work sharing one pooled connection.
+    The connection is checked out lazily on first use.
+    Read-only sessions run in autocommit mode and have nothing to commit.
+
+    With a read replica configured, reads run on a second (autocommit)
+    replica connection until the session writes or is pinned, after
+    which they run on the writer so the session reads its own writes.
+    """
+
+    def __init__(self, db, read_only=False, pinned=False):
+        self.db = db
+        self.read_only = read_only
+        self.pinned = pinned
+        self.wrote = False
+        self.token = None
+        self._conn = None
+        self._stack = None
+        self._reader = None
+        self._reader_stack = None
+        self._after_commit = []
+
+    def after_commit(self, fn):
+        """
+        Calls fn once the work done so far is committed, e.g. to invalidate
+        a cache only when other sessions can read the change. Read-only
+        sessions run in autocommit mode, so fn is called right away.
+        """
+        if self.read_only:
+            fn()
+        else:
+            self._after_commit.append(fn)
+
+    def _committed(self, ok=True):
+        """Calls the after_commit() callbacks, or drops them on rollback"""
+        callbacks, self._after_commit = self._after_commit, []
+        if ok:
+            for fn in callbacks:
+                fn()
+
+    def connection(self, read=False):
+        """Returns the session's connection, checking one out if needed"""
+        if read and not self.pinned and self.db.reader_host:
+            return self._reader_connection()
+        if not read:
+            self.wrote = True
+            self.pinned = True
+
+        if self._conn is None:
+            self._stack = ExitStack()
+            self._conn = self._stack.enter_context(self.db._checkout())
+            if self.read_only:
+                self._conn.autocommit = True
+        return self._conn
+
+    def _reader_connection(self):
+        """Returns the session's replica connection, checking one out if needed"""
+        if self._reader is None:
+            self._reader_stack = ExitStack()
+            self._reader = self._reader_stack.enter_context(
+                self.db._checkout(read=True))
+            self._reader.autocommit = True
+        return self._reader
+
+    def commit(self):
+        """Commits the work done so far"""
+        if self._conn is not None and not self.read_only:
+            self._conn.commit()
+        self._committed()
+
+    def release(self):
+        """
+        Commits the work done so far and returns the connections to their
+        pools, the next call checks them out again. The session stays
+        pinned to the writer if it wrote.
+        """
+        self.close()
+
+    def close(self, error=None):
+        """Commits (or rolls back on error) and returns the connections to their pools"""
+        if self._reader is not None:
+            reader, stack = self._reader, self._reader_stack
+            self._reader, self._reader_stack = None, None
+            try:
+                if not reader.closed:
+                    reader.autocommit = False
+            finally:
+                stack.close()
+
+        if self._conn is None:
+            self._committed(error is None)
+            return
+
+        conn, stack = self._conn, self._stack
+        self._conn, self._stack = None, None
+        try:
+            if self.read_only and not conn.closed:
+                conn.autocommit = False
+        finally:
+            if error is None:
+                stack.close()
+            else:
+                stack.__exit__(type(error), error, error.__traceback__)
+        self._committed(error is None)
+
+
+class Deferred:
+    """Result of a pipelined statement, available once the pipeline is flushed"""
+
+    def __init__(self, cursor, fetch=None, mapper=None):
+        self._cursor = cursor
+        self._fetch = fetch
+        self._mapper = mapper
+        self._resolved = False
+        self._result = None
+
+    def resolve(self):
+        """Reads the statement's result from its cursor"""
+        if self._fetch == "one":
+            record = self._cursor.fetchone()
+            if record is not None and self._mapper:
+                record = self._mapper(record)
+            self._result = record
+        elif self._fetch == "all":
+            records = self._cursor.fetchall()
+            if self._mapper:
+                records = [self._mapper(record) for record in records]
+            self._result = records
+        else:
+            self._result = self._cursor.rowcount
+        self._resolved = True
+
+    @property
+    def result(self):
+        if not self._resolved:
+            raise RuntimeError("pipeline result read before the pipeline was flushed")
+        return self._result
+
+
+class Pipeline:
+    """
+    Queues statements on one connection in psycopg pipeline mode so they
+    reach the server in a single network flight. Each call returns a
+    Deferred whose result is available after the pipeline block exits.
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+        self._deferred = []
+        # called by Database.pipeline() once the statements are committed
+        self.after_commit = []
+
+    def _invalidate_catalog(self):
+        """drops the catalog cache once the pipeline's writes are committed"""
+        if Database._catalog_cache.invalidate not in self.after_commit:
+            self.after_commit.append(Database._catalog_cache.invalidate)
+
+    def _queue(self, query, values, fetch=None, mapper=None) -> Deferred:
+        logging.info(f"query: {query}")
+        logging.info(f"values: {values}")
+        if isinstance(query, registry.Query):
+            cursor = query.cursor(self.conn)
+        else:
+            cursor = self.conn.cursor()
+        cursor.execute(query, values, prepare=True)
+        deferred = Deferred(cursor, fetch, mapper)
+        self._deferred.append(deferred)
+        return deferred
+
+    def resolve(self):
+        """Resolves all queued results (called after the pipeline syncs)"""
+        for deferred in self._deferred:
+            deferred.resolve()
+
+    def execute(self, query, values=None) -> Deferred:
+        """queue a statement, result is the affected row count"""
+        return self._queue(query, values)
+
+    def fetchone(self, query, values=None, mapper=None) -> Deferred:
+        """queue a query, result is its first row (mapped if a mapper is given)"""
+        return self._queue(query, values, "one", mapper)
+
+    def fetchall(self, query, values=None, mapper=None) -> Deferred:
+        """queue a query, result is all rows (mapped if a mapper is given)"""
+        return self._queue(query, values, "all", mapper)
+
+    def create_scope(self, name, description, created) -> dict:
+        """queue a new scope"""
+        scope, values = queries.new_scope(name, description, created)
+        self.execute(queries.SCOPE_INSERT, values)
+        self._invalidate_catalog()
+        return scope
+
+    def update_scope(self, id, name, description) -> Deferred:
+        """queue a scope update"""
+        self._invalidate_catalog()
+        return self.execute(queries.SCOPE_UPDATE, (name, description, id))
+
+    def delete_scope(self, scope_id) -> Deferred:
+        """queue a scope delete"""
+        self._invalidate_catalog()
+        return self.execute(queries.SCOPE_DELETE, (scope_id,))
+
+    def get_scope(self, scope_id) -> Deferred:
+        """queue a scope lookup"""
+        return self.fetchone(queries.SCOPE_GET_BY_ID, (scope_id,))
+
+    def list_scopes(self, top=50) -> Deferred:
+        """queue a scope listing"""
+        return self.fetchall(queries.SCOPE_LIST, (top,))
+
+    def create_topic(self, name, description, areas, scope_id, created) -> dict:
+        """queue a new topic"""
+        topic, values = queries.new_topic(
+            name, description, areas, scope_id, created)
+        self.execute(queries.TOPIC_INSERT, values)
+        self._invalidate_catalog()
+        return topic
+
+    def update_topic(self, id, name, description, areas) -> Deferred:
+        """queue a topic update"""
+        self._invalidate_catalog()
+        return self.execute(queries.TOPIC_UPDATE,
+                            (name, description, json.dumps(areas), id))
+
+    def delete_topic(self, topic_id) -> Deferred:
+        """queue a topic delete"""
+        self._invalidate_catalog()
+        return self.execute(queries.TOPIC_DELETE, (topic_id,))
+
+    def list_topics_by_scope(self, scope_id) -> Deferred:
+        """queue a topic listing for a scope"""
+        return self.fetchall(queries.TOPIC_LIST_BY_SCOPE, (scope_id,))
+
+    def assign_interview(self, topic_id, user_id) -> Deferred:
+        """
+        queue a new interview for a user unless one is already in-flight
+        for the topic; result is 1 if an interview was created, else 0
+        """
+        self.execute(queries.INTERVIEW_ASSIGN_LOCK,
+                     queries.interview_assign_lock_values([(topic_id, user_id)]))
+        return self.execute(queries.INTERVIEW_INSERT_IF_NOT_INFLIGHT,
+                            queries.interview_assign_values(topic_id, user_id))
+
 
 class Database():
     """Encapsulate database access"""
@@ -54,59 +676,346 @@ class Database():
     _credential_cache = CredentialCache()
     # Lock for synchronizing credential refresh operations
     _refresh_lock = threading.Lock()
+    # Renews cached credentials before they expire
+    _credential_refresher = CredentialRefresher()
+    # Class-level connection pool shared by all instances and threads
+    _pool = None
+    _pool_lock = threading.Lock()
+    _pool_metrics = PoolMetrics()
+    # Optional read replica pool, see config.postgres_reader_host
+    _reader_pool = None
+    _reader_pool_metrics = PoolMetrics()
+    # Read-through caches kept fresh by LISTEN/NOTIFY, see _read_through()
+    _settings_cache = NotifiedCache("settings")
+    _catalog_cache = NotifiedCache("catalog")
+    _change_listener = ChangeListener()
+    # months whose partitions this process has made sure of, see _ensure_partitions()
+    _partition_months = set()
 
     def __init__(self):
         self.host = config.postgres_host
+        self.reader_host = config.postgres_reader_host
         self.dbname = config.postgres_dbname
         self.user = config.postgres_user
         self.password = config.postgres_password
         self.secret_arn = config.postgres_secret_arn
 
-    def connect(self):
-        # If running in AWS, use cached credentials or fetch from secrets manager
-        if self.secret_arn is not None:
-            # Use cached credentials if they're still valid
-            if Database._credential_cache.is_valid():
-                self.user, self.password = Database._credential_cache.get_credentials()
-                logging.debug("using cached database credentials")
-            else:
-                # Use a lock to ensure only one thread refreshes the credentials at a time
-                with Database._refresh_lock:
-                    # Check again in case another thread refreshed while we were waiting
-                    if not Database._credential_cache.is_valid():
-                        logging.debug(
-                            "fetching database credentials from secrets manager")
-                        try:
-                            secret = secrets_manager.get_secret_value(
-                                SecretId=self.secret_arn)
-                            creds = json.loads(secret["SecretString"])
-                            logging.debug("secret successfully fetched")
-                            self.user = creds["username"]
-                            self.password = creds["password"]
-                            # Update the cache
-                            Database._credential_cache.update(
-                                self.user, self.password)
-                        except Exception as e:
-                            logging.error(f"Error fetching credentials: {e}")
-                            # If we can't refresh, but have old credentials, use them
-                            if Database._credential_cache.username and Database._credential_cache.password:
-                                self.user, self.password = Database._credential_cache.get_credentials()
-                                logging.warning(
-                                    "Using expired credentials due to refresh failure")
-                            else:
-                                # No choice but to raise the exception
-                                raise
-                    else:
-                        # Another thread refreshed the credentials while we were waiting
-                        self.user, self.password = Database._credential_cache.get_credentials()
-
-        return psycopg.connect(
-            host=self.host,
-            dbname=self.dbname,
-            user=self.user,
-            password=self.password
+    def _load_credentials(self):
+        """Resolve the current user/password from the shared credential cache"""
+        self.user, self.password = load_credentials(
+            self.secret_arn, self.user, self.password)
+        return self.user, self.password
+
+    def _connect_kwargs(self, host, user, password) -> dict:
+        """Connection parameters for host (or host:port)"""
+        kwargs = {
+            "host": host,
+            "dbname": self.dbname,
+            "user": user,
+            "password": password,
+        }
+        if host and ":" in host:
+            kwargs["host"], kwargs["port"] = host.rsplit(":", 1)
+        return kwargs
+
+    def _open_pool(self, host, name, user, password) -> ConnectionPool:
+        """Opens a connection pool to host"""
+        logging.info(
+            f"opening connection pool {name} (min={config.db_pool_min_size}, max={config.db_pool_max_size})")
+        return ConnectionPool(
+            kwargs=self._connect_kwargs(host, user, password),
+            min_size=config.db_pool_min_size,
+            max_size=config.db_pool_max_size,
+            timeout=config.db_pool_timeout,
+            max_idle=config.db_pool_max_idle,
+            max_lifetime=config.db_pool_max_lifetime,
+            check=Database._check_connection,
+            connection_class=RefreshingConnection,
+            name=name,
+            open=True,
         )
 
+    def _get_pool(self) -> ConnectionPool:
+        """Return the shared pool, creating it on first use and rotating credentials"""
+
+        user, password = self._load_credentials()
+
+        if Database._pool is None:
+            with Database._pool_lock:
+                if Database._pool is None:
+                    Database._pool = self._open_pool(
+                        self.host, "scribe", user, password)
+
+        Database._rotate_pool_credentials(user, password)
+        return Database._pool
+
+    def _get_reader_pool(self) -> ConnectionPool:
+        """Return the shared read replica pool, creating it on first use"""
+
+        user, password = self._load_credentials()
+
+        if Database._reader_pool is None:
+            with Database._pool_lock:
+                if Database._reader_pool is None:
+                    Database._reader_pool = self._open_pool(
+                        self.reader_host, "scribe-reader", user, password)
+
+        Database._rotate_pool_credentials(user, password)
+        return Database._reader_pool
+
+    def _listen_connection(self) -> psycopg.Connection:
+        """Opens an unpooled autocommit writer connection for LISTEN"""
+        user, password = self._load_credentials()
+        return RefreshingConnection.connect(
+            autocommit=True, **self._connect_kwargs(self.host, user, password))
+
+    @staticmethod
+    def _rotate_pool_credentials(user, password):
+        """
+        Points the pools at refreshed credentials. New connections pick up
+        the refreshed secret and _check_connection retires the ones opened
+        with the old one.
+        """
+        for pool in (Database._pool, Database._reader_pool):
+            if pool is None:
+                continue
+            if pool.kwargs.get("user") != user or pool.kwargs.get("password") != password:
+                logging.info(
+                    f"database credentials changed, rotating pooled connections ({pool.name})")
+                pool.kwargs = {**pool.kwargs, "user": user, "password": password}
+
+    @staticmethod
+    def _check_connection(conn):
+        """
+        Pool checkout health check.
+        Discards connections opened with credentials that have since been rotated.
+        """
+        # both pools are always rotated to the same credentials
+        pool = Database._pool or Database._reader_pool
+        password = pool.kwargs.get("password")
+        if password is not None and conn.info.password != password:
+            raise psycopg.OperationalError(
+                "connection opened with rotated credentials")
+        ConnectionPool.check_connection(conn)
+
+    @contextmanager
+    def _checkout(self, read=False):
+        """
+        Check out a pooled connection, from the read replica pool for
+        reads when one is configured.
+        The transaction is committed (or rolled back on error) and
+        the connection returned to the pool when the block exits.
+        """
+        if read and self.reader_host:
+            pool, metrics = self._get_reader_pool(), Database._reader_pool_metrics
+        else:
+            pool, metrics = self._get_pool(), Database._pool_metrics
+        start = time.monotonic()
+        with pool.connection() as conn:
+            metrics.record_checkout((time.monotonic() - start) * 1000)
+            yield conn
+
+    @contextmanager
+    def connect(self, read=False):
+        """
+        Returns the connection for a single unit of database work.
+        Inside a session this is the session's shared connection and the
+        session decides when to commit, otherwise a connection is checked
+        out of the pool and committed when the block exits.
+        read=True marks work that only reads, which may run on the
+        read replica (see Session for read-your-writes).
+        """
+        session = _current_session.get()
+        if session is not None:
+            yield session.connection(read)
+            return
+
+        with self._checkout(read) as conn:
+            yield conn
+
+    def begin_session(self, read_only=False, pinned=False) -> 'Session':
+        """
+        Starts a session and binds it to the current context.
+        A pinned session reads from the writer, e.g. right after the
+        same user wrote something a replica may not have yet.
+        """
+        session = Session(self, read_only, pinned)
+        session.token = _current_session.set(session)
+        return session
+
+    def end_session(self, session: 'Session', error=None):
+        """Commits (or rolls back on error) and unbinds a session"""
+        try:
+            session.close(error)
+        finally:
+            _current_session.reset(session.token)
+
+    @contextmanager
+    def session(self, read_only=False, pinned=False):
+        """
+        Unit of work: all Database calls made inside the block share
+        a single connection and are committed once when it exits.
+        """
+        session = self.begin_session(read_only, pinned)
+        try:
+            yield session
+        except BaseException as e:
+            self.end_session(session, e)
+            raise
+        self.end_session(session)
+
+    @contextmanager
+    def pipeline(self):
+        """
+        Batch statements into one network flight:
+
+            with db.pipeline() as p:
+                p.update_topic(id, name, description, areas)
+                scope = p.get_scope(scope_id)
+            scope.result
+
+        Runs on the session's connection when there is one.
+        """
+        with self.connect() as conn:
+            # assign_interview() may insert an interview
+            Database._ensure_partitions(conn)
+            pipeline = Pipeline(conn)
+            with conn.pipeline():
+                yield pipeline
+            pipeline.resolve()
+
+        for fn in pipeline.after_commit:
+            self._after_commit(fn)
+
+    def commit(self):
+        """
+        Commits the current session's work so far.
+        Call before handing off to another process (e.g. SQS) that
+        expects to see the changes. No-op outside a session.
+        """
+        session = _current_session.get()
+        if session is not None:
+            session.commit()
+
+    def release(self):
+        """
+        Commits the current session's work so far and returns its
+        connections to the pool until the next Database call.
+        Call before slow work that doesn't use the database (e.g. Bedrock)
+        so the session doesn't hold a pooled connection idle in
+        transaction meanwhile. No-op outside a session.
+        """
+        session = _current_session.get()
+        if session is not None:
+            session.release()
+
+    def _after_commit(self, fn):
+        """
+        Calls fn once the work done so far is committed. Call it after the
+        connect() block: outside a session the block has committed on exit,
+        inside one fn waits for the session to commit.
+        """
+        session = _current_session.get()
+        if session is not None:
+            session.after_commit(fn)
+        else:
+            fn()
+
+    def close(self):
+        """Closes the shared connection pools (for scripts and CLIs on exit)"""
+        with Database._pool_lock:
+            if Database._pool is not None:
+                Database._pool.close()
+                Database._pool = None
+            if Database._reader_pool is not None:
+                Database._reader_pool.close()
+                Database._reader_pool = None
+
+    def get_pool_metrics(self) -> dict:
+        """Returns connection pool usage and checkout latency"""
+        return self._pool_metrics_for(Database._pool, Database._pool_metrics)
+
+    @staticmethod
+    def _pool_metrics_for(pool, metrics) -> dict:
+        if pool is None:
+            return {"open": False}
+
+        stats = pool.get_stats()
+        return {
+            "open": True,
+            "min_size": stats.get("pool_min", 0),
+            "max_size": stats.get("pool_max", 0),
+            "size": stats.get("pool_size", 0),
+            "available": stats.get("pool_available", 0),
+            "in_use": stats.get("pool_size", 0) - stats.get("pool_available", 0),
+            "waiting": stats.get("requests_waiting", 0),
+            "connections_errors": stats.get("connections_errors", 0),
+            "connections_lost": stats.get("connections_lost", 0),
+            **metrics.snapshot(),
+        }
+
+    def get_metrics(self) -> dict:
+        """Returns database client metrics for operational visibility"""
+        return {
+            "pool": self.get_pool_metrics(),
+            "reader_pool": self._pool_metrics_for(
+                Database._reader_pool, Database._reader_pool_metrics),
+            "credentials": Database._credential_cache.snapshot(),
+            "settings": Database._settings_cache.snapshot(),
+            "catalog": Database._catalog_cache.snapshot(),
+            "queries": registry.stats(),
+        }
+
+    @staticmethod
+    def _ensure_partitions(conn):
+        """
+        Makes sure conversation and interview have partitions for this month
+        and the next before a row is written to them: the tables have no
+        default partition (see migrations/0012_drop_default_partitions.sql),
+        so a month without one can't take rows. Checked once a month per
+        process. The next month's partitions are normally created by the
+        first write of the month before, long before they take rows.
+        """
+        now = datetime.now(timezone.utc)
+        month = (now.year, now.month)
+        if month in Database._partition_months:
+            return
+
+        this_month = now.date().replace(day=1)
+        next_month = (this_month + timedelta(days=31)).replace(day=1)
+        try:
+            # a savepoint: another process creating the same partition
+            # mustn't abort the caller's transaction
+            with conn.transaction():
+                for table in queries.PARTITIONED_TABLES:
+                    for day in (this_month, next_month):
+                        queries.PARTITION_CREATE.run(conn, (table, day))
+        except psycopg.Error as e:
+            logging.warning(f"could not create partitions for {month}: {e}")
+            return
+        Database._partition_months.add(month)
+
+    def _read_through(self, cache: NotifiedCache, ttl, key, load):
+        """
+        Returns load() through cache, callers get their own copy.
+        Loads should read from the writer: a lagging replica could refill
+        the cache with the rows a change notification just replaced.
+        """
+        if ttl <= 0:
+            return load()
+
+        Database._change_listener.start(self)
+        found, value, generation = cache.lookup(key, ttl)
+        if found:
+            return copy.deepcopy(value)
+
+        value = load()
+        # a session that wrote may be reading its own uncommitted change
+        session = _current_session.get()
+        if session is None or not session.wrote:
+            cache.store(key, copy.deepcopy(value), generation)
+        return value
+
     def new_chat(self, user_id, created, scope_id=None):
         """creates a new conversation"""
 
@@ -120,444 +1029,421 @@ class Database():
             "questions": []
         }
 
-        query = """
-            INSERT INTO conversation (id, created, scope_id, user_id, data, summary)
-            VALUES (%s, %s, %s, %s, %s, %s)
-        """
+        query = queries.CONVERSATION_INSERT
         values = (id, created, scope_id, user_id,
-                  json.dumps(conversation, default=str), "")
+                  queries.conversation_header(conversation), "")
         logging.info(f"query: {query}")
         logging.info(f"values: {values}")
 
         with self.connect() as conn:
-            conn.execute(query, values)
+            Database._ensure_partitions(conn)
+            query.run(conn, values)
 
         return conversation
 
-    def list_interviews(self, top):
-        """fetch a list of interviews"""
-
-        query = """
-            SELECT
-                i.id,
-                i.created,
-                i.user_id,
-                i.topic_id,
-                i.status,
-                i.data,
-                i.completed,
-                i.summary,
-                t.name AS topic_name,
-                t.description AS topic_description,
-                t.areas AS topic_areas,
-                s.name AS scope_name,
-                i.approved_by_user_id,
-                i.approved_on,
-                i.voice_mode,
-                i.voice_session_metadata
-            FROM interview i
-            JOIN topic t ON i.topic_id = t.id
-            JOIN scope s ON t.scope_id = s.id
-            ORDER BY created DESC
-            LIMIT %s
+    def _page(self, query, after_query, values, limit, cursor, key):
         """
+        Runs a keyset paginated list query.
+        Fetches one extra row to know whether there is a next page.
+        Returns: (records, next_cursor), next_cursor is None on the last page
+        """
+
+        if cursor:
+            query = after_query
+            values = values + queries.decode_cursor(cursor) + (limit + 1,)
+        else:
+            values = values + (limit + 1,)
         logging.info(f"query: {query}")
-        values = (top,)
         logging.info(f"values: {values}")
-        with self.connect() as conn:
-            records = conn.execute(query, values).fetchall()
-
-        results = []
-        for record in records:
-            r = InterviewRecord(
-                id=record[0],
-                created=record[1],
-                user_id=record[2],
-                topic_id=record[3],
-                status=record[4],
-                data=record[5],
-                completed=record[6],
-                summary=record[7],
-                topic_name=record[8],
-                topic_description=record[9],
-                topic_areas=record[10],
-                scope_name=record[11],
-                approved_by_user_id=record[12],
-                approved_on=record[13],
-                voice_mode=record[14],
-                voice_session_metadata=record[15],
-            )
-            results.append(r.to_interview())
-        return results
+        with self.connect(read=True) as conn:
+            records = query.run(conn, values).fetchall()
 
-    def list_interviews_by_user(self, user_id, top):
-        """fetch a list of interviews by user"""
+        next_cursor = None
+        if len(records) > limit:
+            records = records[:limit]
+            next_cursor = queries.encode_cursor(*key(records[-1]))
+
+        return records, next_cursor
 
-        query = """
-            SELECT data FROM interview
-            WHERE user_id = %s
-            ORDER BY created DESC
-            LIMIT %s
+    def search(self, text, limit, cursor=None, interviews=True, conversations=True):
+        """
+        Full-text search over interview transcripts and summaries and
+        conversation turns, best match first (see queries.SEARCH).
+        Returns: (results, next_cursor), next_cursor is None on the last page
         """
+        query = queries.SEARCH
+        values = {
+            "text": text,
+            "interviews": interviews,
+            "conversations": conversations,
+            "limit": limit + 1,
+        }
+        if cursor:
+            query = queries.SEARCH_AFTER
+            values["after_rank"], values["after_id"] = queries.decode_rank_cursor(
+                cursor)
         logging.info(f"query: {query}")
-        values = (user_id, top,)
         logging.info(f"values: {values}")
-        with self.connect() as conn:
-            records = conn.execute(query, values).fetchall()
+        with self.connect(read=True) as conn:
+            records = query.run(conn, values).fetchall()
 
-        results = []
-        for record in records:
-            results.append(record[0])
-        return results
+        next_cursor = None
+        if len(records) > limit:
+            records = records[:limit]
+            next_cursor = queries.encode_rank_cursor(
+                records[-1]["rank"], records[-1]["id"])
 
-    def update(self, conversation):
-        """updates a conversation object"""
+        return records, next_cursor
+
+    def export(self, kind, format, filters):
+        """
+        Streams a bulk export (see shared.data.export) as the blocks of
+        bytes Postgres sends, so memory use doesn't grow with its size.
+        Runs on a connection of its own (the read replica's when there is
+        one) rather than the session's, since a response streams the
+        export after its request's session has ended.
+        """
+        query = queries.EXPORTS[(kind, format)]
+        logging.info(f"query: {query}")
+        logging.info(f"values: {filters}")
+        with self._checkout(read=True) as conn:
+            with conn.cursor().copy(query, filters) as copy:
+                for block in copy:
+                    yield bytes(block)
+
+    def list_interviews(self, top):
+        """fetch a list of interview summaries (without questions)"""
+        return self.list_interviews_page(top)[0]
+
+    def list_interviews_page(self, limit, cursor=None):
+        """
+        fetch a page of interview summaries, newest first
+        Questions aren't loaded, see question_count and initial_question
+        Returns: (interviews, next_cursor)
+        """
+        records, next_cursor = self._page(
+            queries.INTERVIEW_LIST, queries.INTERVIEW_LIST_AFTER, (),
+            limit, cursor, key=lambda r: (r.created, r.id))
+
+        return [record.to_interview() for record in records], next_cursor
+
+    def list_interviews_by_user(self, user_id, top):
+        """fetch a list of interview summaries by user"""
+        return self.list_interviews_by_user_page(user_id, top)[0]
+
+    def list_interviews_by_user_page(self, user_id, limit, cursor=None):
+        """
+        fetch a page of interview summaries for a user, newest first
+        Returns: (interviews, next_cursor)
+        """
+        records, next_cursor = self._page(
+            queries.INTERVIEW_LIST_BY_USER,
+            queries.INTERVIEW_LIST_BY_USER_AFTER, (user_id,),
+            limit, cursor, key=lambda r: (r.created, r.id))
 
-        query = """
-            UPDATE conversation
-            SET data = %s
-            WHERE id = %s
+        return [record.to_interview() for record in records], next_cursor
+
+    def update(self, conversation):
         """
-        values = (json.dumps(conversation, default=str),
+        updates a conversation's header (e.g. scope_id)
+        questions are stored as turns, see add_conversation_turn()
+        """
+
+        query = queries.CONVERSATION_UPDATE
+        values = (queries.conversation_header(conversation),
+                  conversation.get("scope_id"),
                   conversation["conversationId"])
         logging.info(f"query: {query}")
         logging.info(f"values: {values}")
 
         with self.connect() as conn:
-            conn.execute(query, values)
+            query.run(conn, values)
+
+    def add_conversation_turn(self, conversation_id, question, answer, created) -> bool:
+        """
+        appends a Q&A to a conversation without rewriting earlier ones
+        Returns: False if the conversation doesn't exist
+        """
+
+        query = queries.CONVERSATION_TURN_INSERT
+        values = queries.conversation_turn_values(
+            conversation_id, question, answer, created)
+        logging.info(f"query: {query}")
+        logging.info(f"values: {values}")
+
+        with self.connect() as conn:
+            queries.CONVERSATION_TURN_LOCK.run(conn, (conversation_id,))
+            appended = query.run(conn, values).rowcount == 1
+
+        if not appended:
+            logging.warning(f"conversation {conversation_id} not found")
+        return appended
 
     def get(self, conversation_id):
         """fetch a conversation by id"""
 
-        query = """
-            SELECT data
-            FROM conversation
-            WHERE id = %s
-        """
+        query = queries.CONVERSATION_GET_BY_ID
         logging.info(f"query: {query}")
         values = (conversation_id,)
         logging.info(f"values: {values}")
-        with self.connect() as conn:
-            record = conn.execute(query, values).fetchone()
+        with self.connect(read=True) as conn:
+            record = query.run(conn, values).fetchone()
 
-        return record[0] if record else None
+        if record:
+            return record[0]
+
+        # archived conversations are read-only
+        conversation = self.get_archived("conversation", conversation_id)
+        if conversation is not None:
+            conversation["archived"] = True
+        return conversation
 
     def list(self, top):
-        """fetch a list of conversations"""
+        """fetch a list of conversation summaries"""
+        return self.list_page(top)[0]
 
-        query = """
-            SELECT data FROM conversation
-            ORDER BY created DESC
-            LIMIT %s
+    def list_page(self, limit, cursor=None):
         """
-        logging.info(f"query: {query}")
-        values = (top,)
-        logging.info(f"values: {values}")
-        with self.connect() as conn:
-            records = conn.execute(query, values).fetchall()
-
-        results = []
-        for record in records:
-            results.append(record[0])
-        return results
+        fetch a page of conversation summaries, newest first
+        Summaries have conversationId, userId, scope_id, created,
+        question_count and initial_question but no questions
+        Returns: (summaries, next_cursor)
+        """
+        return self._page(
+            queries.CONVERSATION_LIST, queries.CONVERSATION_LIST_AFTER, (),
+            limit, cursor, key=lambda r: (r["created"], r["conversationId"]))
 
     def list_by_user(self, user_id, top):
-        """fetch a list of conversations by user"""
+        """fetch a list of conversation summaries by user"""
+        return self.list_by_user_page(user_id, top)[0]
 
-        query = """
-            SELECT data FROM conversation
-            WHERE user_id = %s
-            ORDER BY created DESC
-            LIMIT %s
+    def list_by_user_page(self, user_id, limit, cursor=None):
         """
-        logging.info(f"query: {query}")
-        values = (user_id, top,)
-        logging.info(f"values: {values}")
-        with self.connect() as conn:
-            records = conn.execute(query, values).fetchall()
-
-        results = []
-        for record in records:
-            results.append(record[0])
-        return results
+        fetch a page of conversation summaries for a user, newest first
+        Returns: (summaries, next_cursor)
+        """
+        return self._page(
+            queries.CONVERSATION_LIST_BY_USER,
+            queries.CONVERSATION_LIST_BY_USER_AFTER, (user_id,),
+            limit, cursor, key=lambda r: (r["created"], r["conversationId"]))
 
     def get_topic_by_name(self, name):
         """get topic by name"""
-        query = """
-            SELECT id, name, description, areas, scope_id
-            FROM topic
-            WHERE name = %s
-        """
+        query = queries.TOPIC_GET_BY_NAME
         logging.info(f"query: {query}")
         values = (name,)
         logging.info(f"values: {values}")
-        with self.connect() as conn:
-            record = conn.execute(query, values).fetchone()
+        with self.connect(read=True) as conn:
+            record = query.run(conn, values).fetchone()
 
-        if record:
-            return {
-                "id": record[0],
-                "name": record[1],
-                "description": record[2],
-                "areas": record[3],
-                "scope_id": record[4]
-            }
-        else:
-            return None
+        return record
 
     def get_topic_by_id(self, id):
-        """get topic by id"""
-        query = """
-            SELECT id, name, description, areas, scope_id
-            FROM topic
-            WHERE id = %s
-        """
-        logging.info(f"query: {query}")
-        values = (id,)
-        logging.info(f"values: {values}")
-        with self.connect() as conn:
-            record = conn.execute(query, values).fetchone()
+        """get topic by id (cached)"""
+        def load():
+            query = queries.TOPIC_GET_BY_ID
+            logging.info(f"query: {query}")
+            values = (id,)
+            logging.info(f"values: {values}")
+            with self.connect() as conn:
+                return query.run(conn, values).fetchone()
 
-        if record:
-            return {
-                "id": record[0],
-                "name": record[1],
-                "description": record[2],
-                "areas": record[3],
-                "scope_id": record[4]
-            }
-        else:
-            return None
+        return self._read_through(Database._catalog_cache, config.catalog_cache_ttl,
+                                  ("topic", str(id)), load)
 
     def create_scope(self, name, description, created):
         """creates a new scope"""
-        id = str(uuid.uuid4())
 
-        query = """
-            INSERT INTO scope (id, created, name, description)
-            VALUES (%s, %s, %s, %s)
-        """
-        values = (id, created, name, description)
+        query = queries.SCOPE_INSERT
+        scope, values = queries.new_scope(name, description, created)
         logging.info(f"query: {query}")
         logging.info(f"values: {values}")
 
         with self.connect() as conn:
-            conn.execute(query, values)
+            query.run(conn, values)
+        self._after_commit(Database._catalog_cache.invalidate)
 
-        return {
-            "id": id,
-            "name": name,
-            "description": description,
-            "created": created
-        }
+        return scope
 
     def update_scope(self, id, name, description):
         """updates a scope"""
 
-        query = """
-            UPDATE scope
-            SET name = %s, description = %s
-            WHERE id = %s
-        """
+        query = queries.SCOPE_UPDATE
         values = (name, description, id)
         logging.info(f"query: {query}")
         logging.info(f"values: {values}")
 
         with self.connect() as conn:
-            conn.execute(query, values)
+            query.run(conn, values)
+        self._after_commit(Database._catalog_cache.invalidate)
 
     def get_scope(self, scope_id):
-        """get scope by id"""
-        query = """
-            SELECT id, name, description, created
-            FROM scope
-            WHERE id = %s
-        """
-        logging.info(f"query: {query}")
-        values = (scope_id,)
-        logging.info(f"values: {values}")
-        with self.connect() as conn:
-            record = conn.execute(query, values).fetchone()
+        """get scope by id (cached)"""
+        def load():
+            query = queries.SCOPE_GET_BY_ID
+            logging.info(f"query: {query}")
+            values = (scope_id,)
+            logging.info(f"values: {values}")
+            with self.connect() as conn:
+                return query.run(conn, values).fetchone()
 
-        if record:
-            return {
-                "id": record[0],
-                "name": record[1],
-                "description": record[2],
-                "created": record[3]
-            }
-        else:
-            return None
+        return self._read_through(Database._catalog_cache, config.catalog_cache_ttl,
+                                  ("scope", str(scope_id)), load)
 
     def delete_scope(self, scope_id):
         """delete scope by id"""
 
-        query = """
-            DELETE FROM scope
-            WHERE id = %s
-        """
+        query = queries.SCOPE_DELETE
         logging.info(f"query: {query}")
         values = (scope_id,)
         logging.info(f"values: {values}")
         with self.connect() as conn:
-            conn.execute(query, values)
+            query.run(conn, values)
+        self._after_commit(Database._catalog_cache.invalidate)
 
     def list_scopes(self, top=50):
-        """fetch a list of scopes"""
+        """fetch a list of scopes (cached)"""
+        def load():
+            query = queries.SCOPE_LIST
+            logging.info(f"query: {query}")
+            values = (top,)
+            logging.info(f"values: {values}")
+            with self.connect() as conn:
+                return query.run(conn, values).fetchall()
 
-        query = """
-            SELECT id, name, description, created
-            FROM scope
-            ORDER BY created DESC
-            LIMIT %s
-        """
-        logging.info(f"query: {query}")
-        values = (top,)
-        logging.info(f"values: {values}")
-        with self.connect() as conn:
-            records = conn.execute(query, values).fetchall()
-
-        results = []
-        for record in records:
-            results.append({
-                "id": record[0],
-                "name": record[1],
-                "description": record[2],
-                "created": record[3]
-            })
-        return results
+        return self._read_through(Database._catalog_cache, config.catalog_cache_ttl,
+                                  ("scopes", top), load)
 
     def create_topic(self, name, description, areas, scope_id, created):
         """creates a new topic"""
-        id = str(uuid.uuid4())
 
-        query = """
-            INSERT INTO topic (id, created, scope_id, name, description, areas)
-            VALUES (%s, %s, %s, %s, %s, %s)
-        """
-        values = (id, created, scope_id, name, description, json.dumps(areas))
+        query = queries.TOPIC_INSERT
+        topic, values = queries.new_topic(
+            name, description, areas, scope_id, created)
         logging.info(f"query: {query}")
         logging.info(f"values: {values}")
 
         with self.connect() as conn:
-            conn.execute(query, values)
+            query.run(conn, values)
+        self._after_commit(Database._catalog_cache.invalidate)
 
-        return {
-            "id": id,
-            "name": name,
-            "description": description,
-            "areas": areas,
-            "scope_id": scope_id,
-            "created": created
+        return topic
+
+    def import_catalog(self, scopes) -> dict:
+        """
+        creates or updates scopes and their topics (as validated by
+        shared.data.catalog_import) in one transaction, with one statement
+        for all of the scopes and one for all of the topics.
+        Returns: {"scopes": rows, "topics": rows}, each row with its id,
+        name and result (created, updated or unchanged)
+        """
+
+        created = datetime.now(timezone.utc)
+        scope_values = {
+            "created": created,
+            "scopes": json.dumps([
+                {"name": scope["name"], "description": scope["description"]}
+                for scope in scopes]),
         }
+        logging.info(f"query: {queries.SCOPE_IMPORT}")
+        logging.info(f"values: {len(scopes)} scopes")
+
+        with self.connect() as conn:
+            conn.execute(queries.CATALOG_IMPORT_LOCK)
+            scope_rows = queries.SCOPE_IMPORT.run(
+                conn, scope_values).fetchall()
+
+            scope_ids = {row["name"]: str(row["id"]) for row in scope_rows}
+            topics = [
+                {"scope_id": scope_ids[scope["name"]], "name": topic["name"],
+                 "description": topic["description"], "areas": topic["areas"]}
+                for scope in scopes for topic in scope["topics"]
+            ]
+            topic_rows = []
+            if topics:
+                logging.info(f"query: {queries.TOPIC_IMPORT}")
+                logging.info(f"values: {len(topics)} topics")
+                topic_rows = queries.TOPIC_IMPORT.run(conn, {
+                    "created": created,
+                    "topics": json.dumps(topics),
+                }).fetchall()
+        self._after_commit(Database._catalog_cache.invalidate)
+
+        return {"scopes": scope_rows, "topics": topic_rows}
 
     def list_topics_by_scope(self, scope_id):
-        """list topics by scope id"""
-        query = """
-            SELECT id, name, description, areas, created
-            FROM topic
-            WHERE scope_id = %s
-            ORDER BY created DESC
+        """list topics by scope id (cached)"""
+        def load():
+            query = queries.TOPIC_LIST_BY_SCOPE
+            logging.info(f"query: {query}")
+            values = (scope_id,)
+            logging.info(f"values: {values}")
+            with self.connect() as conn:
+                return query.run(conn, values).fetchall()
+
+        return self._read_through(Database._catalog_cache, config.catalog_cache_ttl,
+                                  ("topics", str(scope_id)), load)
+
+    def get_topic_catalog(self, scope_id=None) -> list:
         """
+        topics (all of them, or a scope's) with their scope name and
+        latest approved interview, in a single query
+        """
+        if scope_id:
+            query, values = queries.TOPIC_CATALOG_BY_SCOPE, (scope_id,)
+        else:
+            query, values = queries.TOPIC_CATALOG, None
         logging.info(f"query: {query}")
-        values = (scope_id,)
         logging.info(f"values: {values}")
-        with self.connect() as conn:
-            records = conn.execute(query, values).fetchall()
-
-        results = []
-        for record in records:
-            results.append({
-                "id": record[0],
-                "name": record[1],
-                "description": record[2],
-                "areas": record[3],
-                "created": record[4]
-            })
-        return results
+        with self.connect(read=True) as conn:
+            records = query.run(conn, values).fetchall()
+
+        return [queries.topic_catalog_entry(record) for record in records]
 
     def list_approved_interviews_by_topic(self, topic_id):
         """list approved interviews by topic id"""
-        query = """
-            SELECT i.id, i.created, i.topic_id, i.user_id, i.status,
-                   i.data, i.completed, i.summary, t.name as topic_name,
-                   t.description as topic_description, t.areas as topic_areas,
-                   s.name as scope_name, i.voice_mode, i.voice_session_metadata
-            FROM interview i
-            JOIN topic t ON i.topic_id = t.id
-            JOIN scope s ON t.scope_id = s.id
-            WHERE i.topic_id = %s AND i.status = %s
-            ORDER BY i.completed DESC
-        """
+        query = queries.INTERVIEW_LIST_APPROVED_BY_TOPIC
         logging.info(f"query: {query}")
         values = (topic_id, InterviewStatus.APPROVED.value)
         logging.info(f"values: {values}")
-        with self.connect() as conn:
-            records = conn.execute(query, values).fetchall()
-
-        results = []
-        for record in records:
-            interview_record = InterviewRecord(
-                id=record[0],
-                created=record[1],
-                topic_id=record[2],
-                user_id=record[3],
-                status=record[4],
-                data=record[5],
-                completed=record[6],
-                summary=record[7],
-                topic_name=record[8],
-                topic_description=record[9],
-                topic_areas=record[10],
-                scope_name=record[11],
-                voice_mode=record[12],
-                voice_session_metadata=record[13],
-            )
-            results.append(interview_record.to_interview())
-        return results
+        with self.connect(read=True) as conn:
+            records = query.run(conn, values).fetchall()
+
+        return [record.to_interview() for record in records]
 
     def update_conversation_summary(self, conversation_id, summary):
         """updates a conversation summary"""
 
-        query = """
-            UPDATE conversation
-            SET summary = %s
-            WHERE id = %s
-        """
+        query = queries.CONVERSATION_UPDATE_SUMMARY
         values = (summary, conversation_id)
         logging.info(f"query: {query}")
         logging.info(f"values: {values}")
 
         with self.connect() as conn:
-            conn.execute(query, values)
+            query.run(conn, values)
 
     def update_topic(self, id, name, description, areas):
         """updates a topic"""
 
-        query = """
-            UPDATE topic
-            SET name = %s, description = %s, areas = %s
-            WHERE id = %s
-        """
+        query = queries.TOPIC_UPDATE
         values = (name, description, json.dumps(areas), id)
         logging.info(f"query: {query}")
         logging.info(f"values: {values}")
 
         with self.connect() as conn:
-            conn.execute(query, values)
+            query.run(conn, values)
+        self._after_commit(Database._catalog_cache.invalidate)
 
     def delete_topic(self, topic_id):
         """delete topic by id"""
 
-        query = """
-            DELETE FROM topic
-            WHERE id = %s
-        """
+        query = queries.TOPIC_DELETE
         logging.info(f"query: {query}")
         values = (topic_id,)
         logging.info(f"values: {values}")
         with self.connect() as conn:
-            conn.execute(query, values)
+            query.run(conn, values)
+        self._after_commit(Database._catalog_cache.invalidate)
 
     def get_available_interviews(self, user_id):
         """
@@ -566,38 +1452,15 @@ class Database():
         Returns: scope_name, topic_name, topic_description, status, interview_id, status
         """
 
-        query = """
-            SELECT
-                s.name AS scope_name,
-                t.name AS topic_name,
-                t.description AS topic_description,
-                i.status,
-                i.id AS interview_id
-            FROM interview i
-            JOIN topic t ON i.topic_id = t.id
-            JOIN scope s ON t.scope_id = s.id
-            WHERE i.user_id = %s AND i.status in (%s,%s)
-            ORDER BY i.created DESC
-        """
+        query = queries.INTERVIEW_LIST_AVAILABLE
         logging.info(f"query: {query}")
         values = (user_id, InterviewStatus.NOT_STARTED.value,
                   InterviewStatus.STARTED.value)
         logging.info(f"values: {values}")
-        with self.connect() as conn:
-            records = conn.execute(query, values).fetchall()
-
-        results = []
-        for record in records:
-            r = InterviewRecord(
-                id=record[4],
-                user_id=user_id,
-                status=record[3],
-                topic_name=record[1],
-                topic_description=record[2],
-                scope_name=record[0],
-            )
-            results.append(r.to_interview())
-        return results
+        with self.connect(read=True) as conn:
+            records = query.run(conn, values).fetchall()
+
+        return [record.to_interview() for record in records]
 
     def get_inflight_interviews(self, topic_id):
         """
@@ -606,223 +1469,221 @@ class Database():
         Returns: scope_name, topic_name, topic_description, status, interview_id, user_id, created
         """
 
-        query = """
-            SELECT
-                s.name AS scope_name,
-                t.name AS topic_name,
-                t.description AS topic_description,
-                i.status,
-                i.id AS interview_id,
-                i.user_id,
-                i.created
-            FROM interview i
-            JOIN topic t ON i.topic_id = t.id
-            JOIN scope s ON t.scope_id = s.id
-            WHERE i.topic_id = %s
-            AND i.status not in (%s,%s)
-            ORDER BY i.created DESC
-        """
+        query = queries.INTERVIEW_LIST_INFLIGHT_BY_TOPIC
         logging.info(f"query: {query}")
-        values = (
-            topic_id,
-            InterviewStatus.APPROVED.value,
-            InterviewStatus.REJECTED.value,
-        )
+        values = (topic_id,)
         logging.info(f"values: {values}")
-        with self.connect() as conn:
-            records = conn.execute(query, values).fetchall()
-
-        results = []
-        for record in records:
-            r = InterviewRecord(
-                id=record[4],
-                status=record[3],
-                topic_name=record[1],
-                topic_description=record[2],
-                scope_name=record[0],
-                user_id=record[5],
-                created=record[6],
-            )
-            results.append(r.to_interview())
-        return results
+        with self.connect(read=True) as conn:
+            records = query.run(conn, values).fetchall()
+
+        return [record.to_interview() for record in records]
 
     def update_interview(self, interview):
-        """updates an interview object"""
-
-        query = """
-            UPDATE interview
-            SET
-                status = %s,
-                data = %s,
-                summary=%s,
-                approved_by_user_id = %s,
-                approved_on = %s,
-                voice_mode = %s,
-                voice_session_metadata = %s
-            WHERE id = %s
         """
-        record = interview.to_record()
-        values = (record.status, record.data, record.summary,
-                  record.approved_by_user_id, record.approved_on, record.voice_mode, record.voice_session_metadata, record.id)
+        updates an interview object
+        questions aren't written, see add_interview_question()
+        and answer_interview_question()
+        """
+
+        query = queries.INTERVIEW_UPDATE
+        values = queries.interview_update_values(interview)
         logging.info(f"query: {query}")
         logging.info(f"values: {values}")
 
         with self.connect() as conn:
-            conn.execute(query, values)
-
-    def update_interview_transcription(self, interview_id, transcription_data):
-        """Updates interview transcription data for voice interviews"""
+            query.run(conn, values)
 
-        query = """
-            UPDATE interview
-            SET data = %s
-            WHERE id = %s
+    def add_interview_question(self, interview_id, question) -> bool:
         """
-        values = (json.dumps(transcription_data, default=str), interview_id)
+        appends an unanswered question to an interview
+        Returns: False if the interview doesn't exist
+        """
+
+        query = queries.INTERVIEW_TURN_INSERT
+        values = queries.interview_turn_values(interview_id, question)
         logging.info(f"query: {query}")
         logging.info(f"values: {values}")
 
         with self.connect() as conn:
-            conn.execute(query, values)
+            queries.INTERVIEW_TURN_LOCK.run(conn, (interview_id,))
+            appended = query.run(conn, values).rowcount == 1
 
-    def append_voice_transcription_entry(self, interview_id, question, answer):
-        """Appends a new transcription entry to existing interview data"""
+        if not appended:
+            logging.warning(f"interview {interview_id} not found")
+        return appended
 
-        query = """
-            UPDATE interview
-            SET data = COALESCE(data, '[]'::jsonb) || %s::jsonb
-            WHERE id = %s
-        """
-        new_entry = json.dumps([{"q": question, "a": answer}])
-        values = (new_entry, interview_id)
+    def answer_interview_question(self, interview_id, answer):
+        """sets the answer to an interview's latest question"""
+
+        query = queries.INTERVIEW_TURN_ANSWER_LAST
+        values = (answer, interview_id, interview_id)
         logging.info(f"query: {query}")
         logging.info(f"values: {values}")
 
         with self.connect() as conn:
-            conn.execute(query, values)
+            query.run(conn, values)
 
-    def get_voice_conversation_history(self, interview_id, max_characters=40960):
-        """Gets formatted conversation history for voice sessions with character limit"""
+    def transition_interview(self, interview_id, from_statuses, to_status) -> bool:
+        """
+        moves an interview to to_status if it's currently in one of from_statuses
+        Returns: True if the interview was updated
+        """
+
+        query = queries.INTERVIEW_TRANSITION_STATUS
+        values = queries.interview_transition_values(
+            interview_id, from_statuses, to_status)
+        logging.info(f"query: {query}")
+        logging.info(f"values: {values}")
+
+        with self.connect() as conn:
+            return query.run(conn, values).rowcount == 1
 
-        query = """
-            SELECT data
-            FROM interview
-            WHERE id = %s
+    def approve_interview(self, interview_id, approved_by_user_id, approved_on) -> bool:
         """
-        values = (interview_id,)
+        records an approval and moves an interview under review to pendingapproval
+        Returns: True if the interview was updated
+        """
+
+        query = queries.INTERVIEW_APPROVE
+        values = (
+            InterviewStatus.PENDING_APPROVAL.value,
+            approved_by_user_id,
+            approved_on,
+            interview_id,
+            [InterviewStatus.PENDING_REVIEW.value, InterviewStatus.REVIEWING.value],
+        )
         logging.info(f"query: {query}")
         logging.info(f"values: {values}")
 
         with self.connect() as conn:
-            record = conn.execute(query, values).fetchone()
+            return query.run(conn, values).rowcount == 1
 
-        if not record or not record[0]:
-            return []
+    def update_interview_transcription(self, interview_id, transcription_data):
+        """Replaces interview transcription data for voice interviews"""
 
-        conversation_data = record[0]
-        if not isinstance(conversation_data, list):
-            return []
+        delete = queries.INTERVIEW_TURN_DELETE_ALL
+        insert = queries.INTERVIEW_TURN_INSERT_ALL
+        values = (interview_id, json.dumps(transcription_data, default=str),
+                  interview_id)
+        logging.info(f"query: {insert}")
+        logging.info(f"values: {values}")
 
-        # Format and truncate conversation history for Nova Sonic
-        total_characters = 0
-        formatted_history = []
+        with self.connect() as conn:
+            queries.INTERVIEW_TURN_LOCK.run(conn, (interview_id,))
+            delete.run(conn, (interview_id,))
+            insert.run(conn, values)
 
-        # Process from most recent backwards to stay within character limit
-        for i in range(len(conversation_data) - 1, -1, -1):
-            entry = conversation_data[i]
-            question = entry.get('q', '')
-            answer = entry.get('a', '')
+    def append_voice_transcription_entry(self, interview_id, question, answer) -> bool:
+        """
+        Appends a new transcription entry to existing interview data
+        Returns: False if the interview doesn't exist
+        """
+
+        query = queries.INTERVIEW_TURN_INSERT
+        values = queries.interview_turn_values(interview_id, question, answer)
+        logging.info(f"query: {query}")
+        logging.info(f"values: {values}")
+
+        with self.connect() as conn:
+            queries.INTERVIEW_TURN_LOCK.run(conn, (interview_id,))
+            appended = query.run(conn, values).rowcount == 1
 
-            # Truncate individual messages to 1024 characters as per requirements
-            truncated_question = question[:1024] if len(
-                question) > 1024 else question
-            truncated_answer = answer[:1024] if len(answer) > 1024 else answer
+        if not appended:
+            logging.warning(f"interview {interview_id} not found")
+        return appended
 
-            entry_length = len(truncated_question) + len(truncated_answer)
+    def get_interview_stats(self) -> dict:
+        """dashboard stats from the interview_stats counters, see queries.interview_stats()"""
+        logging.info(f"query: {queries.STATS_BY_TOPIC}")
+        logging.info(f"query: {queries.STATS_BACKLOG}")
+        with self.connect(read=True) as conn:
+            records = queries.STATS_BY_TOPIC.run(conn).fetchall()
+            backlog = queries.STATS_BACKLOG.run(conn).fetchall()
 
-            if total_characters + entry_length > max_characters:
-                break
+        return queries.interview_stats(records, backlog, datetime.now(timezone.utc))
 
-            formatted_history.insert(0, {
-                'q': truncated_question,
-                'a': truncated_answer
-            })
+    def get_voice_conversation_history(self, interview_id, max_characters=40960):
+        """Gets formatted conversation history for voice sessions with character limit"""
 
-            total_characters += entry_length
+        query = queries.VOICE_GET_CONVERSATION_HISTORY
+        values = (interview_id, max_characters)
+        logging.info(f"query: {query}")
+        logging.info(f"values: {values}")
 
-        return formatted_history
+        with self.connect(read=True) as conn:
+            return query.run(conn, values).fetchall()
 
     def update_voice_session_metadata(self, interview_id, metadata):
         """Updates voice session metadata for an interview"""
 
-        query = """
-            UPDATE interview
-            SET voice_session_metadata = %s
-            WHERE id = %s
-        """
+        query = queries.VOICE_UPDATE_SESSION_METADATA
         values = (json.dumps(metadata, default=str), interview_id)
         logging.info(f"query: {query}")
         logging.info(f"values: {values}")
 
         with self.connect() as conn:
-            conn.execute(query, values)
+            query.run(conn, values)
+
+    def patch_voice_session_metadata(self, interview_id, patch):
+        """Merges top-level keys into an interview's voice session metadata"""
+
+        query = queries.VOICE_PATCH_SESSION_METADATA
+        values = (json.dumps(patch, default=str), interview_id)
+        logging.info(f"query: {query}")
+        logging.info(f"values: {values}")
+
+        with self.connect() as conn:
+            query.run(conn, values)
+
+    def start_voice_session(self, interview_id, metadata) -> bool:
+        """
+        Switches a not started or started interview to voice mode with
+        fresh session metadata, marking it started
+        Returns: True if the interview was updated
+        """
+
+        query = queries.VOICE_START_SESSION
+        values = queries.voice_session_start_values(interview_id, metadata)
+        logging.info(f"query: {query}")
+        logging.info(f"values: {values}")
+
+        with self.connect() as conn:
+            return query.run(conn, values).rowcount == 1
 
     def update_voice_session_status(self, interview_id, session_id, status):
         """Updates voice session status for a specific session"""
 
-        query = """
-            UPDATE interview
-            SET voice_session_metadata = jsonb_set(
-                COALESCE(voice_session_metadata, '{}'::jsonb),
-                %s,
-                %s::jsonb
-            )
-            WHERE id = %s
-        """
-        path = f'{{{session_id},status}}'
-        status_data = json.dumps(status)
-        values = (path, status_data, interview_id)
+        query = queries.VOICE_UPDATE_SESSION_STATUS
+        values = queries.voice_session_status_values(
+            interview_id, session_id, status)
         logging.info(f"query: {query}")
         logging.info(f"values: {values}")
 
         with self.connect() as conn:
-            conn.execute(query, values)
+            query.run(conn, values)
 
     def initialize_voice_session(self, interview_id, session_id, metadata):
         """Initializes voice session metadata for an interview"""
 
-        query = """
-            UPDATE interview
-            SET voice_session_metadata = COALESCE(voice_session_metadata, '{}'::jsonb) || %s::jsonb
-            WHERE id = %s
-        """
-        session_data = {
-            session_id: {
-                **metadata,
-                'createdAt': datetime.now(timezone.utc).isoformat()
-            }
-        }
-        values = (json.dumps(session_data, default=str), interview_id)
+        query = queries.VOICE_INITIALIZE_SESSION
+        values = queries.voice_session_init_values(
+            interview_id, session_id, metadata)
         logging.info(f"query: {query}")
         logging.info(f"values: {values}")
 
         with self.connect() as conn:
-            conn.execute(query, values)
+            query.run(conn, values)
 
     def get_voice_session_metadata(self, interview_id, session_id=None):
         """Gets voice session metadata for an interview"""
 
-        query = """
-            SELECT voice_session_metadata
-            FROM interview
-            WHERE id = %s
-        """
+        query = queries.VOICE_GET_SESSION_METADATA
         values = (interview_id,)
         logging.info(f"query: {query}")
         logging.info(f"values: {values}")
 
-        with self.connect() as conn:
-            record = conn.execute(query, values).fetchone()
+        with self.connect(read=True) as conn:
+            record = query.run(conn, values).fetchone()
 
         if not record:
             return None
@@ -837,235 +1698,182 @@ class Database():
     def enable_voice_mode(self, interview_id):
         """Enables voice mode for an interview"""
 
-        query = """
-            UPDATE interview
-            SET voice_mode = true
-            WHERE id = %s
-        """
+        query = queries.VOICE_ENABLE_MODE
         values = (interview_id,)
         logging.info(f"query: {query}")
         logging.info(f"values: {values}")
 
         with self.connect() as conn:
-            conn.execute(query, values)
+            query.run(conn, values)
 
     def get_interview_voice_info(self, interview_id):
         """Gets basic interview info for voice session validation"""
 
-        query = """
-            SELECT id, user_id, topic_id, status, voice_mode
-            FROM interview
-            WHERE id = %s
-        """
+        query = queries.VOICE_GET_INTERVIEW_INFO
         values = (interview_id,)
         logging.info(f"query: {query}")
         logging.info(f"values: {values}")
 
-        with self.connect() as conn:
-            record = conn.execute(query, values).fetchone()
-
-        if not record:
-            return None
+        with self.connect(read=True) as conn:
+            record = query.run(conn, values).fetchone()
 
-        return {
-            'id': record[0],
-            'user_id': record[1],
-            'topic_id': record[2],
-            'status': record[3],
-            'voice_mode': record[4] or False
-        }
+        return record
 
     def get_interview(self, id) -> Interview:
         """fetch an interview by id with all fields and topic information"""
 
-        query = """
-            SELECT
-                i.id,
-                i.created,
-                i.user_id,
-                i.topic_id,
-                i.status,
-                i.data,
-                i.completed,
-                i.summary,
-                t.name AS topic_name,
-                t.description AS topic_description,
-                t.areas AS topic_areas,
-                s.name AS scope_name,
-                i.approved_by_user_id,
-                i.approved_on,
-                i.voice_mode,
-                i.voice_session_metadata
-            FROM interview i
-            JOIN topic t ON i.topic_id = t.id
-            JOIN scope s ON t.scope_id = s.id
-            WHERE i.id = %s
+        query = queries.INTERVIEW_GET_BY_ID
+        values = (id,)
+        logging.info(f"query: {query}")
+        logging.info(f"values: {values}")
+
+        with self.connect(read=True) as conn:
+            record = query.run(conn, values).fetchone()
+
+        if record:
+            return record.to_interview()
+
+        archived = self.get_archived("interview", id)
+        return queries.archived_interview(archived).to_interview() if archived else None
+
+    def get_interview_header(self, id) -> Interview:
         """
+        fetch an interview by id with topic information but without its
+        questions, summary or voice session metadata
+        """
+
+        query = queries.INTERVIEW_GET_HEADER_BY_ID
         values = (id,)
         logging.info(f"query: {query}")
         logging.info(f"values: {values}")
 
-        with self.connect() as conn:
-            record = conn.execute(query, values).fetchone()
+        with self.connect(read=True) as conn:
+            record = query.run(conn, values).fetchone()
 
         if record:
-            record = InterviewRecord(
-                id=record[0],
-                created=record[1],
-                user_id=record[2],
-                topic_id=record[3],
-                status=record[4],
-                data=record[5],
-                completed=record[6],
-                summary=record[7],
-                topic_name=record[8],
-                topic_description=record[9],
-                topic_areas=record[10],
-                scope_name=record[11],
-                approved_by_user_id=record[12],
-                approved_on=record[13],
-                voice_mode=record[14],
-                voice_session_metadata=record[15],
-            )
             return record.to_interview()
-        else:
+
+        archived = self.get_archived("interview", id)
+        return queries.archived_interview(archived).to_interview() if archived else None
+
+    def get_archived(self, kind, id) -> dict:
+        """
+        a conversation or interview record from an archived month,
+        None if kind/id was never archived (see shared.data.archive)
+        """
+
+        query = queries.ARCHIVE_LOOKUP
+        values = (kind, id)
+        logging.info(f"query: {query}")
+        logging.info(f"values: {values}")
+
+        with self.connect(read=True) as conn:
+            record = query.run(conn, values).fetchone()
+
+        if record is None:
             return None
+        return archive_store.find_record(record[0], id)
+
+    def get_kb_document(self, topic_id) -> dict:
+        """the topic's current knowledge base document (None before the first approval)"""
+        query = queries.KB_DOCUMENT_GET_BY_TOPIC
+        logging.info(f"query: {query}")
+        values = (topic_id,)
+        logging.info(f"values: {values}")
+        with self.connect(read=True) as conn:
+            return query.run(conn, values).fetchone()
+
+    def set_kb_document(self, topic_id, interview_id, s3_key, approved_on):
+        """makes an approved interview's document the topic's current one"""
+        query = queries.KB_DOCUMENT_UPSERT
+        values = (topic_id, interview_id, s3_key, approved_on)
+        logging.info(f"query: {query}")
+        logging.info(f"values: {values}")
+        with self.connect() as conn:
+            query.run(conn, values)
 
     def get_latest_approved_interview(self, topic_id) -> Interview:
         """fetch the latest approved interview by topic"""
 
-        query = """
-            SELECT
-                id,
-                created,
-                user_id,
-                topic_id,
-                status,
-                data,
-                completed,
-                summary,
-                approved_by_user_id,
-                approved_on,
-                voice_mode,
-                voice_session_metadata
-            FROM interview
-            WHERE topic_id = %s
-            AND status = %s
-            ORDER BY completed DESC
-            LIMIT 1
-        """
+        query = queries.INTERVIEW_GET_LATEST_APPROVED
         values = (topic_id, InterviewStatus.APPROVED.value)
         logging.info(f"query: {query}")
         logging.info(f"values: {values}")
 
-        with self.connect() as conn:
-            record = conn.execute(query, values).fetchone()
+        with self.connect(read=True) as conn:
+            record = query.run(conn, values).fetchone()
 
-        if record:
-            record = InterviewRecord(
-                id=record[0],
-                created=record[1],
-                user_id=record[2],
-                topic_id=record[3],
-                status=record[4],
-                data=record[5],
-                completed=record[6],
-                summary=record[7],
-                approved_by_user_id=record[8],
-                approved_on=record[9],
-                voice_mode=record[10],
-                voice_session_metadata=record[11],
-            )
-            return record.to_interview()
-        else:
-            return None
+        return record.to_interview() if record else None
 
     def get_inflight_interview_by_user_topic(self, user_id, topic_id) -> Interview:
         """returns an in-flight interview by user and topic"""
 
-        query = """
-            SELECT
-                i.id,
-                i.created,
-                i.user_id,
-                i.topic_id,
-                i.status,
-                i.data,
-                i.completed,
-                i.summary,
-                i.approved_by_user_id,
-                i.approved_on,
-                i.voice_mode,
-                i.voice_session_metadata
-            FROM interview i
-            WHERE i.user_id = %s AND i.topic_id = %s
-            AND i.status not in (%s,%s)
-        """
-        values = (
-            user_id,
-            topic_id,
-            InterviewStatus.APPROVED.value,
-            InterviewStatus.REJECTED.value,
-        )
+        query = queries.INTERVIEW_GET_INFLIGHT_BY_USER_TOPIC
+        values = (user_id, topic_id)
 
         logging.info(f"query: {query}")
         logging.info(f"values: {values}")
 
-        with self.connect() as conn:
-            record = conn.execute(query, values).fetchone()
+        with self.connect(read=True) as conn:
+            record = query.run(conn, values).fetchone()
 
-        if record:
-            record = InterviewRecord(
-                id=record[0],
-                created=record[1],
-                user_id=record[2],
-                topic_id=record[3],
-                status=record[4],
-                data=record[5],
-                completed=record[6],
-                summary=record[7],
-                approved_by_user_id=record[8],
-                approved_on=record[9],
-                voice_mode=record[10],
-                voice_session_metadata=record[11],
-            )
-            return record.to_interview()
-        else:
-            return None
+        return record.to_interview() if record else None
 
     def create_interview(self, interview: Interview):
         """creates a new interview"""
 
         logging.info(f"db.create_interview()")
 
-        query = """
-            INSERT INTO interview (id, created, topic_id, user_id, status, data, summary, completed, voice_mode, voice_session_metadata)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """
-        record = interview.to_record()
-        values = (record.id, record.created, record.topic_id, record.user_id,
-                  record.status, record.data, record.summary, record.completed, record.voice_mode, record.voice_session_metadata)
+        query = queries.INTERVIEW_INSERT
+        values = queries.interview_insert_values(interview)
         logging.info(f"query: {query}")
         logging.info(f"values: {values}")
 
         with self.connect() as conn:
-            conn.execute(query, values)
+            Database._ensure_partitions(conn)
+            query.run(conn, values)
+            if interview.questions:
+                queries.INTERVIEW_TURN_INSERT_ALL.run(
+                    conn, (interview.id, interview.to_record().data, interview.id))
 
         return interview
 
+    def assign_interviews(self, pairs) -> dict:
+        """
+        creates an interview for each (topic_id, user_id) pair in a single
+        statement, skipping pairs that already have one in flight and
+        topics that don't exist. Concurrent assignments of the same pair
+        wait on each other (see INTERVIEW_ASSIGN_LOCK).
+        Returns: {"created": [pairs], "skipped": [pairs]}
+        """
+
+        query = queries.INTERVIEW_ASSIGN_BULK
+        values = queries.interview_assign_bulk_values(
+            pairs, datetime.now(timezone.utc))
+        logging.info(f"query: {query}")
+        logging.info(f"values: {len(pairs)} pairs")
+
+        with self.connect() as conn:
+            # serializes with other assignments of the same pairs until commit
+            Database._ensure_partitions(conn)
+            conn.execute(queries.INTERVIEW_ASSIGN_LOCK, values)
+            records = query.run(conn, values).fetchall()
+
+        created = {(str(topic_id), user_id) for topic_id, user_id in records}
+        result = {"created": [], "skipped": []}
+        for pair in dict.fromkeys((str(t), u) for t, u in pairs):
+            result["created" if pair in created else "skipped"].append(pair)
+        return result
+
     def get_assigned_user(self, topic_id):
         """get user assigned to a topic"""
 
-        query = """
-            SELECT user_id
-            FROM interview
-            WHERE topic_id = %s
-        """
+        query = queries.INTERVIEW_GET_ASSIGNED_USER
         values = (topic_id,)
         logging.info(f"query: {query}")
         logging.info(f"values: {values}")
-        with self.connect() as conn:
-            record = conn.execute(query, values).fetchone()
+        with self.connect(read=True) as conn:
+            record = query.run(conn, values).fetchone()
 
         return record[0] if record else None
 
@@ -1075,57 +1883,19 @@ class Database():
         and not for the same user.
         """
 
-        query = """
-            SELECT
-                s.name AS scope_name,
-                t.name AS topic_name,
-                t.description AS topic_description,
-                i.status,
-                i.id AS interview_id,
-                i.completed,
-                i.user_id
-            FROM interview i
-            JOIN topic t ON i.topic_id = t.id
-            JOIN scope s ON t.scope_id = s.id
-            WHERE i.status IN (%s, %s, %s)
-            AND i.user_id != %s
-            ORDER BY i.created DESC
-        """
-        values = (
-            InterviewStatus.PROCESSING.value,
-            InterviewStatus.PENDING_REVIEW.value,
-            InterviewStatus.REVIEWING.value,
-            user_id,
-        )
+        query = queries.INTERVIEW_LIST_AVAILABLE_REVIEWS
+        values = (user_id,)
         logging.info(f"query: {query}")
         logging.info(f"values: {values}")
-        with self.connect() as conn:
-            records = conn.execute(query, values).fetchall()
-
-        results = []
-        for record in records:
-            r = InterviewRecord(
-                id=record[4],
-                status=record[3],
-                topic_name=record[1],
-                topic_description=record[2],
-                scope_name=record[0],
-                completed=record[5],
-                user_id=record[6]
-            )
-            results.append(r.to_interview())
-        return results
+        with self.connect(read=True) as conn:
+            records = query.run(conn, values).fetchall()
+
+        return [record.to_interview() for record in records]
 
     def end_interview(self, interview: Interview):
         """ends an interview object"""
 
-        query = """
-            UPDATE interview
-            SET
-                status = %s,
-                completed = %s
-            WHERE id = %s
-        """
+        query = queries.INTERVIEW_END
         record = interview.to_record()
         values = (
             record.status,
@@ -1136,18 +1906,12 @@ class Database():
         logging.info(f"values: {values}")
 
         with self.connect() as conn:
-            conn.execute(query, values)
+            query.run(conn, values)
 
     def summarize_interview(self, interview: Interview):
         """updates an interview's summary and status"""
 
-        query = """
-            UPDATE interview
-            SET
-                status = %s,
-                summary = %s
-            WHERE id = %s
-        """
+        query = queries.INTERVIEW_SUMMARIZE
         record = interview.to_record()
         values = (
             record.status,
@@ -1158,52 +1922,53 @@ class Database():
         logging.info(f"values: {values}")
 
         with self.connect() as conn:
-            conn.execute(query, values)
+            query.run(conn, values)
 
     def get_setting(self, key: str) -> str:
-        """Retrieve a setting value by key"""
-        try:
-            query = "SELECT value FROM settings WHERE key = %s"
-            logging.info(f"query: {query}")
-            values = (key,)
-            logging.info(f"values: {values}")
+        """
+        Retrieve a setting value by key.
+        Cached, set_setting() invalidates it in every process.
+        """
+        def load():
+            try:
+                query = queries.SETTING_GET
+                logging.info(f"query: {query}")
+                values = (key,)
+                logging.info(f"values: {values}")
 
-            with self.connect() as conn:
-                record = conn.execute(query, values).fetchone()
+                with self.connect() as conn:
+                    record = query.run(conn, values).fetchone()
 
-            return record[0] if record else None
-        except Exception as e:
-            logging.error(f"Error retrieving setting '{key}': {e}")
-            raise
+                return record[0] if record else None
+            except Exception as e:
+                logging.error(f"Error retrieving setting '{key}': {e}")
+                raise
+
+        return self._read_through(
+            Database._settings_cache, config.settings_cache_ttl, key, load)
 
     def set_setting(self, key: str, value: str) -> None:
-        """Set or update a setting value"""
+        """Set or update a setting value, notifying every process's settings cache"""
         try:
-            query = """
-                INSERT INTO settings (key, value, updated_at)
-                VALUES (%s, %s, NOW())
-                ON CONFLICT (key)
-                DO UPDATE SET value = EXCLUDED.value, updated_at = NOW()
-            """
+            query = queries.SETTING_UPSERT
             logging.info(f"query: {query}")
             values = (key, value)
             logging.info(f"values: {values}")
 
             with self.connect() as conn:
-                conn.execute(query, values)
+                query.run(conn, values)
         except Exception as e:
             logging.error(f"Error setting '{key}' to '{value}': {e}")
             raise
 
+        # don't wait for our own notification
+        self._after_commit(lambda: Database._settings_cache.invalidate(key))
+
     def get_talk_mode_enabled(self) -> bool:
         """Get talk mode enabled status with default fallback to True"""
         try:
             value = self.get_setting('talk_mode_enabled')
-            if value is None:
-                # Setting doesn't exist, return default True
-                return True
-            # Convert string value to boolean
-            return value.lower() == 'true'
+            return queries.talk_mode_from_setting(value)
         except Exception as e:
             logging.error(f"Error retrieving talk mode setting: {e}")
             # Return default True on any error for backward compatibility
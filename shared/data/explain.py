@@ -0,0 +1,104 @@
+"""
+Runs EXPLAIN ANALYZE on a registered query to check its plan.
+
+usage (from web/ or events/):
+    python -m shared.data.explain                         list registered queries
+    python -m shared.data.explain <name> [param ...]      explain a query
+
+Parameters are passed as text and cast by Postgres, positionally for %s
+placeholders or as key=value for named %(key)s ones, e.g.
+    python -m shared.data.explain interview.list 100
+    python -m shared.data.explain search.local text=deploy limit=20
+        interviews=true conversations=true      (one line)
+
+COPY ... TO STDOUT statements (the export.* queries) can't be explained
+themselves, so the query they copy is explained instead.
+
+Statements run inside a transaction that is always rolled back,
+so explaining inserts, updates and deletes leaves no changes behind.
+"""
+import re
+import sys
+
+from shared.data import registry
+from shared.data.database import Database
+
+
+# %s or %(name)s, but not a literal %%
+PLACEHOLDER = re.compile(r"%(?:\((\w+)\))?s|%%")
+
+COPY = re.compile(r"^\s*COPY\s*\((.*)\)\s*TO\s+STDOUT", re.DOTALL)
+
+
+def statement(query) -> str:
+    """the statement to explain for a query, the copied query for a COPY"""
+    match = COPY.match(query)
+    return match.group(1) if match else query
+
+
+def bind(name, query, args):
+    """
+    query parameters from command line args, a list for %s placeholders
+    or a dict of key=value args for named ones
+    """
+    placeholders = [m.group(0) for m in PLACEHOLDER.finditer(query)
+                    if m.group(0) != "%%"]
+    keys = {PLACEHOLDER.match(p).group(1) for p in placeholders} - {None}
+
+    if not keys:
+        if len(args) != len(placeholders):
+            raise ValueError(
+                f"{name} takes {len(placeholders)} parameters, {len(args)} given")
+        return args
+
+    params = {}
+    for arg in args:
+        key, sep, value = arg.partition("=")
+        if not sep:
+            raise ValueError(f"{name} takes key=value parameters, got {arg}")
+        params[key] = value
+    if params.keys() != keys:
+        raise ValueError(
+            f"{name} takes parameters {', '.join(sorted(keys))}, "
+            f"{', '.join(sorted(params)) or 'none'} given")
+    return params
+
+
+def explain(name, args):
+    """returns the EXPLAIN ANALYZE output lines for a registered query"""
+
+    query = statement(registry.get(name))
+    params = bind(name, query, args)
+
+    db = Database()
+    with db.connect() as conn:
+        try:
+            records = conn.execute(
+                f"EXPLAIN (ANALYZE, BUFFERS) {query}", params).fetchall()
+        finally:
+            conn.rollback()
+
+    return [record[0] for record in records]
+
+
+def main():
+    if len(sys.argv) < 2:
+        for name in registry.names():
+            print(name)
+        return
+
+    name = sys.argv[1]
+    print(registry.get(name).strip())
+    print()
+    try:
+        lines = explain(name, sys.argv[2:])
+    except ValueError as e:
+        sys.exit(str(e))
+    finally:
+        Database().close()
+    for line in lines:
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
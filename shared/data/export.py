@@ -0,0 +1,127 @@
+"""
+Streams interviews, conversations and their turns out of Postgres as
+NDJSON or CSV.
+
+usage (from web/ or events/):
+    python -m shared.data.export KIND [--format ndjson|csv] [--scope ID]
+        [--topic ID] [--status STATUS ...] [--since DATE] [--until DATE]
+        [--output FILE]
+
+KIND is interviews, interview_turns, conversations or conversation_turns.
+--topic and --status only apply to interviews and their turns, --since and
+--until (ISO dates or timestamps, UTC unless given) select by the
+interview's or conversation's created time, --until excluded. The export
+goes to stdout unless --output is given; admins can download the same
+exports from /admin/export/<kind>.
+
+Rows are copied straight from Postgres with COPY ... TO STDOUT and written
+as they arrive (see Database.export), so millions of turns export in
+constant memory. Archived months aren't included, they're in cold storage
+as NDJSON already (see shared.data.archive_store).
+
+There is no Parquet format: it would add pyarrow to the web image and the
+events lambda and convert every row in Python instead of passing COPY's
+output through. Athena, Spark and pandas read the CSV and NDJSON as they are.
+"""
+import sys
+import time
+import uuid
+import resource
+import argparse
+from datetime import datetime, timezone
+
+from shared.data import queries
+from shared.data.database import Database
+from shared.data.data_models import InterviewStatus
+
+KINDS = tuple(queries.EXPORT_SELECTS)
+
+# format: (content type, file extension)
+FORMATS = {
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "csv": ("text/csv", "csv"),
+}
+
+INTERVIEW_KINDS = ("interviews", "interview_turns")
+
+
+def parse_time(value) -> datetime:
+    """an ISO date or timestamp, in UTC unless it says otherwise"""
+    result = datetime.fromisoformat(value)
+    if result.tzinfo is None:
+        result = result.replace(tzinfo=timezone.utc)
+    return result
+
+
+def filters(kind, format, scope_id=None, topic_id=None, statuses=None,
+            since=None, until=None) -> dict:
+    """
+    checks an export's options and returns its query values,
+    raises ValueError for anything the export can't be filtered by
+    """
+    if kind not in KINDS:
+        raise ValueError(f"kind must be one of {', '.join(KINDS)}")
+    if format not in FORMATS:
+        raise ValueError(f"format must be one of {', '.join(FORMATS)}")
+    if kind not in INTERVIEW_KINDS and (topic_id or statuses):
+        raise ValueError("topic and status only apply to interview exports")
+
+    return {
+        "scope_id": uuid.UUID(scope_id) if scope_id else None,
+        "topic_id": uuid.UUID(topic_id) if topic_id else None,
+        "statuses": [InterviewStatus(s).value for s in statuses] if statuses else None,
+        "since": parse_time(since) if since else None,
+        "until": parse_time(until) if until else None,
+    }
+
+
+def filename(kind, format, now: datetime) -> str:
+    """download name for an export"""
+    return f"{kind}-{now:%Y%m%d-%H%M%S}.{FORMATS[format][1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m shared.data.export",
+        description="stream interviews, conversations and their turns as NDJSON or CSV")
+    parser.add_argument("kind", choices=KINDS)
+    parser.add_argument("--format", choices=tuple(FORMATS), default="ndjson")
+    parser.add_argument("--scope", dest="scope_id")
+    parser.add_argument("--topic", dest="topic_id")
+    parser.add_argument("--status", dest="statuses", action="append",
+                        choices=[s.value for s in InterviewStatus])
+    parser.add_argument("--since")
+    parser.add_argument("--until")
+    parser.add_argument("--output", help="file to write (default: stdout)")
+    args = parser.parse_args()
+
+    try:
+        values = filters(args.kind, args.format, args.scope_id, args.topic_id,
+                         args.statuses, args.since, args.until)
+    except ValueError as e:
+        parser.error(str(e))
+
+    db = Database()
+    start = time.perf_counter()
+    written = 0
+    out = open(args.output, "wb") if args.output else sys.stdout.buffer
+    try:
+        for block in db.export(args.kind, args.format, values):
+            out.write(block)
+            written += len(block)
+    finally:
+        if args.output:
+            out.close()
+        else:
+            out.flush()
+        db.close()
+
+    # ru_maxrss is in kilobytes on Linux
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"exported {written / 1024 / 1024:.1f} MB in {elapsed:.1f}s "
+          f"(peak memory {peak:.0f} MB)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Applies versioned schema migrations and records them in schema_migrations.
+
+usage (from web/ or events/):
+    python -m shared.data.migrate            apply pending migrations
+    python -m shared.data.migrate status     list applied and pending migrations
+
+Migrations are shared/data/migrations/NNNN_name.sql files applied in version
+order. Statements are separated by a line ending in ";" (not counting lines
+inside $$ quoted function bodies). A file starting with
+"-- migrate: no-transaction" runs statement by statement outside a transaction
+(needed for CREATE INDEX CONCURRENTLY), otherwise the whole file and its
+version record commit together.
+
+iac/db-migrate.sh applies the same files to Aurora through the RDS Data API.
+"""
+import os
+import re
+import sys
+import logging
+
+from shared.data.database import Database
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(__file__), "migrations")
+
+NO_TRANSACTION = "-- migrate: no-transaction"
+
+CREATE_SCHEMA_MIGRATIONS = """
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        version INTEGER PRIMARY KEY,
+        name VARCHAR NOT NULL,
+        applied_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+    )
+"""
+
+
+class Migration:
+    """A versioned migration file"""
+
+    def __init__(self, path):
+        self.path = path
+        self.name = os.path.splitext(os.path.basename(path))[0]
+        self.version = int(self.name.split("_", 1)[0])
+        with open(path) as f:
+            self.sql = f.read()
+        self.transactional = not self.sql.startswith(NO_TRANSACTION)
+
+    def statements(self) -> list:
+        """the file's statements, split on lines ending in ; outside $$ quoted bodies"""
+        statements, lines, quoted = [], [], False
+        for line in self.sql.splitlines():
+            if not quoted and line.strip().startswith("--"):
+                continue
+            lines.append(line)
+            quoted ^= line.count("$$") % 2 == 1
+            if not quoted and line.rstrip().endswith(";"):
+                statements.append("\n".join(lines).strip()[:-1])
+                lines = []
+        statement = "\n".join(lines).strip()
+        if statement:
+            statements.append(statement)
+        return [s.strip() for s in statements if s.strip()]
+
+
+def load_migrations(directory=MIGRATIONS_DIR) -> list:
+    """returns all migrations in version order"""
+    migrations = [
+        Migration(os.path.join(directory, file))
+        for file in os.listdir(directory)
+        if re.match(r"^\d+_.*\.sql$", file)
+    ]
+    migrations.sort(key=lambda m: m.version)
+
+    versions = [m.version for m in migrations]
+    if len(versions) != len(set(versions)):
+        raise ValueError(f"duplicate migration versions in {directory}")
+
+    return migrations
+
+
+def applied_versions(conn) -> set:
+    """versions recorded in schema_migrations"""
+    conn.execute(CREATE_SCHEMA_MIGRATIONS)
+    records = conn.execute("SELECT version FROM schema_migrations").fetchall()
+    return {record[0] for record in records}
+
+
+def apply(conn, migration):
+    """applies one migration and records its version (conn must be in autocommit)"""
+
+    logging.info(f"applying migration {migration.name}")
+    record = "INSERT INTO schema_migrations (version, name) VALUES (%s, %s)"
+
+    if migration.transactional:
+        with conn.transaction():
+            for statement in migration.statements():
+                conn.execute(statement)
+            conn.execute(record, (migration.version, migration.name))
+        return
+
+    # statements must be idempotent (IF NOT EXISTS) since a failure
+    # part way through leaves the earlier ones applied
+    for statement in migration.statements():
+        conn.execute(statement)
+    conn.execute(record, (migration.version, migration.name))
+
+
+def migrate(db: Database) -> list:
+    """applies pending migrations, returns the names applied"""
+
+    applied = []
+    with db.connect() as conn:
+        conn.autocommit = True
+        try:
+            done = applied_versions(conn)
+            for migration in load_migrations():
+                if migration.version in done:
+                    continue
+                apply(conn, migration)
+                applied.append(migration.name)
+        finally:
+            conn.autocommit = False
+
+    return applied
+
+
+def status(db: Database) -> list:
+    """returns (name, applied) for every migration"""
+
+    with db.connect() as conn:
+        done = applied_versions(conn)
+
+    return [(m.name, m.version in done) for m in load_migrations()]
+
+
+def main():
+    db = Database()
+    try:
+        if len(sys.argv) > 1 and sys.argv[1] == "status":
+            for name, applied in status(db):
+                print(f"{'applied' if applied else 'pending'}  {name}")
+            return
+
+        applied = migrate(db)
+        for name in applied:
+            print(f"applied  {name}")
+        if not applied:
+            print("database is up to date")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+-- voice mode columns and the settings table
+-- (previously applied ad hoc by iac/db-migrate.sh, safe to re-run)
+
+ALTER TABLE interview
+ADD COLUMN IF NOT EXISTS voice_mode BOOLEAN DEFAULT FALSE;
+
+ALTER TABLE interview
+ADD COLUMN IF NOT EXISTS voice_session_metadata JSONB DEFAULT '{}'::jsonb;
+
+CREATE INDEX IF NOT EXISTS idx_interview_voice_mode ON interview(voice_mode);
+
+CREATE INDEX IF NOT EXISTS idx_interview_voice_session_metadata ON interview USING GIN(voice_session_metadata);
+
+COMMENT ON COLUMN interview.voice_session_metadata IS 'JSON metadata for voice sessions including session IDs, connection status, audio quality metrics, and session timestamps';
+
+CREATE TABLE IF NOT EXISTS settings (
+  key VARCHAR(255) PRIMARY KEY,
+  value TEXT NOT NULL,
+  created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+  updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
+
+INSERT INTO settings (key, value) VALUES ('talk_mode_enabled', 'true')
+ON CONFLICT (key) DO NOTHING;
+
+COMMENT ON TABLE settings IS 'System-wide configuration settings stored as key-value pairs';
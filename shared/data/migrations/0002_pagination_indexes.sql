@@ -0,0 +1,14 @@
+-- migrate: no-transaction
+-- keyset pagination on (created, id), newest first
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_interview_created_id
+ON interview (created DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_interview_user_created_id
+ON interview (user_id, created DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_conversation_created_id
+ON conversation (created DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_conversation_user_created_id
+ON conversation (user_id, created DESC, id DESC);
@@ -0,0 +1,29 @@
+-- migrate: no-transaction
+-- indexes for the filters the web app and events lambda run on every request
+
+-- assigned interviews for a user (interview.list_available)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_interview_user_status
+ON interview (user_id, status);
+
+-- approved interviews for a topic, newest first (kb pages, events lambda)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_interview_topic_status_completed
+ON interview (topic_id, status, completed DESC);
+
+-- in-flight interviews per topic/user, the predicate must match CLOSED_STATUSES in queries.py
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_interview_inflight
+ON interview (topic_id, user_id)
+WHERE status NOT IN ('approved', 'rejected');
+
+-- review queue, the predicate must match REVIEW_STATUSES in queries.py
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_interview_review_queue
+ON interview (created DESC)
+WHERE status IN ('processing', 'pendingreview', 'reviewing');
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_topic_scope_created
+ON topic (scope_id, created DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_topic_name
+ON topic (name);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_conversation_scope_id
+ON conversation (scope_id);
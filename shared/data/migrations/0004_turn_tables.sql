@@ -0,0 +1,51 @@
+-- append-only turn storage: each chat question and interview answer
+-- writes its own row instead of rewriting the whole data document.
+-- existing transcripts are moved into the turn tables, so apply this
+-- together with the release that reads turns.
+
+CREATE TABLE IF NOT EXISTS conversation_turn (
+  conversation_id UUID NOT NULL REFERENCES conversation(id) ON DELETE CASCADE,
+  seq INTEGER NOT NULL,
+  created TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+  q VARCHAR NOT NULL,
+  a VARCHAR,
+  PRIMARY KEY (conversation_id, seq)
+);
+
+CREATE TABLE IF NOT EXISTS interview_turn (
+  interview_id UUID NOT NULL REFERENCES interview(id) ON DELETE CASCADE,
+  seq INTEGER NOT NULL,
+  created TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+  q VARCHAR NOT NULL,
+  a VARCHAR,
+  PRIMARY KEY (interview_id, seq)
+);
+
+-- conversation.data keeps the conversation header, questions become turns
+INSERT INTO conversation_turn (conversation_id, seq, created, q, a)
+SELECT c.id, t.ord - 1,
+       COALESCE((t.turn->>'created')::timestamptz, c.created),
+       COALESCE(t.turn->>'q', ''),
+       t.turn->>'a'
+FROM conversation c,
+     jsonb_array_elements(c.data->'questions') WITH ORDINALITY AS t(turn, ord)
+WHERE jsonb_typeof(c.data->'questions') = 'array'
+ON CONFLICT DO NOTHING;
+
+UPDATE conversation
+SET data = data - 'questions'
+WHERE data ? 'questions';
+
+-- interview.data was the question list itself
+INSERT INTO interview_turn (interview_id, seq, created, q, a)
+SELECT i.id, t.ord - 1, i.created,
+       COALESCE(t.turn->>'q', ''),
+       t.turn->>'a'
+FROM interview i,
+     jsonb_array_elements(i.data) WITH ORDINALITY AS t(turn, ord)
+WHERE jsonb_typeof(i.data) = 'array'
+ON CONFLICT DO NOTHING;
+
+UPDATE interview
+SET data = NULL
+WHERE data IS NOT NULL;
@@ -0,0 +1,22 @@
+-- scope and topic changes notify the catalog cache in every process
+-- (see ChangeListener in shared/data/database.py). the triggers are
+-- statement level so a bulk change sends a single notification.
+
+CREATE OR REPLACE FUNCTION notify_catalog_changed() RETURNS trigger AS $$
+BEGIN
+  PERFORM pg_notify('catalog_changed', TG_TABLE_NAME);
+  RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS scope_catalog_changed ON scope;
+
+CREATE TRIGGER scope_catalog_changed
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON scope
+FOR EACH STATEMENT EXECUTE FUNCTION notify_catalog_changed();
+
+DROP TRIGGER IF EXISTS topic_catalog_changed ON topic;
+
+CREATE TRIGGER topic_catalog_changed
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON topic
+FOR EACH STATEMENT EXECUTE FUNCTION notify_catalog_changed();
@@ -0,0 +1,25 @@
+-- the current knowledge base document for each topic, written by the
+-- events lambda when an interview is approved. readers look up a topic's
+-- document by primary key instead of sorting its approved interviews.
+
+CREATE TABLE IF NOT EXISTS kb_document (
+  topic_id UUID PRIMARY KEY REFERENCES topic(id) ON DELETE CASCADE,
+  interview_id UUID NOT NULL REFERENCES interview(id) ON DELETE CASCADE,
+  s3_key VARCHAR NOT NULL,
+  version INTEGER NOT NULL DEFAULT 1,
+  approved_on TIMESTAMP WITH TIME ZONE,
+  updated TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
+
+-- existing documents, keys follow shared/s3.get_interview_document_key
+INSERT INTO kb_document (topic_id, interview_id, s3_key, version, approved_on)
+SELECT DISTINCT ON (i.topic_id)
+       i.topic_id, i.id,
+       'kb/' || lower(replace(btrim(t.name), ' ', '-')) || '/' || i.id || '.pdf',
+       count(*) OVER (PARTITION BY i.topic_id),
+       i.approved_on
+FROM interview i
+JOIN topic t ON i.topic_id = t.id
+WHERE i.status = 'approved'
+ORDER BY i.topic_id, i.completed DESC
+ON CONFLICT (topic_id) DO NOTHING;
@@ -0,0 +1,17 @@
+-- full-text search over interview transcripts, interview summaries and
+-- chat conversations (see search.local in shared/data/queries.py).
+-- the tsvectors are generated columns so every write keeps them current.
+-- adding them rewrites the tables, the GIN indexes follow in 0008.
+
+ALTER TABLE interview_turn ADD COLUMN IF NOT EXISTS search tsvector
+GENERATED ALWAYS AS (
+  to_tsvector('english', COALESCE(q, '') || ' ' || COALESCE(a, ''))
+) STORED;
+
+ALTER TABLE interview ADD COLUMN IF NOT EXISTS summary_search tsvector
+GENERATED ALWAYS AS (to_tsvector('english', COALESCE(summary, ''))) STORED;
+
+ALTER TABLE conversation_turn ADD COLUMN IF NOT EXISTS search tsvector
+GENERATED ALWAYS AS (
+  to_tsvector('english', COALESCE(q, '') || ' ' || COALESCE(a, ''))
+) STORED;
@@ -0,0 +1,11 @@
+-- migrate: no-transaction
+-- GIN indexes for the search columns added in 0007
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_interview_turn_search
+ON interview_turn USING GIN (search);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_interview_summary_search
+ON interview USING GIN (summary_search);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_conversation_turn_search
+ON conversation_turn USING GIN (search);
@@ -0,0 +1,70 @@
+-- interview counts per topic and status for the admin dashboard, kept
+-- current by a trigger on every insert, delete and status change so the
+-- dashboard never scans interview. the approved row also accumulates
+-- time from creation to approval for the average time-to-approval.
+
+CREATE TABLE IF NOT EXISTS interview_stats (
+  topic_id UUID NOT NULL REFERENCES topic(id) ON DELETE CASCADE,
+  status VARCHAR NOT NULL,
+  count INTEGER NOT NULL DEFAULT 0,
+  approvals INTEGER NOT NULL DEFAULT 0,
+  approval_seconds DOUBLE PRECISION NOT NULL DEFAULT 0,
+  PRIMARY KEY (topic_id, status)
+);
+
+CREATE OR REPLACE FUNCTION count_interview_stats() RETURNS trigger AS $$
+BEGIN
+  IF TG_OP <> 'INSERT' THEN
+    UPDATE interview_stats
+    SET count = count - 1,
+        approvals = approvals - CASE
+          WHEN OLD.status = 'approved' AND OLD.approved_on IS NOT NULL THEN 1 ELSE 0 END,
+        approval_seconds = approval_seconds - CASE
+          WHEN OLD.status = 'approved' AND OLD.approved_on IS NOT NULL
+          THEN extract(epoch FROM OLD.approved_on - OLD.created) ELSE 0 END
+    WHERE topic_id = OLD.topic_id AND status = OLD.status;
+  END IF;
+  IF TG_OP <> 'DELETE' THEN
+    INSERT INTO interview_stats (topic_id, status, count, approvals, approval_seconds)
+    VALUES (
+      NEW.topic_id, NEW.status, 1,
+      CASE WHEN NEW.status = 'approved' AND NEW.approved_on IS NOT NULL THEN 1 ELSE 0 END,
+      CASE WHEN NEW.status = 'approved' AND NEW.approved_on IS NOT NULL
+           THEN extract(epoch FROM NEW.approved_on - NEW.created) ELSE 0 END)
+    ON CONFLICT (topic_id, status) DO UPDATE
+    SET count = interview_stats.count + 1,
+        approvals = interview_stats.approvals + EXCLUDED.approvals,
+        approval_seconds = interview_stats.approval_seconds + EXCLUDED.approval_seconds;
+  END IF;
+  RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS interview_stats_insert_delete ON interview;
+
+CREATE TRIGGER interview_stats_insert_delete
+AFTER INSERT OR DELETE ON interview
+FOR EACH ROW EXECUTE FUNCTION count_interview_stats();
+
+DROP TRIGGER IF EXISTS interview_stats_update ON interview;
+
+CREATE TRIGGER interview_stats_update
+AFTER UPDATE OF topic_id, status, approved_on, created ON interview
+FOR EACH ROW
+WHEN (OLD.topic_id IS DISTINCT FROM NEW.topic_id
+      OR OLD.status IS DISTINCT FROM NEW.status
+      OR OLD.approved_on IS DISTINCT FROM NEW.approved_on
+      OR OLD.created IS DISTINCT FROM NEW.created)
+EXECUTE FUNCTION count_interview_stats();
+
+-- CREATE TRIGGER holds a lock that blocks interview writes until this
+-- migration commits, so the backfill and the trigger can't overlap
+DELETE FROM interview_stats;
+
+INSERT INTO interview_stats (topic_id, status, count, approvals, approval_seconds)
+SELECT topic_id, status, count(*),
+       count(*) FILTER (WHERE status = 'approved' AND approved_on IS NOT NULL),
+       COALESCE(sum(extract(epoch FROM approved_on - created))
+                FILTER (WHERE status = 'approved' AND approved_on IS NOT NULL), 0)
+FROM interview
+GROUP BY topic_id, status;
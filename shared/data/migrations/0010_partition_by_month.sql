@@ -0,0 +1,215 @@
+-- conversation and interview become partitioned by created month, so old
+-- months can be exported to S3 and dropped (python -m shared.data.archive).
+-- each table is rebuilt by a single DO block, which keeps the conversion
+-- atomic through the Data API as well. both tables are rewritten under an
+-- exclusive lock, apply this in a maintenance window.
+--
+-- a partitioned table's unique constraints must include the partition key,
+-- so the primary keys become (id, created) and lookups by id probe each
+-- partition's primary key index. the turn tables and kb_document can't
+-- reference the tables any more, the archive job removes an archived
+-- month's turns itself.
+
+-- creates parent's partition for the month containing day (UTC),
+-- named <parent>_yyyy_mm, and returns its name
+CREATE OR REPLACE FUNCTION create_month_partition(parent TEXT, day DATE) RETURNS TEXT AS $$
+DECLARE
+  month_start DATE := date_trunc('month', day)::date;
+  partition_name TEXT := parent || '_' || to_char(month_start, 'YYYY_MM');
+BEGIN
+  IF to_regclass(partition_name) IS NULL THEN
+    EXECUTE format(
+      'CREATE TABLE %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+      partition_name, parent,
+      month_start::timestamp AT TIME ZONE 'UTC',
+      (month_start + INTERVAL '1 month')::timestamp AT TIME ZONE 'UTC');
+  END IF;
+  RETURN partition_name;
+END
+$$ LANGUAGE plpgsql;
+
+-- months that were exported and dropped, and the ids they held, so
+-- Database.get() and get_interview() can find archived records
+CREATE TABLE IF NOT EXISTS archived_partition (
+  kind VARCHAR NOT NULL,
+  month DATE NOT NULL,
+  location VARCHAR NOT NULL,
+  row_count INTEGER NOT NULL,
+  archived_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+  PRIMARY KEY (kind, month)
+);
+
+CREATE TABLE IF NOT EXISTS archived_record (
+  kind VARCHAR NOT NULL,
+  id UUID NOT NULL,
+  month DATE NOT NULL,
+  PRIMARY KEY (kind, id)
+);
+
+DO $$
+DECLARE
+  fk RECORD;
+  m DATE;
+BEGIN
+  IF EXISTS (SELECT 1 FROM pg_partitioned_table
+             WHERE partrelid = 'conversation'::regclass) THEN
+    RETURN;
+  END IF;
+
+  FOR fk IN SELECT conrelid::regclass AS tbl, conname FROM pg_constraint
+            WHERE contype = 'f' AND confrelid = 'conversation'::regclass LOOP
+    EXECUTE format('ALTER TABLE %s DROP CONSTRAINT %I', fk.tbl, fk.conname);
+  END LOOP;
+
+  ALTER TABLE conversation RENAME TO conversation_unpartitioned;
+  ALTER TABLE conversation_unpartitioned
+    RENAME CONSTRAINT conversation_pkey TO conversation_unpartitioned_pkey;
+
+  CREATE TABLE conversation (
+    id UUID NOT NULL,
+    created TIMESTAMP WITH TIME ZONE NOT NULL,
+    scope_id UUID REFERENCES scope(id),
+    user_id VARCHAR NOT NULL,
+    data JSONB,
+    summary VARCHAR,
+    PRIMARY KEY (id, created)
+  ) PARTITION BY RANGE (created);
+
+  -- catches rows outside the monthly partitions (created before the
+  -- first one, or past the months the archive job creates ahead)
+  CREATE TABLE conversation_default PARTITION OF conversation DEFAULT;
+
+  -- every month with data, plus 3 ahead (PARTITION_MONTHS_AHEAD)
+  FOR m IN
+    SELECT generate_series(
+             date_trunc('month', COALESCE(min(created), now()) AT TIME ZONE 'UTC'),
+             date_trunc('month', now() AT TIME ZONE 'UTC') + INTERVAL '3 months',
+             INTERVAL '1 month')::date
+    FROM conversation_unpartitioned
+  LOOP
+    PERFORM create_month_partition('conversation', m);
+  END LOOP;
+
+  INSERT INTO conversation (id, created, scope_id, user_id, data, summary)
+  SELECT id, created, scope_id, user_id, data, summary
+  FROM conversation_unpartitioned;
+
+  DROP TABLE conversation_unpartitioned;
+
+  CREATE INDEX idx_conversation_created_id
+  ON conversation (created DESC, id DESC);
+
+  CREATE INDEX idx_conversation_user_created_id
+  ON conversation (user_id, created DESC, id DESC);
+
+  CREATE INDEX idx_conversation_scope_id
+  ON conversation (scope_id);
+END
+$$;
+
+DO $$
+DECLARE
+  fk RECORD;
+  m DATE;
+BEGIN
+  IF EXISTS (SELECT 1 FROM pg_partitioned_table
+             WHERE partrelid = 'interview'::regclass) THEN
+    RETURN;
+  END IF;
+
+  FOR fk IN SELECT conrelid::regclass AS tbl, conname FROM pg_constraint
+            WHERE contype = 'f' AND confrelid = 'interview'::regclass LOOP
+    EXECUTE format('ALTER TABLE %s DROP CONSTRAINT %I', fk.tbl, fk.conname);
+  END LOOP;
+
+  ALTER TABLE interview RENAME TO interview_unpartitioned;
+  ALTER TABLE interview_unpartitioned
+    RENAME CONSTRAINT interview_pkey TO interview_unpartitioned_pkey;
+
+  CREATE TABLE interview (
+    id UUID NOT NULL,
+    created TIMESTAMP WITH TIME ZONE NOT NULL,
+    topic_id UUID REFERENCES topic(id) NOT NULL,
+    user_id VARCHAR,
+    status VARCHAR NOT NULL,
+    data JSONB,
+    completed TIMESTAMP WITH TIME ZONE,
+    summary VARCHAR,
+    approved_by_user_id VARCHAR,
+    approved_on TIMESTAMP WITH TIME ZONE,
+    voice_mode BOOLEAN DEFAULT FALSE,
+    voice_session_metadata JSONB DEFAULT '{}'::jsonb,
+    summary_search tsvector
+      GENERATED ALWAYS AS (to_tsvector('english', COALESCE(summary, ''))) STORED,
+    PRIMARY KEY (id, created)
+  ) PARTITION BY RANGE (created);
+
+  CREATE TABLE interview_default PARTITION OF interview DEFAULT;
+
+  FOR m IN
+    SELECT generate_series(
+             date_trunc('month', COALESCE(min(created), now()) AT TIME ZONE 'UTC'),
+             date_trunc('month', now() AT TIME ZONE 'UTC') + INTERVAL '3 months',
+             INTERVAL '1 month')::date
+    FROM interview_unpartitioned
+  LOOP
+    PERFORM create_month_partition('interview', m);
+  END LOOP;
+
+  -- the interview_stats triggers go with the old table and are created
+  -- again below, after the copy, so the counters are left as they are
+  INSERT INTO interview (id, created, topic_id, user_id, status, data,
+                         completed, summary, approved_by_user_id, approved_on,
+                         voice_mode, voice_session_metadata)
+  SELECT id, created, topic_id, user_id, status, data,
+         completed, summary, approved_by_user_id, approved_on,
+         voice_mode, voice_session_metadata
+  FROM interview_unpartitioned;
+
+  DROP TABLE interview_unpartitioned;
+
+  COMMENT ON COLUMN interview.voice_session_metadata IS 'JSON metadata for voice sessions including session IDs, connection status, audio quality metrics, and session timestamps';
+
+  CREATE INDEX idx_interview_voice_mode ON interview (voice_mode);
+
+  CREATE INDEX idx_interview_voice_session_metadata
+  ON interview USING GIN (voice_session_metadata);
+
+  CREATE INDEX idx_interview_created_id
+  ON interview (created DESC, id DESC);
+
+  CREATE INDEX idx_interview_user_created_id
+  ON interview (user_id, created DESC, id DESC);
+
+  CREATE INDEX idx_interview_user_status
+  ON interview (user_id, status);
+
+  CREATE INDEX idx_interview_topic_status_completed
+  ON interview (topic_id, status, completed DESC);
+
+  CREATE INDEX idx_interview_inflight
+  ON interview (topic_id, user_id)
+  WHERE status NOT IN ('approved', 'rejected');
+
+  CREATE INDEX idx_interview_review_queue
+  ON interview (created DESC)
+  WHERE status IN ('processing', 'pendingreview', 'reviewing');
+
+  CREATE INDEX idx_interview_summary_search
+  ON interview USING GIN (summary_search);
+
+  -- archived months keep their counts, detaching doesn't fire the triggers
+  CREATE TRIGGER interview_stats_insert_delete
+  AFTER INSERT OR DELETE ON interview
+  FOR EACH ROW EXECUTE FUNCTION count_interview_stats();
+
+  CREATE TRIGGER interview_stats_update
+  AFTER UPDATE OF topic_id, status, approved_on, created ON interview
+  FOR EACH ROW
+  WHEN (OLD.topic_id IS DISTINCT FROM NEW.topic_id
+        OR OLD.status IS DISTINCT FROM NEW.status
+        OR OLD.approved_on IS DISTINCT FROM NEW.approved_on
+        OR OLD.created IS DISTINCT FROM NEW.created)
+  EXECUTE FUNCTION count_interview_stats();
+END
+$$;
@@ -0,0 +1,48 @@
+-- keeps large payloads out of the interview and conversation heaps, so the
+-- status and list queries read only the small columns. the payloads are
+-- compressed with lz4 instead of pglz, and a row is toasted once it's over
+-- 256 bytes instead of about 2 KB: summaries, voice session metadata and
+-- the summary's tsvector move out of line, and are only read by the queries
+-- that select them (see INTERVIEW_HEADER_COLUMNS in shared/data/queries.py).
+-- both settings apply to rows as they're written, existing rows move when
+-- they're next updated. python -m shared.data.payloadbench compares the two.
+
+ALTER TABLE interview ALTER COLUMN summary SET COMPRESSION lz4;
+
+ALTER TABLE interview ALTER COLUMN voice_session_metadata SET COMPRESSION lz4;
+
+ALTER TABLE interview ALTER COLUMN summary_search SET COMPRESSION lz4;
+
+ALTER TABLE interview ALTER COLUMN data SET COMPRESSION lz4;
+
+ALTER TABLE conversation ALTER COLUMN data SET COMPRESSION lz4;
+
+ALTER TABLE conversation ALTER COLUMN summary SET COMPRESSION lz4;
+
+-- storage parameters are set per partition, new partitions get them here
+CREATE OR REPLACE FUNCTION create_month_partition(parent TEXT, day DATE) RETURNS TEXT AS $$
+DECLARE
+  month_start DATE := date_trunc('month', day)::date;
+  partition_name TEXT := parent || '_' || to_char(month_start, 'YYYY_MM');
+BEGIN
+  IF to_regclass(partition_name) IS NULL THEN
+    EXECUTE format(
+      'CREATE TABLE %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L) WITH (toast_tuple_target = 256)',
+      partition_name, parent,
+      month_start::timestamp AT TIME ZONE 'UTC',
+      (month_start + INTERVAL '1 month')::timestamp AT TIME ZONE 'UTC');
+  END IF;
+  RETURN partition_name;
+END
+$$ LANGUAGE plpgsql;
+
+DO $$
+DECLARE
+  p RECORD;
+BEGIN
+  FOR p IN SELECT inhrelid::regclass AS partition FROM pg_inherits
+           WHERE inhparent IN ('interview'::regclass, 'conversation'::regclass) LOOP
+    EXECUTE format('ALTER TABLE %s SET (toast_tuple_target = 256)', p.partition);
+  END LOOP;
+END
+$$;
@@ -0,0 +1,44 @@
+-- the archive job detaches old months with DETACH PARTITION ... CONCURRENTLY
+-- so it never blocks the tables, which Postgres refuses while a table has a
+-- default partition. the default partitions go, and any rows they hold move
+-- to monthly partitions of their own. they're deleted and inserted again,
+-- so the interview_stats triggers leave the counters as they are.
+--
+-- without a default partition, a row can only be written for a month that
+-- has a partition: Database creates this month's and next month's before
+-- it writes a conversation or an interview (see _ensure_partitions), and
+-- python -m shared.data.archive creates them PARTITION_MONTHS_AHEAD ahead.
+
+DO $$
+DECLARE
+  t TEXT;
+  m DATE;
+  col_list TEXT;
+BEGIN
+  FOREACH t IN ARRAY ARRAY['conversation', 'interview'] LOOP
+    CONTINUE WHEN to_regclass(t || '_default') IS NULL;
+
+    -- generated columns (interview.summary_search) are computed again
+    SELECT string_agg(quote_ident(attname), ', ' ORDER BY attnum) INTO col_list
+    FROM pg_attribute
+    WHERE attrelid = t::regclass AND attnum > 0
+    AND NOT attisdropped AND attgenerated = '';
+
+    EXECUTE format('CREATE TEMP TABLE default_rows AS SELECT %s FROM %I WITH NO DATA',
+                   col_list, t);
+    EXECUTE format(
+      'WITH moved AS (DELETE FROM %I RETURNING %s) INSERT INTO default_rows SELECT * FROM moved',
+      t || '_default', col_list);
+    EXECUTE format('DROP TABLE %I', t || '_default');
+
+    FOR m IN EXECUTE 'SELECT DISTINCT date_trunc(''month'', created AT TIME ZONE ''UTC'')::date
+                      FROM default_rows' LOOP
+      PERFORM create_month_partition(t, m);
+    END LOOP;
+
+    EXECUTE format('INSERT INTO %I (%s) SELECT %s FROM default_rows',
+                   t, col_list, col_list);
+    EXECUTE 'DROP TABLE default_rows';
+  END LOOP;
+END
+$$;
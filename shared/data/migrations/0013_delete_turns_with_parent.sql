@@ -0,0 +1,42 @@
+-- the turn tables and kb_document lost their ON DELETE CASCADE foreign keys
+-- when conversation and interview were partitioned (0010). these triggers
+-- delete a conversation's or an interview's turns (and an interview's kb
+-- document) with it instead, once per statement from its deleted rows.
+-- dropping an archived month's partition doesn't fire them, the archive
+-- job deletes that month's turns itself.
+
+CREATE OR REPLACE FUNCTION delete_conversation_turns() RETURNS trigger AS $$
+BEGIN
+  DELETE FROM conversation_turn ct
+  USING deleted_conversation d
+  WHERE ct.conversation_id = d.id;
+  RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS conversation_delete_turns ON conversation;
+
+CREATE TRIGGER conversation_delete_turns
+AFTER DELETE ON conversation
+REFERENCING OLD TABLE AS deleted_conversation
+FOR EACH STATEMENT EXECUTE FUNCTION delete_conversation_turns();
+
+CREATE OR REPLACE FUNCTION delete_interview_turns() RETURNS trigger AS $$
+BEGIN
+  DELETE FROM interview_turn it
+  USING deleted_interview d
+  WHERE it.interview_id = d.id;
+  DELETE FROM kb_document kd
+  USING deleted_interview d
+  WHERE kd.interview_id = d.id;
+  RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS interview_delete_turns ON interview;
+
+CREATE TRIGGER interview_delete_turns
+AFTER DELETE ON interview
+REFERENCING OLD TABLE AS deleted_interview
+FOR EACH STATEMENT EXECUTE FUNCTION delete_interview_turns();
+
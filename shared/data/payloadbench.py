@@ -0,0 +1,194 @@
+"""
+Benchmarks interview heap size, buffer hits and list latency under the
+payload storage settings of migrations/0011_payload_storage.sql.
+
+usage (from web/ or events/, against a local database only):
+    python -m shared.data.payloadbench [rows]     default: 20000
+
+The same synthetic interviews, each with a summary and voice session
+metadata of about a kilobyte, are loaded into two scratch copies of the
+interview table: "before" with Postgres' default storage (pglz, rows toasted
+from about 2 KB) and "after" with the migration's (lz4, rows toasted from
+256 bytes). For each copy the heap and toast sizes are reported, and the
+shared buffers and median latency of a list page of header columns, the
+same page with every column, and the per-status counts. The scratch tables
+are dropped afterwards.
+"""
+import sys
+import json
+import time
+import statistics
+
+from psycopg import sql
+
+from shared.config import config
+from shared.data.database import Database
+
+RUNS = 20
+
+SCRATCH_PREFIX = "payloadbench"
+
+# copy name: (storage parameters, columns compressed with lz4)
+COPIES = {
+    "before": ("", ()),
+    "after": (" WITH (toast_tuple_target = 256)",
+              ("summary", "voice_session_metadata", "summary_search", "data")),
+}
+
+CREATE = """
+    CREATE TABLE {table}
+    (LIKE interview INCLUDING DEFAULTS INCLUDING GENERATED){options}
+"""
+
+SEED = """
+    INSERT INTO {table} (id, created, topic_id, user_id, status, completed,
+                         summary, voice_mode, voice_session_metadata)
+    SELECT gen_random_uuid(), now() - g * interval '1 minute', gen_random_uuid(),
+           'payloadbench-user-' || (g %% 500),
+           (ARRAY['notstarted', 'started', 'processing', 'pendingreview',
+                  'reviewing', 'approved', 'rejected'])[1 + g %% 7],
+           now() - g * interval '1 minute' + interval '30 minutes',
+           (SELECT string_agg(md5(g || '-' || n), ' ')
+            FROM generate_series(1, 32) n),
+           true,
+           jsonb_build_object(
+               'session_id', md5(g::text),
+               'sessions', (SELECT jsonb_agg(jsonb_build_object(
+                                'id', md5(n || '-' || g),
+                                'status', 'closed',
+                                'started_at', now() - n * interval '1 minute'))
+                            FROM generate_series(1, 8) n))
+    FROM generate_series(1, %(rows)s) g
+"""
+
+SIZES = """
+    SELECT pg_relation_size(c.oid), pg_relation_size(c.reltoastrelid)
+    FROM pg_class c
+    WHERE c.oid = %s::regclass
+"""
+
+# header columns as selected by INTERVIEW_HEADER_COLUMNS (without the joins)
+HEADER_COLUMNS = """
+    id, created, user_id, topic_id, status, completed,
+    approved_by_user_id, approved_on, voice_mode
+"""
+
+QUERIES = [
+    ("list page", f"""
+        SELECT {HEADER_COLUMNS} FROM {{table}}
+        ORDER BY created DESC, id DESC LIMIT 100"""),
+    ("list page, all columns", """
+        SELECT * FROM {table}
+        ORDER BY created DESC, id DESC LIMIT 100"""),
+    ("status counts", """
+        SELECT status, count(*) FROM {table} GROUP BY status"""),
+]
+
+
+def scratch(copy) -> sql.Identifier:
+    """the scratch table for copy"""
+    return sql.Identifier(f"{SCRATCH_PREFIX}_{copy}")
+
+
+def timed(fn) -> float:
+    """median milliseconds over RUNS calls"""
+    samples = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def buffers(conn, query) -> int:
+    """shared buffers hit or read running query, including detoasting its output"""
+    # SERIALIZE (Postgres 17+) detoasts the result as if it were sent
+    serialize = ", SERIALIZE" if conn.info.server_version >= 170000 else ""
+    explain = sql.SQL("EXPLAIN (ANALYZE, BUFFERS{}, FORMAT JSON) ").format(
+        sql.SQL(serialize))
+    record = conn.execute(explain + query).fetchone()
+    plan = record[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    plan = plan[0]
+    total = plan["Plan"]["Shared Hit Blocks"] + plan["Plan"]["Shared Read Blocks"]
+    if "Serialization" in plan:
+        total += plan["Serialization"].get("Shared Hit Blocks", 0)
+        total += plan["Serialization"].get("Shared Read Blocks", 0)
+    return total
+
+
+def seed(conn, copy, rows):
+    """creates and fills the scratch copy"""
+    options, compressed = COPIES[copy]
+    table = scratch(copy)
+    conn.execute(sql.SQL(CREATE).format(table=table, options=sql.SQL(options)))
+    for column in compressed:
+        conn.execute(sql.SQL("ALTER TABLE {} ALTER COLUMN {} SET COMPRESSION lz4").format(
+            table, sql.Identifier(column)))
+    conn.execute(sql.SQL(SEED).format(table=table), {"rows": rows})
+    conn.execute(sql.SQL("CREATE INDEX ON {} (created DESC, id DESC)").format(table))
+    conn.execute(sql.SQL("VACUUM ANALYZE {}").format(table))
+
+
+def run(db: Database, rows) -> dict:
+    """returns {copy: {"heap": bytes, "toast": bytes, query name: (buffers, ms)}}"""
+
+    results = {}
+    with db.connect() as conn:
+        # VACUUM can't run in a transaction
+        conn.autocommit = True
+        try:
+            for copy in COPIES:
+                seed(conn, copy, rows)
+
+                result = results[copy] = {}
+                name = f"{SCRATCH_PREFIX}_{copy}"
+                result["heap"], result["toast"] = conn.execute(
+                    SIZES, (name,)).fetchone()
+                for label, text in QUERIES:
+                    query = sql.SQL(text).format(table=scratch(copy))
+                    conn.execute(query).fetchall()
+                    result[label] = (
+                        buffers(conn, query),
+                        timed(lambda: conn.execute(query).fetchall()),
+                    )
+        finally:
+            for copy in COPIES:
+                conn.execute(sql.SQL("DROP TABLE IF EXISTS {}").format(scratch(copy)))
+            conn.autocommit = False
+
+    return results
+
+
+def main():
+    if config.postgres_secret_arn:
+        sys.exit("payloadbench only runs against a local database")
+
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    db = Database()
+    try:
+        results = run(db, rows)
+    finally:
+        db.close()
+
+    mb = 1024 * 1024
+    print(f"{rows} interviews")
+    print(f"{'':<24}  {'before':>10}  {'after':>10}")
+    for key, label in (("heap", "heap MB"), ("toast", "toast MB")):
+        print(f"{label:<24}  {results['before'][key] / mb:>10.2f}  "
+              f"{results['after'][key] / mb:>10.2f}")
+
+    print()
+    print(f"{'':<24}  {'buffers':>21}  {'median ms':>21}")
+    print(f"{'query':<24}  {'before':>10} {'after':>10}  {'before':>10} {'after':>10}")
+    for label, _ in QUERIES:
+        before_buffers, before_ms = results["before"][label]
+        after_buffers, after_ms = results["after"][label]
+        print(f"{label:<24}  {before_buffers:>10} {after_buffers:>10}  "
+              f"{before_ms:>10.2f} {after_ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+"""
+Query plan regression check for the hot Database queries.
+
+usage (from web/ or events/, against a local database only):
+    python -m shared.data.plancheck seed [interviews]   seed synthetic rows (default 100000)
+    python -m shared.data.plancheck                     check plans, exits 1 on a regression
+    python -m shared.data.plancheck clean               delete the seeded rows
+
+Each hot query is EXPLAINed with parameters taken from the data and fails
+the check if the planner falls back to a sequential scan of the table the
+query filters on. Seed first so the tables are big enough for the planner
+to prefer the indexes from shared/data/migrations.
+"""
+import sys
+import json
+
+from shared.config import config
+from shared.data import registry
+from shared.data.database import Database
+
+SEED_PREFIX = "plancheck"
+
+SEED_SCOPES = """
+    INSERT INTO scope (id, created, name, description)
+    SELECT gen_random_uuid(), now() - g * interval '1 day',
+           %(prefix)s || ' scope ' || g, ''
+    FROM generate_series(1, %(scopes)s) g
+"""
+
+SEED_TOPICS = """
+    WITH s AS (
+        SELECT array_agg(id) AS ids FROM scope WHERE name LIKE %(prefix)s || ' %%'
+    )
+    INSERT INTO topic (id, created, scope_id, name, description, areas)
+    SELECT gen_random_uuid(), now() - g * interval '1 hour',
+           s.ids[1 + g %% array_length(s.ids, 1)],
+           %(prefix)s || ' topic ' || g, '', '["area"]'::jsonb
+    FROM s, generate_series(1, %(topics)s) g
+"""
+
+# the seeded rows go back about interviews minutes, into months that may
+# not have partitions yet
+SEED_PARTITIONS = """
+    SELECT create_month_partition(t, m::date)
+    FROM unnest(ARRAY['conversation', 'interview']) t,
+         generate_series(
+             date_trunc('month', (now() AT TIME ZONE 'UTC') - %(interviews)s * interval '1 minute'),
+             now() AT TIME ZONE 'UTC', interval '1 month') m
+"""
+
+SEED_INTERVIEWS = """
+    WITH t AS (
+        SELECT array_agg(id) AS ids FROM topic WHERE name LIKE %(prefix)s || ' %%'
+    )
+    INSERT INTO interview (id, created, topic_id, user_id, status,
+                           completed, summary, voice_mode, voice_session_metadata)
+    SELECT gen_random_uuid(), now() - g * interval '1 minute',
+           t.ids[1 + g %% array_length(t.ids, 1)],
+           %(prefix)s || '-user-' || (g %% %(users)s),
+           CASE g %% 20
+               WHEN 0 THEN 'notstarted' WHEN 1 THEN 'started'
+               WHEN 2 THEN 'processing' WHEN 3 THEN 'pendingreview'
+               WHEN 4 THEN 'reviewing' WHEN 5 THEN 'rejected'
+               ELSE 'approved'
+           END,
+           now() - g * interval '1 minute' + interval '30 minutes',
+           '', false, '{}'::jsonb
+    FROM t, generate_series(1, %(interviews)s) g
+"""
+
+SEED_CONVERSATIONS = """
+    INSERT INTO conversation (id, created, user_id, data, summary)
+    SELECT gen_random_uuid(), now() - g * interval '1 minute',
+           %(prefix)s || '-user-' || (g %% %(users)s),
+           '{}'::jsonb, ''
+    FROM generate_series(1, %(interviews)s) g
+"""
+
+SEED_INTERVIEW_TURNS = """
+    INSERT INTO interview_turn (interview_id, seq, q, a)
+    SELECT i.id, n, 'question ' || n, 'answer'
+    FROM interview i, generate_series(0, %(turns)s - 1) n
+    WHERE i.user_id LIKE %(prefix)s || '-user-%%'
+"""
+
+SEED_CONVERSATION_TURNS = """
+    INSERT INTO conversation_turn (conversation_id, seq, q, a)
+    SELECT c.id, n, 'question ' || n, 'answer'
+    FROM conversation c, generate_series(0, %(turns)s - 1) n
+    WHERE c.user_id LIKE %(prefix)s || '-user-%%'
+"""
+
+SEED_KB_DOCUMENTS = """
+    INSERT INTO kb_document (topic_id, interview_id, s3_key, approved_on)
+    SELECT DISTINCT ON (i.topic_id) i.topic_id, i.id, 'kb/' || i.id || '.pdf', i.completed
+    FROM interview i
+    WHERE i.user_id LIKE %(prefix)s || '-user-%%' AND i.status = 'approved'
+    ORDER BY i.topic_id, i.completed DESC
+    ON CONFLICT (topic_id) DO NOTHING
+"""
+
+# seeded rows are found by their prefix, deleting an interview or a
+# conversation deletes its turns and kb document (migrations/0013)
+CLEAN = {
+    "interview": "DELETE FROM interview WHERE user_id LIKE %(prefix)s || '-user-%%'",
+    "conversation": "DELETE FROM conversation WHERE user_id LIKE %(prefix)s || '-user-%%'",
+    "topic": "DELETE FROM topic WHERE name LIKE %(prefix)s || ' topic %%'",
+    "scope": "DELETE FROM scope WHERE name LIKE %(prefix)s || ' scope %%'",
+}
+
+# a partitioned table's partitions that hold rows, empty ones (months
+# created ahead) are cheapest to scan sequentially and aren't regressions
+PARTITIONS_WITH_ROWS = """
+    SELECT c.relname
+    FROM pg_inherits inh
+    JOIN pg_class c ON c.oid = inh.inhrelid
+    WHERE inh.inhparent = %s::regclass AND c.reltuples > 0
+"""
+
+SAMPLE = """
+    SELECT i.id, i.user_id, i.topic_id, i.created, t.scope_id, t.name
+    FROM interview i JOIN topic t ON i.topic_id = t.id
+    ORDER BY i.created DESC
+    OFFSET 1000 LIMIT 1
+"""
+
+# a term the seed data doesn't contain, search must probe the GIN indexes for it
+SEARCH_PARAMS = {"text": "zymurgy", "interviews": True,
+                 "conversations": True, "limit": 11}
+
+# (query name, table it must reach through an index, parameters from the sample row)
+HOT_QUERIES = [
+    ("interview.get_by_id", "interview", lambda s: (s["id"],)),
+    ("interview.get_header_by_id", "interview", lambda s: (s["id"],)),
+    ("interview.list", "interview", lambda s: (100,)),
+    ("interview.list_after", "interview",
+     lambda s: (s["created"], s["id"], 100)),
+    ("interview.list_by_user", "interview", lambda s: (s["user_id"], 10)),
+    ("interview.list_available", "interview",
+     lambda s: (s["user_id"], "notstarted", "started")),
+    ("interview.list_approved_by_topic", "interview",
+     lambda s: (s["topic_id"], "approved")),
+    ("interview.get_latest_approved", "interview",
+     lambda s: (s["topic_id"], "approved")),
+    ("interview.get_inflight_by_user_topic", "interview",
+     lambda s: (s["user_id"], s["topic_id"])),
+    ("interview.list_inflight_by_topic", "interview",
+     lambda s: (s["topic_id"],)),
+    ("interview.list_available_reviews", "interview",
+     lambda s: (s["user_id"],)),
+    ("voice.get_conversation_history", "interview_turn",
+     lambda s: (s["id"], 40960)),
+    ("conversation.list", "conversation", lambda s: (10,)),
+    ("conversation.list_by_user", "conversation",
+     lambda s: (s["user_id"], 10)),
+    ("topic.list_by_scope", "topic", lambda s: (s["scope_id"],)),
+    ("topic.catalog", "interview", lambda s: None),
+    ("topic.catalog_by_scope", "interview", lambda s: (s["scope_id"],)),
+    ("kb_document.get_by_topic", "kb_document", lambda s: (s["topic_id"],)),
+    ("search.local", "interview_turn", lambda s: SEARCH_PARAMS),
+    ("search.local", "conversation_turn", lambda s: SEARCH_PARAMS),
+    ("topic.get_by_name", "topic", lambda s: (s["name"],)),
+]
+
+
+def seed(db: Database, interviews=100000):
+    """inserts synthetic scopes, topics, interviews and conversations"""
+
+    values = {
+        "prefix": SEED_PREFIX,
+        "scopes": 50,
+        "topics": 1000,
+        "users": max(interviews // 50, 1),
+        "interviews": interviews,
+        "turns": 5,
+    }
+    with db.connect() as conn:
+        for statement in (SEED_PARTITIONS, SEED_SCOPES, SEED_TOPICS,
+                          SEED_INTERVIEWS, SEED_CONVERSATIONS,
+                          SEED_INTERVIEW_TURNS, SEED_CONVERSATION_TURNS, SEED_KB_DOCUMENTS):
+            conn.execute(statement, values)
+        conn.commit()
+        conn.execute("ANALYZE scope, topic, interview, conversation, "
+                     "interview_turn, conversation_turn, kb_document")
+
+
+def clean(db: Database) -> dict:
+    """deletes the seeded rows, returns the number deleted from each table"""
+
+    values = {"prefix": SEED_PREFIX}
+    with db.connect() as conn:
+        return {table: conn.execute(statement, values).rowcount
+                for table, statement in CLEAN.items()}
+
+
+def seq_scans(plan, relations) -> list:
+    """sequential scan nodes on any of relations anywhere in an EXPLAIN (FORMAT JSON) plan"""
+    found = []
+    if plan.get("Node Type") == "Seq Scan" and plan.get("Relation Name") in relations:
+        found.append(plan)
+    for child in plan.get("Plans", []):
+        found.extend(seq_scans(child, relations))
+    return found
+
+
+def check(db: Database) -> list:
+    """returns (name, ok, detail) for every hot query"""
+
+    results = []
+    with db.connect() as conn:
+        cursor = conn.execute(SAMPLE)
+        row = cursor.fetchone()
+        if row is None:
+            raise RuntimeError("no interviews to sample, run: seed")
+        sample = dict(zip([c.name for c in cursor.description], row))
+
+        for name, table, params in HOT_QUERIES:
+            relations = {table} | {record[0] for record in conn.execute(
+                PARTITIONS_WITH_ROWS, (table,)).fetchall()}
+            query = registry.get(name)
+            record = conn.execute(
+                f"EXPLAIN (FORMAT JSON) {query}", params(sample)).fetchone()
+            plan = record[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            plan = plan[0]["Plan"]
+            scans = seq_scans(plan, relations)
+            detail = f"seq scan on {table}" if scans else plan["Node Type"]
+            results.append((name, not scans, detail))
+
+    return results
+
+
+def main():
+    if config.postgres_secret_arn:
+        sys.exit("plancheck only runs against a local database")
+
+    db = Database()
+    try:
+        if len(sys.argv) > 1 and sys.argv[1] == "seed":
+            interviews = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+            seed(db, interviews)
+            print(f"seeded {interviews} interviews and conversations")
+            return
+        if len(sys.argv) > 1 and sys.argv[1] == "clean":
+            for table, count in clean(db).items():
+                print(f"removed {count} {table} rows")
+            return
+
+        results = check(db)
+    finally:
+        db.close()
+
+    failed = 0
+    for name, ok, detail in results:
+        print(f"{'ok  ' if ok else 'FAIL'}  {name}  ({detail})")
+        failed += not ok
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
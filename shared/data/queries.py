@@ -0,0 +1,1357 @@
+"""
+SQL text and row mapping shared by Database and AsyncDatabase
+so the sync and async clients can't drift apart.
+Each statement is registered by name (see shared.data.registry).
+"""
+import json
+import uuid
+import base64
+from datetime import datetime, timezone
+
+from psycopg.rows import class_row, dict_row
+
+from shared.data.data_models import InterviewRecord, Interview, InterviewStatus
+from shared.data.registry import register
+
+# builds InterviewRecords by column name, convert with record.to_interview()
+interview_row = class_row(InterviewRecord)
+
+
+# columns selected for a full interview, named after InterviewRecord fields
+INTERVIEW_COLUMNS = """
+    i.id,
+    i.created,
+    i.user_id,
+    i.topic_id,
+    i.status,
+    (SELECT jsonb_agg(jsonb_strip_nulls(jsonb_build_object('q', it.q, 'a', it.a)) ORDER BY it.seq)
+     FROM interview_turn it WHERE it.interview_id = i.id) AS data,
+    i.completed,
+    i.summary,
+    t.name AS topic_name,
+    t.description AS topic_description,
+    t.areas AS topic_areas,
+    s.name AS scope_name,
+    i.approved_by_user_id,
+    i.approved_on,
+    i.voice_mode,
+    i.voice_session_metadata
+"""
+
+# interview columns without the payloads (transcript, summary and voice
+# session metadata, stored out of line) for callers that only check an
+# interview's status, owner or topic
+INTERVIEW_HEADER_COLUMNS = """
+    i.id,
+    i.created,
+    i.user_id,
+    i.topic_id,
+    i.status,
+    i.completed,
+    t.name AS topic_name,
+    t.description AS topic_description,
+    t.areas AS topic_areas,
+    s.name AS scope_name,
+    i.approved_by_user_id,
+    i.approved_on,
+    i.voice_mode
+"""
+
+# interview columns for list views: counts and the first question
+# come from the turn table in SQL so the transcript never leaves the database
+INTERVIEW_SUMMARY_COLUMNS = """
+    i.id,
+    i.created,
+    i.user_id,
+    i.topic_id,
+    i.status,
+    i.completed,
+    t.name AS topic_name,
+    s.name AS scope_name,
+    i.approved_by_user_id,
+    i.approved_on,
+    i.voice_mode,
+    (SELECT count(*) FROM interview_turn it
+     WHERE it.interview_id = i.id) AS question_count,
+    (SELECT it.q FROM interview_turn it
+     WHERE it.interview_id = i.id AND it.seq = 0) AS initial_question
+"""
+
+# conversation summary keys follow the conversation data document
+CONVERSATION_SUMMARY_COLUMNS = """
+    id AS "conversationId",
+    user_id AS "userId",
+    scope_id,
+    created,
+    (SELECT count(*) FROM conversation_turn ct
+     WHERE ct.conversation_id = conversation.id) AS question_count,
+    (SELECT ct.q FROM conversation_turn ct
+     WHERE ct.conversation_id = conversation.id AND ct.seq = 0) AS initial_question
+"""
+
+def _status_list(*statuses) -> str:
+    """SQL literal list of interview statuses"""
+    return ", ".join(f"'{status.value}'" for status in statuses)
+
+
+# status filters backed by partial indexes are inlined as literals,
+# the planner can't match a partial index predicate against a bound parameter
+CLOSED_STATUSES = _status_list(
+    InterviewStatus.APPROVED, InterviewStatus.REJECTED)
+REVIEW_STATUSES = _status_list(
+    InterviewStatus.PROCESSING, InterviewStatus.PENDING_REVIEW, InterviewStatus.REVIEWING)
+
+INTERVIEW_JOINS = """
+    FROM interview i
+    JOIN topic t ON i.topic_id = t.id
+    JOIN scope s ON t.scope_id = s.id
+"""
+
+###############################################################
+# conversations
+###############################################################
+
+CONVERSATION_INSERT = register("conversation.insert", """
+    INSERT INTO conversation (id, created, scope_id, user_id, data, summary)
+    VALUES (%s, %s, %s, %s, %s, %s)
+""")
+
+# conversation.data holds the conversation header, questions are
+# appended to conversation_turn and reassembled when a conversation is read
+
+CONVERSATION_UPDATE = register("conversation.update", """
+    UPDATE conversation
+    SET data = %s, scope_id = %s
+    WHERE id = %s
+""")
+
+# the conversation document for c, header and questions
+CONVERSATION_DOCUMENT = """
+    c.data || jsonb_build_object('questions', COALESCE(
+        (SELECT jsonb_agg(jsonb_strip_nulls(jsonb_build_object(
+                    'q', ct.q, 'a', ct.a, 'created', ct.created)) ORDER BY ct.seq)
+         FROM conversation_turn ct WHERE ct.conversation_id = c.id),
+        '[]'::jsonb))
+"""
+
+CONVERSATION_GET_BY_ID = register("conversation.get_by_id", f"""
+    SELECT {CONVERSATION_DOCUMENT}
+    FROM conversation c
+    WHERE c.id = %s
+""")
+
+# appends number a turn after the latest one, so they take a
+# transaction-level advisory lock on the conversation or interview first
+# (in its own statement, so the insert's snapshot sees any turn committed
+# while it waited). the voice lambda takes the same interview lock.
+# the turn tables have no foreign keys to the partitioned tables, so the
+# inserts check that the conversation or interview exists and insert
+# nothing otherwise
+CONVERSATION_TURN_LOCK = register("conversation.turn_lock", """
+    SELECT pg_advisory_xact_lock(hashtextextended('conversation_turn:' || %s::text, 0))
+""")
+
+CONVERSATION_TURN_INSERT = register("conversation.turn_insert", """
+    INSERT INTO conversation_turn (conversation_id, seq, created, q, a)
+    SELECT %s, COALESCE(MAX(seq) + 1, 0), %s, %s, %s
+    FROM conversation_turn
+    WHERE conversation_id = %s
+    HAVING EXISTS (SELECT 1 FROM conversation WHERE id = %s)
+""")
+
+# list queries are keyset paginated on (created, id), newest first.
+# the *_after variants take the (created, id) of the last row already seen.
+
+CONVERSATION_LIST = register("conversation.list", f"""
+    SELECT {CONVERSATION_SUMMARY_COLUMNS}
+    FROM conversation
+    ORDER BY created DESC, id DESC
+    LIMIT %s
+""", row_factory=dict_row)
+
+CONVERSATION_LIST_AFTER = register("conversation.list_after", f"""
+    SELECT {CONVERSATION_SUMMARY_COLUMNS}
+    FROM conversation
+    WHERE (created, id) < (%s, %s)
+    ORDER BY created DESC, id DESC
+    LIMIT %s
+""", row_factory=dict_row)
+
+CONVERSATION_LIST_BY_USER = register("conversation.list_by_user", f"""
+    SELECT {CONVERSATION_SUMMARY_COLUMNS}
+    FROM conversation
+    WHERE user_id = %s
+    ORDER BY created DESC, id DESC
+    LIMIT %s
+""", row_factory=dict_row)
+
+CONVERSATION_LIST_BY_USER_AFTER = register("conversation.list_by_user_after", f"""
+    SELECT {CONVERSATION_SUMMARY_COLUMNS}
+    FROM conversation
+    WHERE user_id = %s
+    AND (created, id) < (%s, %s)
+    ORDER BY created DESC, id DESC
+    LIMIT %s
+""", row_factory=dict_row)
+
+CONVERSATION_UPDATE_SUMMARY = register("conversation.update_summary", """
+    UPDATE conversation
+    SET summary = %s
+    WHERE id = %s
+""")
+
+###############################################################
+# scopes
+###############################################################
+
+# LISTEN channel for scope and topic changes, raised by the triggers in
+# migrations/0005_catalog_notify.sql with the changed table as payload
+CATALOG_CHANNEL = "catalog_changed"
+
+SCOPE_INSERT = register("scope.insert", """
+    INSERT INTO scope (id, created, name, description)
+    VALUES (%s, %s, %s, %s)
+""")
+
+SCOPE_UPDATE = register("scope.update", """
+    UPDATE scope
+    SET name = %s, description = %s
+    WHERE id = %s
+""")
+
+SCOPE_GET_BY_ID = register("scope.get_by_id", """
+    SELECT id, name, description, created
+    FROM scope
+    WHERE id = %s
+""", row_factory=dict_row)
+
+SCOPE_DELETE = register("scope.delete", """
+    DELETE FROM scope
+    WHERE id = %s
+""")
+
+SCOPE_LIST = register("scope.list", """
+    SELECT id, name, description, created
+    FROM scope
+    ORDER BY created DESC
+    LIMIT %s
+""", row_factory=dict_row)
+
+###############################################################
+# topics
+###############################################################
+
+TOPIC_GET_BY_NAME = register("topic.get_by_name", """
+    SELECT id, name, description, areas, scope_id
+    FROM topic
+    WHERE name = %s
+""", row_factory=dict_row)
+
+TOPIC_GET_BY_ID = register("topic.get_by_id", """
+    SELECT id, name, description, areas, scope_id
+    FROM topic
+    WHERE id = %s
+""", row_factory=dict_row)
+
+TOPIC_INSERT = register("topic.insert", """
+    INSERT INTO topic (id, created, scope_id, name, description, areas)
+    VALUES (%s, %s, %s, %s, %s, %s)
+""")
+
+TOPIC_LIST_BY_SCOPE = register("topic.list_by_scope", """
+    SELECT id, name, description, areas, created
+    FROM topic
+    WHERE scope_id = %s
+    ORDER BY created DESC
+""", row_factory=dict_row)
+
+# topics with their scope and current kb document's interview (kb pages,
+# /api/topics), both joins are primary key lookups
+TOPIC_CATALOG_SELECT = """
+    SELECT
+    t.id, t.name, t.description, t.areas, t.created,
+    s.id AS scope_id, s.name AS scope_name,
+    i.id AS interview_id,
+    i.user_id AS interview_user_id,
+    i.completed AS interview_completed,
+    i.approved_by_user_id AS interview_approved_by_user_id,
+    i.approved_on AS interview_approved_on
+    FROM topic t
+    JOIN scope s ON t.scope_id = s.id
+    LEFT JOIN kb_document kd ON kd.topic_id = t.id
+    LEFT JOIN interview i ON i.id = kd.interview_id
+"""
+
+TOPIC_CATALOG = register("topic.catalog", f"""
+    {TOPIC_CATALOG_SELECT}
+    ORDER BY s.created DESC, t.created DESC
+""", row_factory=dict_row)
+
+TOPIC_CATALOG_BY_SCOPE = register("topic.catalog_by_scope", f"""
+    {TOPIC_CATALOG_SELECT}
+    WHERE t.scope_id = %s
+    ORDER BY t.created DESC
+""", row_factory=dict_row)
+
+TOPIC_UPDATE = register("topic.update", """
+    UPDATE topic
+    SET name = %s, description = %s, areas = %s
+    WHERE id = %s
+""")
+
+TOPIC_DELETE = register("topic.delete", """
+    DELETE FROM topic
+    WHERE id = %s
+""")
+
+# bulk imports (see shared.data.catalog_import) match scopes by name and
+# topics by name within their scope, neither is unique in the schema, so
+# the import holds this lock to keep concurrent imports from both
+# creating the same scope or topic. plain reads aren't blocked.
+CATALOG_IMPORT_LOCK = "LOCK TABLE scope, topic IN SHARE ROW EXCLUSIVE MODE"
+
+# each upsert takes the whole batch as one JSON array. rows that match
+# are updated only if they'd change and the rest are inserted. returns
+# every row of the batch with created, updated or unchanged.
+# names aren't unique, so when several existing rows share one the
+# oldest is the match and the others are left alone. the final SELECT
+# reads the statement's snapshot, so it sees the existing rows but not
+# the ones this statement inserts
+SCOPE_IMPORT = register("scope.import", """
+    WITH input AS (
+        SELECT * FROM jsonb_to_recordset(%(scopes)s::jsonb)
+        AS x (name varchar, description varchar)
+    ), existing AS (
+        SELECT DISTINCT ON (s.name) s.id, s.name
+        FROM scope s
+        JOIN input x ON s.name = x.name
+        ORDER BY s.name, s.created, s.id
+    ), updated AS (
+        UPDATE scope s
+        SET description = x.description
+        FROM existing e
+        JOIN input x ON x.name = e.name
+        WHERE s.id = e.id
+        AND x.description IS NOT NULL
+        AND s.description IS DISTINCT FROM x.description
+        RETURNING s.id
+    ), inserted AS (
+        INSERT INTO scope (id, created, name, description)
+        SELECT gen_random_uuid(), %(created)s, x.name, x.description
+        FROM input x
+        WHERE NOT EXISTS (SELECT 1 FROM existing e WHERE e.name = x.name)
+        RETURNING id, name
+    )
+    SELECT id, name, 'created' AS result FROM inserted
+    UNION ALL
+    SELECT e.id, e.name,
+           CASE WHEN e.id IN (SELECT id FROM updated)
+                THEN 'updated' ELSE 'unchanged' END
+    FROM existing e
+""", row_factory=dict_row)
+
+TOPIC_IMPORT = register("topic.import", """
+    WITH input AS (
+        SELECT * FROM jsonb_to_recordset(%(topics)s::jsonb)
+        AS x (scope_id uuid, name varchar, description varchar, areas jsonb)
+    ), existing AS (
+        SELECT DISTINCT ON (t.scope_id, t.name) t.id, t.scope_id, t.name
+        FROM topic t
+        JOIN input x ON t.scope_id = x.scope_id AND t.name = x.name
+        ORDER BY t.scope_id, t.name, t.created, t.id
+    ), updated AS (
+        UPDATE topic t
+        SET description = COALESCE(x.description, t.description),
+            areas = x.areas
+        FROM existing e
+        JOIN input x ON x.scope_id = e.scope_id AND x.name = e.name
+        WHERE t.id = e.id
+        AND (t.areas IS DISTINCT FROM x.areas
+             OR (x.description IS NOT NULL
+                 AND t.description IS DISTINCT FROM x.description))
+        RETURNING t.id
+    ), inserted AS (
+        INSERT INTO topic (id, created, scope_id, name, description, areas)
+        SELECT gen_random_uuid(), %(created)s, x.scope_id, x.name,
+               x.description, x.areas
+        FROM input x
+        WHERE NOT EXISTS (SELECT 1 FROM existing e
+                          WHERE e.scope_id = x.scope_id AND e.name = x.name)
+        RETURNING id, scope_id, name
+    )
+    SELECT id, scope_id, name, 'created' AS result FROM inserted
+    UNION ALL
+    SELECT e.id, e.scope_id, e.name,
+           CASE WHEN e.id IN (SELECT id FROM updated)
+                THEN 'updated' ELSE 'unchanged' END
+    FROM existing e
+""", row_factory=dict_row)
+
+###############################################################
+# kb documents
+###############################################################
+
+KB_DOCUMENT_GET_BY_TOPIC = register("kb_document.get_by_topic", """
+    SELECT topic_id, interview_id, s3_key, version, approved_on, updated
+    FROM kb_document
+    WHERE topic_id = %s
+""", row_factory=dict_row)
+
+# a redelivered approval for the current document leaves it as is
+KB_DOCUMENT_UPSERT = register("kb_document.upsert", """
+    INSERT INTO kb_document (topic_id, interview_id, s3_key, approved_on)
+    VALUES (%s, %s, %s, %s)
+    ON CONFLICT (topic_id) DO UPDATE
+    SET interview_id = EXCLUDED.interview_id,
+        s3_key = EXCLUDED.s3_key,
+        approved_on = EXCLUDED.approved_on,
+        version = kb_document.version + 1,
+        updated = NOW()
+    WHERE kb_document.interview_id <> EXCLUDED.interview_id
+""")
+
+###############################################################
+# interviews
+###############################################################
+
+INTERVIEW_GET_BY_ID = register("interview.get_by_id", f"""
+    SELECT {INTERVIEW_COLUMNS}
+    {INTERVIEW_JOINS}
+    WHERE i.id = %s
+""", row_factory=interview_row)
+
+INTERVIEW_GET_HEADER_BY_ID = register("interview.get_header_by_id", f"""
+    SELECT {INTERVIEW_HEADER_COLUMNS}
+    {INTERVIEW_JOINS}
+    WHERE i.id = %s
+""", row_factory=interview_row)
+
+INTERVIEW_LIST = register("interview.list", f"""
+    SELECT {INTERVIEW_SUMMARY_COLUMNS}
+    {INTERVIEW_JOINS}
+    ORDER BY i.created DESC, i.id DESC
+    LIMIT %s
+""", row_factory=interview_row)
+
+INTERVIEW_LIST_AFTER = register("interview.list_after", f"""
+    SELECT {INTERVIEW_SUMMARY_COLUMNS}
+    {INTERVIEW_JOINS}
+    WHERE (i.created, i.id) < (%s, %s)
+    ORDER BY i.created DESC, i.id DESC
+    LIMIT %s
+""", row_factory=interview_row)
+
+INTERVIEW_LIST_BY_USER = register("interview.list_by_user", f"""
+    SELECT {INTERVIEW_SUMMARY_COLUMNS}
+    {INTERVIEW_JOINS}
+    WHERE i.user_id = %s
+    ORDER BY i.created DESC, i.id DESC
+    LIMIT %s
+""", row_factory=interview_row)
+
+INTERVIEW_LIST_BY_USER_AFTER = register("interview.list_by_user_after", f"""
+    SELECT {INTERVIEW_SUMMARY_COLUMNS}
+    {INTERVIEW_JOINS}
+    WHERE i.user_id = %s
+    AND (i.created, i.id) < (%s, %s)
+    ORDER BY i.created DESC, i.id DESC
+    LIMIT %s
+""", row_factory=interview_row)
+
+INTERVIEW_LIST_APPROVED_BY_TOPIC = register("interview.list_approved_by_topic", f"""
+    SELECT {INTERVIEW_COLUMNS}
+    {INTERVIEW_JOINS}
+    WHERE i.topic_id = %s AND i.status = %s
+    ORDER BY i.completed DESC
+""", row_factory=interview_row)
+
+INTERVIEW_GET_LATEST_APPROVED = register("interview.get_latest_approved", f"""
+    SELECT {INTERVIEW_COLUMNS}
+    {INTERVIEW_JOINS}
+    WHERE i.topic_id = %s
+    AND i.status = %s
+    ORDER BY i.completed DESC
+    LIMIT 1
+""", row_factory=interview_row)
+
+INTERVIEW_GET_INFLIGHT_BY_USER_TOPIC = register("interview.get_inflight_by_user_topic", f"""
+    SELECT {INTERVIEW_COLUMNS}
+    {INTERVIEW_JOINS}
+    WHERE i.user_id = %s AND i.topic_id = %s
+    AND i.status NOT IN ({CLOSED_STATUSES})
+""", row_factory=interview_row)
+
+INTERVIEW_LIST_AVAILABLE = register("interview.list_available", """
+    SELECT
+        s.name AS scope_name,
+        t.name AS topic_name,
+        t.description AS topic_description,
+        i.status,
+        i.id,
+        i.user_id
+    FROM interview i
+    JOIN topic t ON i.topic_id = t.id
+    JOIN scope s ON t.scope_id = s.id
+    WHERE i.user_id = %s AND i.status in (%s,%s)
+    ORDER BY i.created DESC
+""", row_factory=interview_row)
+
+INTERVIEW_LIST_INFLIGHT_BY_TOPIC = register("interview.list_inflight_by_topic", f"""
+    SELECT
+        s.name AS scope_name,
+        t.name AS topic_name,
+        t.description AS topic_description,
+        i.status,
+        i.id,
+        i.user_id,
+        i.created
+    FROM interview i
+    JOIN topic t ON i.topic_id = t.id
+    JOIN scope s ON t.scope_id = s.id
+    WHERE i.topic_id = %s
+    AND i.status NOT IN ({CLOSED_STATUSES})
+    ORDER BY i.created DESC
+""", row_factory=interview_row)
+
+INTERVIEW_LIST_AVAILABLE_REVIEWS = register("interview.list_available_reviews", f"""
+    SELECT
+        s.name AS scope_name,
+        t.name AS topic_name,
+        t.description AS topic_description,
+        i.status,
+        i.id,
+        i.completed,
+        i.user_id
+    FROM interview i
+    JOIN topic t ON i.topic_id = t.id
+    JOIN scope s ON t.scope_id = s.id
+    WHERE i.status IN ({REVIEW_STATUSES})
+    AND i.user_id != %s
+    ORDER BY i.created DESC
+""", row_factory=interview_row)
+
+INTERVIEW_GET_ASSIGNED_USER = register("interview.get_assigned_user", """
+    SELECT user_id
+    FROM interview
+    WHERE topic_id = %s
+""")
+
+INTERVIEW_INSERT = register("interview.insert", """
+    INSERT INTO interview (id, created, topic_id, user_id, status, summary, completed, voice_mode, voice_session_metadata)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+""")
+
+INTERVIEW_INSERT_IF_NOT_INFLIGHT = register("interview.insert_if_not_inflight", f"""
+    INSERT INTO interview (id, created, topic_id, user_id, status, summary, completed, voice_mode, voice_session_metadata)
+    SELECT %s, %s, %s, %s, %s, %s, %s, %s, %s
+    WHERE NOT EXISTS (
+        SELECT 1 FROM interview
+        WHERE user_id = %s AND topic_id = %s
+        AND status NOT IN ({CLOSED_STATUSES})
+    )
+""")
+
+# assignments take transaction-level advisory locks covering each (topic,
+# user) pair they're about to insert for. without them, concurrent
+# assignments could both pass the in-flight check and open two
+# interviews for the same pair (a partitioned table can't have a unique
+# index without created to prevent it). pairs hash into ASSIGN_LOCK_SLOTS
+# slots so a large batch holds a bounded number of locks, taken in order
+# so overlapping batches can't deadlock
+ASSIGN_LOCK_CLASS = 1001
+ASSIGN_LOCK_SLOTS = 256
+
+INTERVIEW_ASSIGN_LOCK = f"""
+    SELECT pg_advisory_xact_lock({ASSIGN_LOCK_CLASS}, k.slot)
+    FROM (
+        SELECT DISTINCT abs(hashtext(topic_id || ':' || user_id) %% {ASSIGN_LOCK_SLOTS}) AS slot
+        FROM unnest(%(topic_ids)s::uuid[], %(user_ids)s::varchar[]) AS u (topic_id, user_id)
+    ) k
+    ORDER BY k.slot
+"""
+
+# many assignments in one statement: pairs are passed as two parallel
+# arrays, duplicates and unknown topics are dropped and pairs with an
+# in-flight interview are skipped (checked on idx_interview_inflight, a
+# partitioned table can't have the unique index ON CONFLICT would need).
+# returns the pairs that were assigned
+INTERVIEW_ASSIGN_BULK = register("interview.assign_bulk", f"""
+    INSERT INTO interview (id, created, topic_id, user_id, status)
+    SELECT gen_random_uuid(), %(created)s, p.topic_id, p.user_id, %(status)s
+    FROM (
+        SELECT DISTINCT topic_id, user_id
+        FROM unnest(%(topic_ids)s::uuid[], %(user_ids)s::varchar[]) AS u (topic_id, user_id)
+    ) p
+    JOIN topic t ON t.id = p.topic_id
+    WHERE NOT EXISTS (
+        SELECT 1 FROM interview i
+        WHERE i.user_id = p.user_id AND i.topic_id = p.topic_id
+        AND i.status NOT IN ({CLOSED_STATUSES})
+    )
+    RETURNING topic_id, user_id
+""")
+
+# questions and answers live in interview_turn, so updating an
+# interview never rewrites its transcript
+
+INTERVIEW_UPDATE = register("interview.update", """
+    UPDATE interview
+    SET
+        status = %s,
+        summary=%s,
+        approved_by_user_id = %s,
+        approved_on = %s,
+        voice_mode = %s,
+        voice_session_metadata = %s
+    WHERE id = %s
+""")
+
+# see CONVERSATION_TURN_LOCK
+INTERVIEW_TURN_LOCK = register("interview.turn_lock", """
+    SELECT pg_advisory_xact_lock(hashtextextended('interview_turn:' || %s::text, 0))
+""")
+
+INTERVIEW_TURN_INSERT = register("interview.turn_insert", """
+    INSERT INTO interview_turn (interview_id, seq, q, a)
+    SELECT %s, COALESCE(MAX(seq) + 1, 0), %s, %s
+    FROM interview_turn
+    WHERE interview_id = %s
+    HAVING EXISTS (SELECT 1 FROM interview WHERE id = %s)
+""")
+
+INTERVIEW_TURN_ANSWER_LAST = register("interview.turn_answer_last", """
+    UPDATE interview_turn
+    SET a = %s
+    WHERE interview_id = %s
+    AND seq = (SELECT MAX(seq) FROM interview_turn WHERE interview_id = %s)
+""")
+
+INTERVIEW_TURN_DELETE_ALL = register("interview.turn_delete_all", """
+    DELETE FROM interview_turn
+    WHERE interview_id = %s
+""")
+
+INTERVIEW_TURN_INSERT_ALL = register("interview.turn_insert_all", """
+    INSERT INTO interview_turn (interview_id, seq, q, a)
+    SELECT %s, t.ord - 1, COALESCE(t.turn->>'q', ''), t.turn->>'a'
+    FROM jsonb_array_elements(%s::jsonb) WITH ORDINALITY AS t(turn, ord)
+    WHERE EXISTS (SELECT 1 FROM interview WHERE id = %s)
+""")
+
+# targeted updates write only the columns they change and only
+# apply when the interview is still in one of the expected statuses
+
+INTERVIEW_TRANSITION_STATUS = register("interview.transition_status", """
+    UPDATE interview
+    SET status = %s
+    WHERE id = %s
+    AND status = ANY(%s)
+""")
+
+INTERVIEW_APPROVE = register("interview.approve", """
+    UPDATE interview
+    SET
+        status = %s,
+        approved_by_user_id = %s,
+        approved_on = %s
+    WHERE id = %s
+    AND status = ANY(%s)
+""")
+
+INTERVIEW_END = register("interview.end", """
+    UPDATE interview
+    SET
+        status = %s,
+        completed = %s
+    WHERE id = %s
+""")
+
+INTERVIEW_SUMMARIZE = register("interview.summarize", """
+    UPDATE interview
+    SET
+        status = %s,
+        summary = %s
+    WHERE id = %s
+""")
+
+###############################################################
+# interview stats
+###############################################################
+
+# counters maintained by the trigger in migrations/0009_interview_stats.sql
+STATS_BY_TOPIC = register("stats.by_topic", """
+    SELECT s.id AS scope_id, s.name AS scope_name,
+           t.id AS topic_id, t.name AS topic_name,
+           st.status, st.count, st.approvals, st.approval_seconds
+    FROM interview_stats st
+    JOIN topic t ON st.topic_id = t.id
+    JOIN scope s ON t.scope_id = s.id
+    WHERE st.count > 0
+    ORDER BY s.name, t.name, st.status
+""", row_factory=dict_row)
+
+# open interviews only, served by the idx_interview_inflight partial index
+STATS_BACKLOG = register("stats.backlog", f"""
+    SELECT status, count(*) AS count, min(created) AS oldest
+    FROM interview
+    WHERE status NOT IN ({CLOSED_STATUSES})
+    GROUP BY status
+""", row_factory=dict_row)
+
+###############################################################
+# voice sessions
+###############################################################
+
+# history for Nova Sonic: each message is cut to VOICE_MESSAGE_CHARACTERS
+# and turns are kept newest first while the running total of characters
+# fits in the limit, so only the bounded history leaves the database
+VOICE_MESSAGE_CHARACTERS = 1024
+
+VOICE_GET_CONVERSATION_HISTORY = register("voice.get_conversation_history", f"""
+    SELECT q, a
+    FROM (
+        SELECT
+            seq,
+            q,
+            a,
+            sum(length(q) + length(a)) OVER (ORDER BY seq DESC) AS total
+        FROM (
+            SELECT
+                seq,
+                left(q, {VOICE_MESSAGE_CHARACTERS}) AS q,
+                left(COALESCE(a, ''), {VOICE_MESSAGE_CHARACTERS}) AS a
+            FROM interview_turn
+            WHERE interview_id = %s
+        ) turns
+    ) history
+    WHERE total <= %s
+    ORDER BY seq
+""", row_factory=dict_row)
+
+VOICE_UPDATE_SESSION_METADATA = register("voice.update_session_metadata", """
+    UPDATE interview
+    SET voice_session_metadata = %s
+    WHERE id = %s
+""")
+
+VOICE_PATCH_SESSION_METADATA = register("voice.patch_session_metadata", """
+    UPDATE interview
+    SET voice_session_metadata = COALESCE(voice_session_metadata, '{}'::jsonb) || %s::jsonb
+    WHERE id = %s
+""")
+
+VOICE_START_SESSION = register("voice.start_session", """
+    UPDATE interview
+    SET
+        voice_mode = true,
+        voice_session_metadata = %s,
+        status = CASE WHEN status = %s THEN %s ELSE status END
+    WHERE id = %s
+    AND status = ANY(%s)
+""")
+
+VOICE_UPDATE_SESSION_STATUS = register("voice.update_session_status", """
+    UPDATE interview
+    SET voice_session_metadata = jsonb_set(
+        COALESCE(voice_session_metadata, '{}'::jsonb),
+        %s,
+        %s::jsonb
+    )
+    WHERE id = %s
+""")
+
+VOICE_INITIALIZE_SESSION = register("voice.initialize_session", """
+    UPDATE interview
+    SET voice_session_metadata = COALESCE(voice_session_metadata, '{}'::jsonb) || %s::jsonb
+    WHERE id = %s
+""")
+
+VOICE_GET_SESSION_METADATA = register("voice.get_session_metadata", """
+    SELECT voice_session_metadata
+    FROM interview
+    WHERE id = %s
+""")
+
+VOICE_ENABLE_MODE = register("voice.enable_mode", """
+    UPDATE interview
+    SET voice_mode = true
+    WHERE id = %s
+""")
+
+VOICE_GET_INTERVIEW_INFO = register("voice.get_interview_info", """
+    SELECT id, user_id, topic_id, status, COALESCE(voice_mode, false) AS voice_mode
+    FROM interview
+    WHERE id = %s
+""", row_factory=dict_row)
+
+###############################################################
+# search
+###############################################################
+
+# ts_headline marks matches with these, web escapes the text around them
+SEARCH_HIGHLIGHT_START = "<mark>"
+SEARCH_HIGHLIGHT_STOP = "</mark>"
+
+# interviews match on any Q&A or their summary, conversations on any Q&A.
+# a result's rank sums its matching rows, the headline comes from its best one
+SEARCH_SELECT = f"""
+    WITH query AS (
+        SELECT websearch_to_tsquery('english', %(text)s) AS tsq
+    ),
+    hits AS (
+        SELECT 'interview' AS kind, it.interview_id AS id, ts_rank(it.search, query.tsq) AS rank
+        FROM interview_turn it, query
+        WHERE %(interviews)s AND it.search @@ query.tsq
+        UNION ALL
+        SELECT 'interview', i.id, ts_rank(i.summary_search, query.tsq)
+        FROM interview i, query
+        WHERE %(interviews)s AND i.summary_search @@ query.tsq
+        UNION ALL
+        SELECT 'conversation', ct.conversation_id, ts_rank(ct.search, query.tsq)
+        FROM conversation_turn ct, query
+        WHERE %(conversations)s AND ct.search @@ query.tsq
+    ),
+    ranked AS (
+        SELECT kind, id, sum(rank)::float8 AS rank
+        FROM hits
+        GROUP BY kind, id
+    ),
+    page AS (
+        SELECT kind, id, rank
+        FROM ranked
+        {{after}}
+        ORDER BY rank DESC, id DESC
+        LIMIT %(limit)s
+    )
+    SELECT
+        p.kind, p.id, p.rank,
+        COALESCE(i.created, c.created) AS created,
+        COALESCE(i.user_id, c.user_id) AS user_id,
+        i.status,
+        i.topic_id,
+        COALESCE(t.name,
+                 (SELECT ct.q FROM conversation_turn ct
+                  WHERE ct.conversation_id = c.id AND ct.seq = 0)) AS title,
+        ts_headline('english',
+                    COALESCE(best_it.text, best_ct.text, i.summary, ''),
+                    query.tsq,
+                    'StartSel={SEARCH_HIGHLIGHT_START}, StopSel={SEARCH_HIGHLIGHT_STOP}, MaxFragments=2, MaxWords=30, MinWords=10'
+        ) AS headline
+    FROM page p
+    CROSS JOIN query
+    LEFT JOIN interview i ON p.kind = 'interview' AND i.id = p.id
+    LEFT JOIN topic t ON t.id = i.topic_id
+    LEFT JOIN conversation c ON p.kind = 'conversation' AND c.id = p.id
+    LEFT JOIN LATERAL (
+        SELECT it.q || ' ' || COALESCE(it.a, '') AS text
+        FROM interview_turn it
+        WHERE it.interview_id = i.id AND it.search @@ query.tsq
+        ORDER BY ts_rank(it.search, query.tsq) DESC
+        LIMIT 1
+    ) best_it ON true
+    LEFT JOIN LATERAL (
+        SELECT ct.q || ' ' || COALESCE(ct.a, '') AS text
+        FROM conversation_turn ct
+        WHERE ct.conversation_id = c.id AND ct.search @@ query.tsq
+        ORDER BY ts_rank(ct.search, query.tsq) DESC
+        LIMIT 1
+    ) best_ct ON true
+    ORDER BY p.rank DESC, p.id DESC
+"""
+
+# search results are keyset paginated on (rank, id), best first
+SEARCH = register("search.local", SEARCH_SELECT.format(after=""),
+                  row_factory=dict_row)
+
+SEARCH_AFTER = register("search.local_after", SEARCH_SELECT.format(
+    after="WHERE (rank, id) < (%(after_rank)s, %(after_id)s)"),
+    row_factory=dict_row)
+
+###############################################################
+# partitions and archives
+###############################################################
+
+# conversation and interview are partitioned by created month, see
+# migrations/0010_partition_by_month.sql and shared.data.archive
+
+PARTITIONED_TABLES = ("conversation", "interview")
+
+PARTITION_CREATE = register("partition.create", """
+    SELECT create_month_partition(%s, %s)
+""")
+
+PARTITION_LIST = register("partition.list", """
+    SELECT c.relname
+    FROM pg_inherits inh
+    JOIN pg_class c ON c.oid = inh.inhrelid
+    WHERE inh.inhparent = %s::regclass
+    ORDER BY c.relname
+""")
+
+# whether a partition's DETACH ... CONCURRENTLY is still pending (it was
+# interrupted), no row once it's detached
+PARTITION_DETACH_PENDING = register("partition.detach_pending", """
+    SELECT inh.inhdetachpending
+    FROM pg_inherits inh
+    WHERE inh.inhrelid = to_regclass(%s)
+""")
+
+# an archived month is exported as one JSON line per row, with the
+# record Database.get() / get_interview() would return and the number
+# of turns exported with it. the month's bounds select one partition.
+
+ARCHIVE_CONVERSATION_EXPORT = register("archive.conversation_export", f"""
+    SELECT jsonb_build_object(
+               'id', c.id,
+               'created', c.created,
+               'row', to_jsonb(c),
+               'record', {CONVERSATION_DOCUMENT})::text,
+           (SELECT count(*) FROM conversation_turn ct
+            WHERE ct.conversation_id = c.id)
+    FROM conversation c
+    WHERE c.created >= %s AND c.created < %s
+""")
+
+ARCHIVE_INTERVIEW_EXPORT = register("archive.interview_export", f"""
+    SELECT jsonb_build_object(
+               'id', r.id,
+               'created', r.created,
+               'record', to_jsonb(r))::text,
+           (SELECT count(*) FROM interview_turn it
+            WHERE it.interview_id = r.id)
+    FROM (
+        SELECT {INTERVIEW_COLUMNS}
+        {INTERVIEW_JOINS}
+        WHERE i.created >= %s AND i.created < %s
+    ) r
+""")
+
+# rows a month can't be archived with: open interviews, and interviews
+# that are a topic's current kb document (the kb pages join them)
+ARCHIVE_INTERVIEW_BLOCKERS = register("archive.interview_blockers", f"""
+    SELECT count(*)
+    FROM interview i
+    WHERE i.created >= %s AND i.created < %s
+    AND (i.status NOT IN ({CLOSED_STATUSES})
+         OR EXISTS (SELECT 1 FROM kb_document kd WHERE kd.interview_id = i.id))
+""")
+
+# the export is checked against the month again before it's dropped
+ARCHIVE_CONVERSATION_CHECKSUM = register("archive.conversation_checksum", """
+    SELECT count(*), md5(string_agg(c::text, '' ORDER BY c.id))
+    FROM conversation c
+    WHERE c.created >= %s AND c.created < %s
+""")
+
+ARCHIVE_INTERVIEW_CHECKSUM = register("archive.interview_checksum", """
+    SELECT count(*), md5(string_agg(i::text, '' ORDER BY i.id))
+    FROM interview i
+    WHERE i.created >= %s AND i.created < %s
+""")
+
+# once a month's partition is detached, its checksum is taken again and
+# its turns deleted through the standalone table (see shared.data.archive)
+ARCHIVE_DETACHED_CHECKSUM = """
+    SELECT count(*), md5(string_agg(p::text, '' ORDER BY p.id))
+    FROM {partition} p
+"""
+
+ARCHIVE_DETACHED_TURNS_DELETE = """
+    DELETE FROM {turns} t
+    USING {partition} p
+    WHERE t.{key} = p.id
+"""
+
+ARCHIVE_CONVERSATION_RECORDS = register("archive.conversation_records", """
+    INSERT INTO archived_record (kind, id, month)
+    SELECT 'conversation', c.id, %s
+    FROM conversation c
+    WHERE c.created >= %s AND c.created < %s
+    ON CONFLICT DO NOTHING
+""")
+
+ARCHIVE_INTERVIEW_RECORDS = register("archive.interview_records", """
+    INSERT INTO archived_record (kind, id, month)
+    SELECT 'interview', i.id, %s
+    FROM interview i
+    WHERE i.created >= %s AND i.created < %s
+    ON CONFLICT DO NOTHING
+""")
+
+ARCHIVE_PARTITION_INSERT = register("archive.partition_insert", """
+    INSERT INTO archived_partition (kind, month, location, row_count)
+    VALUES (%s, %s, %s, %s)
+""")
+
+# a month whose removal didn't finish is put back as it was
+ARCHIVE_RECORDS_DELETE = register("archive.records_delete", """
+    DELETE FROM archived_record
+    WHERE kind = %s AND month = %s
+""")
+
+ARCHIVE_PARTITION_DELETE = register("archive.partition_delete", """
+    DELETE FROM archived_partition
+    WHERE kind = %s AND month = %s
+""")
+
+ARCHIVE_PARTITION_LIST = register("archive.partition_list", """
+    SELECT kind, month, location, row_count, archived_at
+    FROM archived_partition
+    ORDER BY kind, month
+""", row_factory=dict_row)
+
+ARCHIVE_LOOKUP = register("archive.lookup", """
+    SELECT ap.location
+    FROM archived_record ar
+    JOIN archived_partition ap ON ap.kind = ar.kind AND ap.month = ar.month
+    WHERE ar.kind = %s AND ar.id = %s
+""")
+
+###############################################################
+# exports
+###############################################################
+
+# bulk exports run as COPY ... TO STDOUT (see shared.data.export), which
+# binds its values client-side: the planner sees the filters that weren't
+# given as NULL IS NULL and drops them, and prunes partitions by created.
+# only live rows are exported, archived months are already NDJSON.
+
+EXPORT_INTERVIEW_FILTER = """
+    WHERE (%(scope_id)s::uuid IS NULL OR t.scope_id = %(scope_id)s::uuid)
+    AND (%(topic_id)s::uuid IS NULL OR i.topic_id = %(topic_id)s::uuid)
+    AND (%(statuses)s::varchar[] IS NULL OR i.status = ANY(%(statuses)s::varchar[]))
+    AND (%(since)s::timestamptz IS NULL OR i.created >= %(since)s::timestamptz)
+    AND (%(until)s::timestamptz IS NULL OR i.created < %(until)s::timestamptz)
+"""
+
+EXPORT_CONVERSATION_FILTER = """
+    WHERE (%(scope_id)s::uuid IS NULL OR c.scope_id = %(scope_id)s::uuid)
+    AND (%(since)s::timestamptz IS NULL OR c.created >= %(since)s::timestamptz)
+    AND (%(until)s::timestamptz IS NULL OR c.created < %(until)s::timestamptz)
+"""
+
+EXPORT_SELECTS = {
+    "interviews": f"""
+        SELECT i.id, i.created, i.user_id, i.topic_id, t.name AS topic_name,
+               t.scope_id, s.name AS scope_name, i.status, i.completed,
+               i.approved_by_user_id, i.approved_on, i.voice_mode,
+               (SELECT count(*) FROM interview_turn it
+                WHERE it.interview_id = i.id) AS question_count,
+               i.summary
+        {INTERVIEW_JOINS}
+        {EXPORT_INTERVIEW_FILTER}
+        ORDER BY i.created, i.id
+    """,
+    # a turn table's primary key order keeps each interview's turns together
+    "interview_turns": f"""
+        SELECT it.interview_id, it.seq, it.created, i.user_id, i.topic_id,
+               t.name AS topic_name, s.name AS scope_name, i.status,
+               it.q AS question, it.a AS answer
+        FROM interview_turn it
+        JOIN interview i ON i.id = it.interview_id
+        JOIN topic t ON i.topic_id = t.id
+        JOIN scope s ON t.scope_id = s.id
+        {EXPORT_INTERVIEW_FILTER}
+        ORDER BY it.interview_id, it.seq
+    """,
+    "conversations": f"""
+        SELECT c.id, c.created, c.user_id, c.scope_id, s.name AS scope_name,
+               (SELECT count(*) FROM conversation_turn ct
+                WHERE ct.conversation_id = c.id) AS question_count,
+               c.summary
+        FROM conversation c
+        LEFT JOIN scope s ON c.scope_id = s.id
+        {EXPORT_CONVERSATION_FILTER}
+        ORDER BY c.created, c.id
+    """,
+    "conversation_turns": f"""
+        SELECT ct.conversation_id, ct.seq, ct.created, c.user_id, c.scope_id,
+               s.name AS scope_name, ct.q AS question, ct.a AS answer
+        FROM conversation_turn ct
+        JOIN conversation c ON c.id = ct.conversation_id
+        LEFT JOIN scope s ON c.scope_id = s.id
+        {EXPORT_CONVERSATION_FILTER}
+        ORDER BY ct.conversation_id, ct.seq
+    """,
+}
+
+# NDJSON is copied as CSV with a quote and delimiter that can't appear in
+# JSON text (jsonb escapes control characters), so each line comes out of
+# Postgres as is and the stream never has to be parsed in Python
+EXPORT_FORMATS = {
+    "ndjson": """
+        COPY (SELECT to_jsonb(r) FROM ({select}) r)
+        TO STDOUT (FORMAT csv, QUOTE E'\\x01', DELIMITER E'\\x02')
+    """,
+    "csv": """
+        COPY ({select}) TO STDOUT (FORMAT csv, HEADER)
+    """,
+}
+
+EXPORTS = {
+    (kind, format): register(f"export.{kind}_{format}",
+                             copy.format(select=select))
+    for kind, select in EXPORT_SELECTS.items()
+    for format, copy in EXPORT_FORMATS.items()
+}
+
+###############################################################
+# settings
+###############################################################
+
+SETTING_GET = register(
+    "setting.get", "SELECT value FROM settings WHERE key = %s")
+
+# LISTEN channel for settings changes, the payload is the changed key
+SETTINGS_CHANNEL = "settings_changed"
+
+# notifies listeners when the transaction commits
+SETTING_UPSERT = register("setting.upsert", f"""
+    WITH upsert AS (
+        INSERT INTO settings (key, value, updated_at)
+        VALUES (%s, %s, NOW())
+        ON CONFLICT (key)
+        DO UPDATE SET value = EXCLUDED.value, updated_at = NOW()
+        RETURNING key
+    )
+    SELECT pg_notify('{SETTINGS_CHANNEL}', key) FROM upsert
+""")
+
+
+###############################################################
+# parameters
+###############################################################
+
+def topic_catalog_entry(record) -> dict:
+    """topic dict from a TOPIC_CATALOG row, with its current kb document's Interview (or None)"""
+    interview_id = record.pop("interview_id")
+    interview = {key[len("interview_"):]: record.pop(key)
+                 for key in list(record) if key.startswith("interview_")}
+    record["interview"] = None
+    if interview_id is not None:
+        record["interview"] = Interview(
+            id=interview_id,
+            topic_id=record["id"],
+            topic_name=record["name"],
+            scope_name=record["scope_name"],
+            status=InterviewStatus.APPROVED,
+            **interview)
+    return record
+
+
+def interview_stats(records, backlog, now) -> dict:
+    """
+    dashboard stats from STATS_BY_TOPIC and STATS_BACKLOG rows: counts by
+    status overall, per scope and per topic, average time-to-approval
+    and the age of the oldest open interview in each status
+    """
+    def bucket(**fields):
+        return {**fields, "statuses": {}, "total": 0,
+                "approvals": 0, "approval_seconds": 0.0}
+
+    def add(target, record):
+        statuses = target["statuses"]
+        statuses[record["status"]] = statuses.get(
+            record["status"], 0) + record["count"]
+        target["total"] += record["count"]
+        target["approvals"] += record["approvals"]
+        target["approval_seconds"] += record["approval_seconds"]
+
+    def finish(target):
+        approvals = target.pop("approvals")
+        seconds = target.pop("approval_seconds")
+        target["average_approval_seconds"] = seconds / approvals if approvals else None
+        return target
+
+    overall = bucket()
+    scopes = {}
+    for record in records:
+        scope = scopes.setdefault(record["scope_id"], bucket(
+            id=record["scope_id"], name=record["scope_name"], topics={}))
+        topic = scope["topics"].setdefault(record["topic_id"], bucket(
+            id=record["topic_id"], name=record["topic_name"]))
+        for target in (overall, scope, topic):
+            add(target, record)
+
+    for scope in scopes.values():
+        scope["topics"] = [finish(topic) for topic in scope["topics"].values()]
+
+    return {
+        **finish(overall),
+        "scopes": [finish(scope) for scope in scopes.values()],
+        "backlog": [{
+            "status": row["status"],
+            "count": row["count"],
+            "oldest": row["oldest"],
+            "age_seconds": (now - row["oldest"]).total_seconds(),
+        } for row in backlog],
+    }
+
+
+def archived_interview(record) -> InterviewRecord:
+    """InterviewRecord from an ARCHIVE_INTERVIEW_EXPORT record, with the types psycopg returns"""
+    record = dict(record)
+    for key in ("id", "topic_id"):
+        if record.get(key) is not None:
+            record[key] = uuid.UUID(record[key])
+    for key in ("created", "completed", "approved_on"):
+        if record.get(key) is not None:
+            record[key] = datetime.fromisoformat(record[key])
+    return InterviewRecord(**record)
+
+
+def encode_cursor(created, id) -> str:
+    """opaque page cursor pointing after the row with (created, id)"""
+    raw = json.dumps([created.isoformat(), str(id)])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor) -> tuple:
+    """(created, id) parameters from encode_cursor(), ValueError if malformed"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created, id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created), str(uuid.UUID(id))
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"invalid cursor: {cursor}") from e
+
+
+def encode_rank_cursor(rank, id) -> str:
+    """opaque search page cursor pointing after the result with (rank, id)"""
+    raw = json.dumps([rank, str(id)])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_rank_cursor(cursor) -> tuple:
+    """(rank, id) parameters from encode_rank_cursor(), ValueError if malformed"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        rank, id = json.loads(base64.urlsafe_b64decode(padded))
+        return float(rank), uuid.UUID(id)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"invalid cursor: {cursor}") from e
+
+
+def new_scope(name, description, created) -> tuple:
+    """returns a new scope dict and its SCOPE_INSERT parameters"""
+    id = str(uuid.uuid4())
+    scope = {
+        "id": id,
+        "name": name,
+        "description": description,
+        "created": created
+    }
+    return scope, (id, created, name, description)
+
+
+def new_topic(name, description, areas, scope_id, created) -> tuple:
+    """returns a new topic dict and its TOPIC_INSERT parameters"""
+    id = str(uuid.uuid4())
+    topic = {
+        "id": id,
+        "name": name,
+        "description": description,
+        "areas": areas,
+        "scope_id": scope_id,
+        "created": created
+    }
+    return topic, (id, created, scope_id, name, description, json.dumps(areas))
+
+
+def conversation_header(conversation) -> str:
+    """conversation.data for a conversation, without its questions"""
+    header = {k: v for k, v in conversation.items() if k != "questions"}
+    return json.dumps(header, default=str)
+
+
+def conversation_turn_values(conversation_id, question, answer, created) -> tuple:
+    """CONVERSATION_TURN_INSERT parameters"""
+    return (conversation_id, created, question, answer, conversation_id,
+            conversation_id)
+
+
+def interview_turn_values(interview_id, question, answer=None) -> tuple:
+    """INTERVIEW_TURN_INSERT parameters"""
+    return (interview_id, question, answer, interview_id, interview_id)
+
+
+def interview_insert_values(interview: Interview) -> tuple:
+    """INTERVIEW_INSERT parameters for an interview"""
+    record = interview.to_record()
+    return (record.id, record.created, record.topic_id, record.user_id,
+            record.status, record.summary, record.completed,
+            record.voice_mode, record.voice_session_metadata)
+
+
+def interview_assign_values(topic_id, user_id) -> tuple:
+    """INTERVIEW_INSERT_IF_NOT_INFLIGHT parameters for a new assignment"""
+    return interview_insert_values(Interview.new(topic_id, user_id)) + (
+        user_id,
+        topic_id,
+    )
+
+
+def interview_assign_lock_values(pairs) -> dict:
+    """INTERVIEW_ASSIGN_LOCK parameters for (topic_id, user_id) pairs"""
+    return {
+        "topic_ids": [str(topic_id) for topic_id, _ in pairs],
+        "user_ids": [user_id for _, user_id in pairs],
+    }
+
+
+def interview_assign_bulk_values(pairs, created) -> dict:
+    """INTERVIEW_ASSIGN_BULK parameters for (topic_id, user_id) pairs"""
+    return {
+        "created": created,
+        "status": InterviewStatus.NOT_STARTED.value,
+        **interview_assign_lock_values(pairs),
+    }
+
+
+def interview_update_values(interview: Interview) -> tuple:
+    """INTERVIEW_UPDATE parameters for an interview"""
+    record = interview.to_record()
+    return (record.status, record.summary,
+            record.approved_by_user_id, record.approved_on, record.voice_mode,
+            record.voice_session_metadata, record.id)
+
+
+def interview_transition_values(interview_id, from_statuses, to_status) -> tuple:
+    """INTERVIEW_TRANSITION_STATUS parameters"""
+    return (to_status.value, interview_id, [s.value for s in from_statuses])
+
+
+def voice_session_start_values(interview_id, metadata) -> tuple:
+    """VOICE_START_SESSION parameters, not started interviews become started"""
+    return (json.dumps(metadata, default=str),
+            InterviewStatus.NOT_STARTED.value,
+            InterviewStatus.STARTED.value,
+            interview_id,
+            [InterviewStatus.NOT_STARTED.value, InterviewStatus.STARTED.value])
+
+
+def voice_session_status_values(interview_id, session_id, status) -> tuple:
+    """VOICE_UPDATE_SESSION_STATUS parameters"""
+    path = f'{{{session_id},status}}'
+    return (path, json.dumps(status), interview_id)
+
+
+def voice_session_init_values(interview_id, session_id, metadata) -> tuple:
+    """VOICE_INITIALIZE_SESSION parameters"""
+    session_data = {
+        session_id: {
+            **metadata,
+            'createdAt': datetime.now(timezone.utc).isoformat()
+        }
+    }
+    return (json.dumps(session_data, default=str), interview_id)
+
+
+def talk_mode_from_setting(value) -> bool:
+    """Converts the talk_mode_enabled setting to a bool, defaulting to True"""
+    if value is None:
+        # Setting doesn't exist, return default True
+        return True
+    # Convert string value to boolean
+    return value.lower() == 'true'
+
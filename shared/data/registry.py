@@ -0,0 +1,123 @@
+"""
+Named SQL statements.
+
+Every statement in shared.data.queries is registered here under a dotted
+name (e.g. "interview.get_by_id"). A registered Query is still a str, so it
+can be passed anywhere psycopg expects SQL, but running it through
+Query.run() prepares it server-side on the pooled connection, builds rows
+with the statement's row factory and records per-statement latency and
+row counts.
+"""
+import time
+import threading
+
+
+class QueryStats:
+    """Thread-safe call, latency and row counters for one statement"""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.rows = 0
+        self.ms_total = 0.0
+        self.ms_max = 0.0
+        self.lock = threading.Lock()
+
+    def record(self, elapsed_ms, rows):
+        """Record one execution"""
+        with self.lock:
+            self.calls += 1
+            self.rows += max(rows, 0)
+            self.ms_total += elapsed_ms
+            self.ms_max = max(self.ms_max, elapsed_ms)
+
+    def record_error(self):
+        """Record a failed execution"""
+        with self.lock:
+            self.errors += 1
+
+    def snapshot(self):
+        """Return the counters as a dict"""
+        with self.lock:
+            avg = self.ms_total / self.calls if self.calls else 0.0
+            return {
+                "calls": self.calls,
+                "errors": self.errors,
+                "rows": self.rows,
+                "ms_avg": round(avg, 3),
+                "ms_max": round(self.ms_max, 3),
+            }
+
+
+class Query(str):
+    """A named SQL statement with its own counters and optional row factory"""
+
+    def __new__(cls, name, sql, row_factory=None):
+        query = super().__new__(cls, sql)
+        query.name = name
+        query.row_factory = row_factory
+        query.stats = QueryStats()
+        return query
+
+    def cursor(self, conn):
+        """Returns a cursor on conn that builds rows with this query's row factory"""
+        if self.row_factory is None:
+            return conn.cursor()
+        return conn.cursor(row_factory=self.row_factory)
+
+    def run(self, conn, values=None):
+        """Executes the statement as a prepared statement and returns the cursor"""
+        start = time.perf_counter()
+        try:
+            cursor = self.cursor(conn).execute(self, values, prepare=True)
+        except Exception:
+            self.stats.record_error()
+            raise
+        self.stats.record((time.perf_counter() - start) * 1000,
+                          cursor.rowcount)
+        return cursor
+
+    async def run_async(self, conn, values=None):
+        """Async counterpart to run()"""
+        start = time.perf_counter()
+        try:
+            cursor = await self.cursor(conn).execute(self, values, prepare=True)
+        except Exception:
+            self.stats.record_error()
+            raise
+        self.stats.record((time.perf_counter() - start) * 1000,
+                          cursor.rowcount)
+        return cursor
+
+
+_queries = {}
+
+
+def register(name, sql, row_factory=None) -> Query:
+    """Registers a statement under a unique name"""
+    if name in _queries:
+        raise ValueError(f"query {name} is already registered")
+    query = Query(name, sql, row_factory)
+    _queries[name] = query
+    return query
+
+
+def get(name) -> Query:
+    """Returns a registered statement by name"""
+    if name not in _queries:
+        raise KeyError(f"unknown query {name}")
+    return _queries[name]
+
+
+def names() -> list:
+    """Returns all registered statement names"""
+    return sorted(_queries)
+
+
+def stats() -> dict:
+    """Returns counters for every statement that has been run"""
+    return {
+        name: query.stats.snapshot()
+        for name, query in sorted(_queries.items())
+        if query.stats.calls or query.stats.errors
+    }
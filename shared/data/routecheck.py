@@ -0,0 +1,114 @@
+"""
+Checks read/write routing between the writer and a read replica.
+
+usage (from web/ or events/, against local databases only):
+    POSTGRES_READER_HOST=localhost:5433 python -m shared.data.routecheck
+
+The reader is a second database rather than a real replica, so each side
+is given its own copy of the same conversation and the copy a read returns
+shows which database served it. Exits 1 if a read went to the
+wrong side.
+"""
+import sys
+import uuid
+import json
+from datetime import datetime, timezone
+
+from shared.config import config
+from shared.data import queries
+from shared.data.database import Database
+
+SEED_PREFIX = "routecheck"
+
+INSERT_CONVERSATION = """
+    INSERT INTO conversation (id, created, user_id, data, summary)
+    VALUES (%s, %s, %s, %s, '')
+"""
+
+DELETE_CONVERSATION = "DELETE FROM conversation WHERE id = %s"
+
+DELETE_SETTING = "DELETE FROM settings WHERE key = %s"
+
+
+def mark(db: Database, id):
+    """creates conversation id on both sides, tagged with the side it's on"""
+    for read, side in ((False, "writer"), (True, "reader")):
+        with db._checkout(read) as conn:
+            conn.execute(INSERT_CONVERSATION, (
+                id, datetime.now(timezone.utc), f"{SEED_PREFIX}-user",
+                json.dumps({SEED_PREFIX: side})))
+
+
+def unmark(db: Database, id, key):
+    for read in (False, True):
+        with db._checkout(read) as conn:
+            conn.execute(DELETE_CONVERSATION, (id,))
+            conn.execute(DELETE_SETTING, (key,))
+
+
+def served_by(db: Database, id) -> str:
+    """which side a conversation read went to"""
+    return db.get(id)[SEED_PREFIX]
+
+
+def check(db: Database) -> list:
+    """returns (name, ok, detail) for each routing case"""
+
+    id = str(uuid.uuid4())
+    written = f"{SEED_PREFIX}-{id}"
+    mark(db, id)
+
+    def case(name, expected, served):
+        return (name, served == expected, f"expected {expected}, got {served}")
+
+    results = []
+    try:
+        results.append(case("read outside a session", "reader",
+                            served_by(db, id)))
+
+        with db.session():
+            results.append(case("read before a write", "reader",
+                                served_by(db, id)))
+            db.set_setting(written, "1")
+            results.append(case("read after a write", "writer",
+                                served_by(db, id)))
+
+        with db.session(read_only=True):
+            results.append(case("read-only session", "reader",
+                                served_by(db, id)))
+
+        with db.session(pinned=True):
+            results.append(case("pinned session", "writer",
+                                served_by(db, id)))
+
+        with db._checkout() as conn:
+            record = queries.SETTING_GET.run(conn, (written,)).fetchone()
+        results.append(case("write lands on the writer", "writer",
+                            "writer" if record else "reader"))
+    finally:
+        unmark(db, id, written)
+
+    return results
+
+
+def main():
+    if config.postgres_secret_arn:
+        sys.exit("routecheck only runs against a local database")
+    if not config.postgres_reader_host:
+        sys.exit("set POSTGRES_READER_HOST to the reader database")
+
+    db = Database()
+    try:
+        results = check(db)
+    finally:
+        db.close()
+
+    failed = 0
+    for name, ok, detail in results:
+        print(f"{'ok  ' if ok else 'FAIL'}  {name}  ({detail})")
+        failed += not ok
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
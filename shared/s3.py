@@ -340,3 +340,42 @@ def move_object(src: str, dest: str) -> None:
 
     # Delete original
     s3_client.delete_object(Bucket=bucket, Key=src)
+
+
+def upload_file(path: str, key: str, bucket_name: str = None) -> str:
+    """
+    Upload a local file to S3, in parts for large files.
+
+    Args:
+        path: The local file to upload
+        key: The S3 object key (path/filename)
+        bucket_name: The S3 bucket name (if None, will use config.s3_bucket_name)
+
+    Returns:
+        str: The S3 URI of the uploaded object (s3://bucket-name/key)
+    """
+    if not bucket_name:
+        bucket_name = config.s3_bucket_name
+
+    s3_client.upload_file(path, bucket_name, key)
+
+    s3_uri = f"s3://{bucket_name}/{key}"
+    logging.info(f"Successfully uploaded {path} to {s3_uri}")
+    return s3_uri
+
+
+def open_object(key: str, bucket_name: str = None):
+    """
+    Open an S3 object for streaming reads.
+
+    Args:
+        key: The S3 object key (path/filename)
+        bucket_name: The S3 bucket name (if None, will use config.s3_bucket_name)
+
+    Returns:
+        A binary file-like object, close it when done
+    """
+    if not bucket_name:
+        bucket_name = config.s3_bucket_name
+
+    return s3_client.get_object(Bucket=bucket_name, Key=key)["Body"]
@@ -0,0 +1,30 @@
+from datetime import date, datetime, timezone
+
+import pytest
+
+from shared.data import archive
+
+
+@pytest.mark.parametrize("month, n, expected", [
+    (date(2025, 1, 1), 0, date(2025, 1, 1)),
+    (date(2025, 1, 1), 1, date(2025, 2, 1)),
+    (date(2025, 11, 1), 2, date(2026, 1, 1)),
+    (date(2025, 1, 1), -1, date(2024, 12, 1)),
+    (date(2025, 3, 1), -15, date(2023, 12, 1)),
+    (date(2025, 6, 1), 24, date(2027, 6, 1)),
+])
+def test_add_months(month, n, expected):
+    assert archive.add_months(month, n) == expected
+
+
+def test_month_bounds():
+    assert archive.month_bounds(date(2025, 2, 1)) == (
+        datetime(2025, 2, 1, tzinfo=timezone.utc),
+        datetime(2025, 3, 1, tzinfo=timezone.utc),
+    )
+
+
+def test_month_bounds_across_a_year():
+    start, end = archive.month_bounds(date(2024, 12, 1))
+    assert start == datetime(2024, 12, 1, tzinfo=timezone.utc)
+    assert end == datetime(2025, 1, 1, tzinfo=timezone.utc)
@@ -0,0 +1,100 @@
+import pytest
+
+from shared.data import catalog_import
+
+YAML = """
+scopes:
+  - name: " Engineering "
+    description: How we build and run our services
+    topics:
+      - name: Deployments
+        areas:
+          - Release process
+          - " Rollbacks "
+          - ""
+"""
+
+CSV = """scope,scope_description,topic,description,areas
+Engineering,How we build,Deployments,Shipping changes,Release process|Rollbacks
+Engineering,,On-call,,Paging
+Sales,,,,
+"""
+
+
+def errors_of(payload) -> list:
+    with pytest.raises(catalog_import.CatalogImportError) as e:
+        catalog_import.validate(payload)
+    return e.value.errors
+
+
+def test_load_yaml():
+    assert catalog_import.load(YAML, "yaml") == [{
+        "name": "Engineering",
+        "description": "How we build and run our services",
+        "topics": [{
+            "name": "Deployments",
+            "description": None,
+            "areas": ["Release process", "Rollbacks"],
+        }],
+    }]
+
+
+def test_load_csv():
+    scopes = catalog_import.load(CSV, "csv")
+    assert [scope["name"] for scope in scopes] == ["Engineering", "Sales"]
+    assert scopes[0]["description"] == "How we build"
+    assert scopes[0]["topics"] == [
+        {"name": "Deployments", "description": "Shipping changes",
+         "areas": ["Release process", "Rollbacks"]},
+        {"name": "On-call", "description": None, "areas": ["Paging"]},
+    ]
+    assert scopes[1]["topics"] == []
+
+
+def test_csv_needs_scope_topic_and_areas_columns():
+    with pytest.raises(catalog_import.CatalogImportError):
+        catalog_import.load("scope,topic\nEngineering,Deployments\n", "csv")
+
+
+@pytest.mark.parametrize("payload", [None, [], {"scopes": []}, "Engineering"])
+def test_validate_needs_a_list_of_scopes(payload):
+    assert errors_of(payload) == ["expected a list of scopes"]
+
+
+def test_validate_lists_every_problem():
+    errors = errors_of([
+        {"name": "Engineering", "topics": [
+            {"name": "Deployments", "areas": ["Rollbacks"]},
+            {"name": "Deployments", "areas": []},
+            {"areas": "Paging"},
+            "On-call",
+        ]},
+        {"name": "Engineering", "description": 42},
+        {"topics": "Deployments"},
+    ])
+    assert errors == [
+        "scopes[0].topics[1]: topic Deployments is listed more than once in Engineering",
+        "scopes[0].topics[1]: at least one area is required",
+        "scopes[0].topics[2]: name is required",
+        "scopes[0].topics[3]: expected a topic",
+        "scopes[1]: scope Engineering is listed more than once",
+        "scopes[1]: description must be text",
+        "scopes[2]: name is required",
+        "scopes[2]: topics must be a list",
+    ]
+
+
+def test_validate_limits_topics(monkeypatch):
+    monkeypatch.setattr(catalog_import, "MAX_TOPICS", 1)
+    errors = errors_of([{"name": "Engineering", "topics": [
+        {"name": "Deployments", "areas": ["Rollbacks"]},
+        {"name": "On-call", "areas": ["Paging"]},
+    ]}])
+    assert errors == ["at most 1 topics can be imported at once"]
+
+
+def test_format_of():
+    assert catalog_import.format_of("Catalog.YML") == "yaml"
+    assert catalog_import.format_of("catalog.csv") == "csv"
+    with pytest.raises(catalog_import.CatalogImportError):
+        catalog_import.format_of("catalog.xlsx")
@@ -0,0 +1,77 @@
+import time
+
+import psycopg
+import pytest
+
+from shared.data import database
+from shared.data.database import CredentialCache, Database
+
+
+@pytest.fixture
+def now(monkeypatch):
+    clock = [1_000_000.0]
+    monkeypatch.setattr(time, "time", lambda: clock[0])
+    return clock
+
+
+def test_refresh_is_due_before_expiry(now):
+    cache = CredentialCache(ttl_seconds=100, refresh_ratio=0.75, jitter_ratio=0.1)
+    assert cache.needs_refresh() and not cache.is_valid()
+
+    cache.update("user", "secret")
+    assert 65 <= cache.seconds_until_refresh() <= 75
+    assert not cache.needs_refresh() and cache.is_valid()
+
+    now[0] += 76
+    assert cache.needs_refresh() and cache.is_valid()
+
+    # expired credentials are still served until a refresh succeeds
+    now[0] += 25
+    assert not cache.is_valid()
+    assert cache.get_credentials() == ("user", "secret")
+    assert cache.snapshot()["expired"]
+
+
+def test_snapshot_counts_refreshes_and_failures():
+    cache = CredentialCache()
+    cache.record_refresh(10.0)
+    cache.record_refresh(30.0, auth_failure=True)
+    cache.record_failure(RuntimeError("throttled"))
+    snapshot = cache.snapshot()
+    assert snapshot["refreshes"] == 2
+    assert snapshot["auth_failure_refreshes"] == 1
+    assert snapshot["refresh_ms_avg"] == 20.0
+    assert snapshot["refresh_ms_max"] == 30.0
+    assert snapshot["failures"] == 1
+    assert snapshot["last_error"] == "throttled"
+
+
+def test_load_credentials_without_a_secret_uses_the_configured_ones():
+    assert database.load_credentials(None, "user", "secret") == ("user", "secret")
+
+
+def test_auth_failure_refreshes_coalesce(monkeypatch):
+    cache = CredentialCache()
+    monkeypatch.setattr(Database, "_credential_cache", cache)
+    fetches = []
+
+    def fetch(secret_arn, auth_failure=False):
+        fetches.append(auth_failure)
+        cache.update("user", "rotated")
+        return cache.get_credentials()
+
+    monkeypatch.setattr(database, "fetch_credentials", fetch)
+    cache.update("user", "old")
+
+    assert database.refresh_after_auth_failure("arn", "old") == ("user", "rotated")
+    # a connection that failed with the old password while the first refreshed
+    assert database.refresh_after_auth_failure("arn", "old") == ("user", "rotated")
+    assert fetches == [True]
+
+
+@pytest.mark.parametrize("error, expected", [
+    (psycopg.OperationalError('FATAL:  password authentication failed for user "scribe"'), True),
+    (psycopg.OperationalError("connection refused"), False),
+])
+def test_is_auth_failure(error, expected):
+    assert database.is_auth_failure(error) == expected
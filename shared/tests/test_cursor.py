@@ -0,0 +1,29 @@
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from shared.data import queries
+
+
+def test_cursor_round_trip():
+    created = datetime(2025, 3, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+    id = uuid.uuid4()
+    cursor = queries.encode_cursor(created, id)
+    assert queries.decode_cursor(cursor) == (created, str(id))
+
+
+def test_cursor_is_url_safe():
+    cursor = queries.encode_cursor(datetime.now(timezone.utc), uuid.uuid4())
+    assert "=" not in cursor
+    assert "+" not in cursor and "/" not in cursor
+
+
+@pytest.mark.parametrize("cursor", [
+    "",
+    "not a cursor",
+    queries.encode_cursor(datetime.now(timezone.utc), "not-a-uuid"),
+])
+def test_decode_cursor_rejects_malformed(cursor):
+    with pytest.raises(ValueError):
+        queries.decode_cursor(cursor)
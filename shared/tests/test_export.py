@@ -0,0 +1,49 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from shared.data import export
+
+
+def test_filters_defaults():
+    assert export.filters("interviews", "ndjson") == {
+        "scope_id": None,
+        "topic_id": None,
+        "statuses": None,
+        "since": None,
+        "until": None,
+    }
+
+
+def test_filters_parse_their_values():
+    scope_id, topic_id = str(uuid.uuid4()), str(uuid.uuid4())
+    values = export.filters("interview_turns", "csv", scope_id, topic_id,
+                            ["approved", "started"], "2025-01-01",
+                            "2025-02-01T00:00:00+02:00")
+    assert values["scope_id"] == uuid.UUID(scope_id)
+    assert values["topic_id"] == uuid.UUID(topic_id)
+    assert values["statuses"] == ["approved", "started"]
+    assert values["since"] == datetime(2025, 1, 1, tzinfo=timezone.utc)
+    assert values["until"] == datetime(
+        2025, 2, 1, tzinfo=timezone(timedelta(hours=2)))
+
+
+@pytest.mark.parametrize("args", [
+    ("interviewz", "ndjson"),
+    ("interviews", "parquet"),
+    ("conversations", "ndjson", None, str(uuid.uuid4())),
+    ("conversation_turns", "csv", None, None, ["approved"]),
+    ("interviews", "ndjson", None, None, ["not a status"]),
+    ("interviews", "ndjson", "not-a-uuid"),
+    ("interviews", "ndjson", None, None, None, "yesterday"),
+])
+def test_filters_reject_bad_options(args):
+    with pytest.raises(ValueError):
+        export.filters(*args)
+
+
+def test_filename():
+    now = datetime(2025, 3, 4, 5, 6, 7, tzinfo=timezone.utc)
+    assert export.filename("conversations", "csv", now) == \
+        "conversations-20250304-050607.csv"
@@ -0,0 +1,36 @@
+import re
+import uuid
+from datetime import datetime, timezone
+
+from shared.data import queries
+from shared.data.data_models import InterviewRecord, InterviewStatus
+
+PAYLOADS = {"data", "summary", "voice_session_metadata"}
+
+
+def columns(select) -> list:
+    """the names a select list's columns come back as"""
+    names = []
+    for column in select.split(","):
+        column = column.strip()
+        alias = re.search(r"\bAS\s+(\w+)$", column, re.IGNORECASE)
+        names.append(alias[1] if alias else column.split(".")[-1])
+    return names
+
+
+def test_header_columns_leave_out_the_payloads():
+    names = columns(queries.INTERVIEW_HEADER_COLUMNS)
+    assert not PAYLOADS & set(names)
+    assert set(names) <= set(InterviewRecord.__slots__)
+    assert set(names) < set(columns(queries.INTERVIEW_COLUMNS))
+
+
+def test_header_row_maps_to_an_interview_without_payloads():
+    row = {name: None for name in columns(queries.INTERVIEW_HEADER_COLUMNS)}
+    row.update(id=uuid.uuid4(), created=datetime.now(timezone.utc),
+               user_id="user", status="started", voice_mode=True)
+    interview = InterviewRecord(**row).to_interview()
+    assert interview.status == InterviewStatus.STARTED
+    assert interview.questions == []
+    assert interview.summary is None
+    assert interview.voice_mode
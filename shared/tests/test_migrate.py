@@ -0,0 +1,61 @@
+from shared.data import migrate
+
+
+def migration(tmp_path, sql, name="0001_test.sql"):
+    path = tmp_path / name
+    path.write_text(sql)
+    return migrate.Migration(str(path))
+
+
+def test_statements_split_on_trailing_semicolons(tmp_path):
+    m = migration(tmp_path, """
+-- a comment; not a statement
+CREATE TABLE a (id INTEGER);
+
+CREATE INDEX a_id
+  ON a (id);
+""")
+    assert m.statements() == [
+        "CREATE TABLE a (id INTEGER)",
+        "CREATE INDEX a_id\n  ON a (id)",
+    ]
+
+
+def test_statements_keep_dollar_quoted_bodies_whole(tmp_path):
+    m = migration(tmp_path, """
+CREATE FUNCTION f() RETURNS trigger AS $$
+BEGIN
+  -- kept, it's inside the body
+  DELETE FROM a;
+  RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+DO $$ BEGIN PERFORM f(); END $$;
+""")
+    statements = m.statements()
+    assert len(statements) == 2
+    assert statements[0].startswith("CREATE FUNCTION f()")
+    assert "-- kept, it's inside the body" in statements[0]
+    assert statements[0].endswith("$$ LANGUAGE plpgsql")
+    assert statements[1] == "DO $$ BEGIN PERFORM f(); END $$"
+
+
+def test_statements_keep_a_last_statement_without_semicolon(tmp_path):
+    m = migration(tmp_path, "SELECT 1;\nSELECT 2\n")
+    assert m.statements() == ["SELECT 1", "SELECT 2"]
+
+
+def test_no_transaction_header(tmp_path):
+    m = migration(tmp_path, migrate.NO_TRANSACTION +
+                  "\nCREATE INDEX CONCURRENTLY IF NOT EXISTS a_id ON a (id);\n",
+                  name="0002_concurrent.sql")
+    assert not m.transactional
+    assert m.version == 2
+    assert m.statements() == ["CREATE INDEX CONCURRENTLY IF NOT EXISTS a_id ON a (id)"]
+
+
+def test_repo_migrations_load_in_order():
+    migrations = migrate.load_migrations()
+    versions = [m.version for m in migrations]
+    assert versions == sorted(versions)
+    assert all(m.statements() for m in migrations)
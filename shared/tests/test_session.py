@@ -0,0 +1,152 @@
+from contextlib import contextmanager
+
+import pytest
+
+from shared.data.database import Database
+
+
+class FakeConnection:
+    def __init__(self, events, read):
+        self.events = events
+        self.read = read
+        self.closed = False
+        self.autocommit = False
+
+    def commit(self):
+        self.events.append("commit")
+
+
+class FakeDatabase(Database):
+    """a Database whose pooled connections are recorded instead of opened"""
+
+    def __init__(self, reader_host=None):
+        super().__init__()
+        self.reader_host = reader_host
+        self.events = []
+
+    @contextmanager
+    def _checkout(self, read=False):
+        conn = FakeConnection(self.events, read)
+        self.events.append("checkout reader" if read else "checkout")
+        try:
+            yield conn
+        except BaseException:
+            self.events.append("rollback")
+            raise
+        self.events.append("commit and return")
+
+
+def test_session_shares_one_lazily_checked_out_connection():
+    db = FakeDatabase()
+    with db.session():
+        assert db.events == []
+        with db.connect() as first:
+            pass
+        with db.connect() as second:
+            pass
+        assert first is second
+    assert db.events == ["checkout", "commit and return"]
+
+
+def test_session_rolls_back_on_error():
+    db = FakeDatabase()
+    with pytest.raises(ValueError):
+        with db.session():
+            with db.connect():
+                raise ValueError()
+    assert db.events == ["checkout", "rollback"]
+
+
+def test_connect_outside_a_session_commits_each_block():
+    db = FakeDatabase()
+    with db.connect():
+        pass
+    with db.connect():
+        pass
+    assert db.events == ["checkout", "commit and return"] * 2
+
+
+def test_release_returns_the_connection_until_the_next_call():
+    db = FakeDatabase()
+    with db.session():
+        with db.connect():
+            pass
+        db.release()
+        assert db.events == ["checkout", "commit and return"]
+        with db.connect():
+            pass
+    assert db.events == ["checkout", "commit and return"] * 2
+
+
+def test_read_only_session_runs_in_autocommit():
+    db = FakeDatabase()
+    with db.session(read_only=True):
+        with db.connect() as conn:
+            assert conn.autocommit
+    assert not conn.autocommit
+
+
+def test_after_commit_waits_for_the_session_to_commit():
+    db = FakeDatabase()
+    with db.session():
+        with db.connect():
+            pass
+        db._after_commit(lambda: db.events.append("callback"))
+        assert "callback" not in db.events
+    assert db.events == ["checkout", "commit and return", "callback"]
+
+
+def test_after_commit_is_dropped_on_rollback():
+    db = FakeDatabase()
+    with pytest.raises(ValueError):
+        with db.session():
+            with db.connect():
+                pass
+            db._after_commit(lambda: db.events.append("callback"))
+            raise ValueError()
+    assert db.events == ["checkout", "rollback"]
+
+
+def test_after_commit_runs_at_commit():
+    db = FakeDatabase()
+    with db.session():
+        with db.connect():
+            pass
+        db._after_commit(lambda: db.events.append("callback"))
+        db.commit()
+        assert db.events == ["checkout", "commit", "callback"]
+
+
+def test_after_commit_outside_a_session_runs_right_away():
+    db = FakeDatabase()
+    db._after_commit(lambda: db.events.append("callback"))
+    assert db.events == ["callback"]
+
+
+def test_reads_go_to_the_replica_until_the_session_writes():
+    db = FakeDatabase(reader_host="reader")
+    with db.session():
+        with db.connect(read=True) as conn:
+            assert conn.read and conn.autocommit
+        with db.connect():
+            pass
+        with db.connect(read=True) as conn:
+            assert not conn.read
+    assert db.events[:2] == ["checkout reader", "checkout"]
+    assert db.events.count("checkout") == 1
+
+
+def test_pinned_session_reads_from_the_writer():
+    db = FakeDatabase(reader_host="reader")
+    with db.session(pinned=True):
+        with db.connect(read=True) as conn:
+            assert not conn.read
+    assert db.events == ["checkout", "commit and return"]
+
+
+def test_reads_go_to_the_writer_without_a_replica():
+    db = FakeDatabase()
+    with db.session():
+        with db.connect(read=True) as conn:
+            assert not conn.read
+    assert db.events == ["checkout", "commit and return"]
@@ -9,6 +9,7 @@ interface DatabaseCredentials {
 
 let dbClient: Client | null = null;
 let credentials: DatabaseCredentials | null = null;
+let appendQueue: Promise<void> = Promise.resolve();
 
 async function getCredentials(): Promise<DatabaseCredentials> {
   if (credentials) {
@@ -62,57 +63,51 @@ export async function appendVoiceTranscriptionEntry(interviewId: string, questio
   const client = await getDbClient();
   log.debug(`Database client obtained successfully`);
 
-  // First, get current data to see what we're working with
-  const selectQuery = `SELECT data FROM interview WHERE id = $1`;
-  log.debug(`Fetching current data with query: ${selectQuery}`);
-
-  try {
-    const currentResult = await client.query(selectQuery, [interviewId]);
-    log.debug(`Current data query result:`, currentResult.rows);
-
-    if (currentResult.rows.length === 0) {
-      log.error(`No interview found with id ${interviewId}`);
-      throw new Error(`Interview not found: ${interviewId}`);
+  // Each Q&A is its own interview_turn row, appended after the latest one.
+  // The advisory lock (the same one the Python app takes, see
+  // INTERVIEW_TURN_LOCK in shared/data/queries.py) serializes appends to
+  // the interview until commit, so two writers can't read the same MAX(seq).
+  // Nothing references interview from interview_turn, so the insert checks
+  // the interview exists and inserts nothing otherwise
+  const lockQuery = `SELECT pg_advisory_xact_lock(hashtextextended('interview_turn:' || $1::text, 0))`;
+  const insertQuery = `INSERT INTO interview_turn (interview_id, seq, q, a)
+    SELECT $1, COALESCE(MAX(seq) + 1, 0), $2, $3
+    FROM interview_turn
+    WHERE interview_id = $1
+    HAVING EXISTS (SELECT 1 FROM interview WHERE id = $1)`;
+  const values = [interviewId, question, answer];
+
+  // the client is shared, so appends from this process take turns
+  // rather than interleaving their transactions on it
+  const append = appendQueue.then(async () => {
+    try {
+      log.debug(`Insert query: ${insertQuery}`);
+      log.debug(`Insert values:`, values);
+
+      await client.query('BEGIN');
+      await client.query(lockQuery, [interviewId]);
+      const insertResult = await client.query(insertQuery, values);
+      log.debug(`Rows affected: ${insertResult.rowCount}`);
+
+      if (insertResult.rowCount === 0) {
+        log.error(`Interview ${interviewId} not found`);
+        throw new Error(`Interview not found: ${interviewId}`);
+      }
+
+      await client.query('COMMIT');
+      log.info(`Successfully appended Q&A to interview ${interviewId}`);
+    } catch (error) {
+      await client.query('ROLLBACK').catch(() => undefined);
+      log.error(`Database operation failed:`, error);
+      log.error(`Error details:`, {
+        message: error instanceof Error ? error.message : 'Unknown error',
+        stack: error instanceof Error ? error.stack : undefined
+      });
+      throw error;
     }
-
-    const currentData = currentResult.rows[0].data || [];
-    log.debug(`Current interview data:`, JSON.stringify(currentData, null, 2));
-
-    // Create new Q&A entry
-    const newEntry = { q: question, a: answer };
-    log.debug(`New entry to append:`, JSON.stringify(newEntry, null, 2));
-
-    // Append to existing data
-    const updatedData = [...currentData, newEntry];
-    log.debug(`Updated data array:`, JSON.stringify(updatedData, null, 2));
-
-    // Update the database
-    const updateQuery = `UPDATE interview SET data = $1::jsonb WHERE id = $2`;
-    const values = [JSON.stringify(updatedData), interviewId];
-
-    log.debug(`Update query: ${updateQuery}`);
-    log.debug(`Update values:`, values);
-
-    const updateResult = await client.query(updateQuery, values);
-    log.debug(`Update result:`, updateResult);
-    log.debug(`Rows affected: ${updateResult.rowCount}`);
-
-    if (updateResult.rowCount === 0) {
-      log.error(`No rows updated for interview ${interviewId}`);
-      throw new Error(`Failed to update interview: ${interviewId}`);
-    }
-
-    log.info(`Successfully appended Q&A to interview ${interviewId}`);
-    log.debug(`Total questions now: ${updatedData.length}`);
-
-  } catch (error) {
-    log.error(`Database operation failed:`, error);
-    log.error(`Error details:`, {
-      message: error instanceof Error ? error.message : 'Unknown error',
-      stack: error instanceof Error ? error.stack : undefined
-    });
-    throw error;
-  }
+  });
+  appendQueue = append.catch(() => undefined);
+  return append;
 }
 
 export async function closeDbConnection(): Promise<void> {
@@ -1,13 +1,64 @@
+import io
+import csv
 import uuid
 import json
 import logging
 from datetime import datetime, timezone
-from flask import request, render_template, current_app, current_app
-from shared.data import database
+from flask import request, render_template, current_app, current_app, jsonify, Response
+from shared.data import database, export, catalog_import
 from auth import login_required, admin_required, get_cognito_users, decorate_interviews_with_usernames, get_current_user_id, get_current_user
 from typing import List, Dict, Optional
 from botocore.exceptions import ClientError
-from shared.data.data_models import Interview, InterviewStatus
+from shared.data.data_models import InterviewStatus
+
+# largest bulk assignment accepted in one request
+MAX_ASSIGNMENTS = 10000
+
+
+def resolve_assignments(rows, users, topics) -> tuple:
+    """
+    resolves (user, topic) rows to (topic_id, user_id) pairs, a user by
+    id, username or email and a topic by id, or by name when only one
+    topic has it. Returns (pairs, rows that couldn't be resolved)
+    """
+    user_ids = {}
+    for user in users:
+        for key in (user.id, user.username, user.email):
+            if key:
+                user_ids[key.lower()] = user.id
+
+    topic_ids = {}
+    names = {}
+    for topic in topics:
+        topic_ids[str(topic["id"])] = str(topic["id"])
+        names.setdefault(topic["name"].lower(), []).append(str(topic["id"]))
+    for name, ids in names.items():
+        if len(ids) == 1:
+            topic_ids.setdefault(name, ids[0])
+
+    pairs, unresolved = [], []
+    for user, topic in rows:
+        user_id = user_ids.get(user.strip().lower())
+        topic_id = topic_ids.get(topic.strip().lower())
+        if user_id and topic_id:
+            pairs.append((topic_id, user_id))
+        else:
+            unresolved.append((user, topic))
+    return pairs, unresolved
+
+
+def read_assignment_csv(file) -> list:
+    """(user, topic) rows of an uploaded CSV with user and topic columns"""
+    reader = csv.DictReader(io.TextIOWrapper(file.stream, encoding="utf-8-sig"))
+    if not reader.fieldnames or not {"user", "topic"} <= {
+            name.strip().lower() for name in reader.fieldnames}:
+        raise ValueError("the CSV needs a header row with user and topic columns")
+    rows = []
+    for record in reader:
+        record = {key.strip().lower(): value or "" for key, value in record.items() if key}
+        if record["user"].strip() or record["topic"].strip():
+            rows.append((record["user"], record["topic"]))
+    return rows
 
 
 def register_routes(app, db: database.Database):
@@ -21,6 +72,7 @@ def register_routes(app, db: database.Database):
         return render_template("admin.scope.add.html")
 
     @app.route("/admin/scopes/<id>")
+    @database.read_only_session
     @login_required
     @admin_required
     def scope_edit(id):
@@ -38,12 +90,13 @@ def register_routes(app, db: database.Database):
         """delete a scope"""
 
         logging.info(f"deleting scope {id}")
-        scope = db.delete_scope(id)
 
-        # fetch scopes from db
-        scopes = db.list_scopes()
+        # delete and re-list in one round trip
+        with db.pipeline() as p:
+            p.delete_scope(id)
+            scopes = p.list_scopes()
 
-        return render_template("admin.body.html", scopes=scopes)
+        return render_template("admin.body.html", scopes=scopes.result)
 
     @app.route("/admin/scopes/save", methods=["PUT"])
     @login_required
@@ -54,21 +107,23 @@ def register_routes(app, db: database.Database):
         name = request.form["name"]
         description = request.form["description"]
 
-        # is this a new scope or an update?
-        if "id" in request.form:
-            id = request.form["id"]
-            logging.info(f"updating scope {id}")
-            db.update_scope(id, name, description)
-        else:
-            logging.info(f"creating scope {name}")
-            db.create_scope(name, description, datetime.now(timezone.utc))
+        with db.pipeline() as p:
+            # is this a new scope or an update?
+            if "id" in request.form:
+                id = request.form["id"]
+                logging.info(f"updating scope {id}")
+                p.update_scope(id, name, description)
+            else:
+                logging.info(f"creating scope {name}")
+                p.create_scope(name, description, datetime.now(timezone.utc))
 
-        # fetch scopes from db
-        scopes = db.list_scopes()
+            # fetch scopes from db
+            scopes = p.list_scopes()
 
-        return render_template("admin.body.html", scopes=scopes)
+        return render_template("admin.body.html", scopes=scopes.result)
 
     @app.route("/admin/scopes/cancel")
+    @database.read_only_session
     @login_required
     @admin_required
     def scope_cancel():
@@ -80,6 +135,7 @@ def register_routes(app, db: database.Database):
         return render_template("admin.body.html", scopes=scopes)
 
     @app.route("/admin/topics/<scope_id>")
+    @database.read_only_session
     @login_required
     @admin_required
     def topics_list(scope_id):
@@ -94,6 +150,7 @@ def register_routes(app, db: database.Database):
         return render_template("admin.topics.html", scope=scope, topics=topics)
 
     @app.route("/admin/topics/add/<scope_id>")
+    @database.read_only_session
     @login_required
     @admin_required
     def topic_add(scope_id):
@@ -111,6 +168,7 @@ def register_routes(app, db: database.Database):
             users=users)
 
     @app.route("/admin/topics/edit/<id>")
+    @database.read_only_session
     @login_required
     @admin_required
     def topic_edit(id):
@@ -160,50 +218,45 @@ def register_routes(app, db: database.Database):
         areas = [area.strip()
                  for area in areas_text.split("\n") if area.strip()]
 
-        # does this topic already exist or is it new?
-        if "id" in request.form:
-            # topic exists
-
-            # save topic
-            id = request.form["id"]
-            logging.info(f"updating topic {id}")
-            db.update_topic(id, name, description, areas)
+        # queue the writes and the re-read of the topic list
+        # so the whole save is a single round trip
+        with db.pipeline() as p:
+            # does this topic already exist or is it new?
+            if "id" in request.form:
+                # topic exists
+
+                # save topic
+                id = request.form["id"]
+                logging.info(f"updating topic {id}")
+                p.update_topic(id, name, description, areas)
+            else:
+                # new topic
+                logging.info(f"creating topic {name} for scope {scope_id}")
+
+                # create a topic
+                topic = p.create_topic(
+                    name.strip(),
+                    description,
+                    areas,
+                    scope_id,
+                    datetime.now(timezone.utc)
+                )
+                id = topic["id"]
 
             # did the admin assign it to a user?
             if user_id:
                 # create a new interview for the user
                 # if there's not an existing one in-flight
-                interview = db.get_inflight_interview_by_user_topic(
-                    user_id, id)
-                if interview is None:
-                    interview = Interview.new(id, user_id)
-                    db.create_interview(interview)
-        else:
-            # new topic
-            logging.info(f"creating topic {name} for scope {scope_id}")
-
-            # create a topic
-            topic = db.create_topic(
-                name.strip(),
-                description,
-                areas,
-                scope_id,
-                datetime.now(timezone.utc)
-            )
-            id = topic["id"]
-
-            # create an interview if topic is assigned to a user
-            if user_id:
-                interview = Interview.new(id, user_id)
-                db.create_interview(interview)
+                p.assign_interview(id, user_id)
 
-        # fetch scope from database
-        scope = db.get_scope(scope_id)
+            # fetch scope from database
+            scope = p.get_scope(scope_id)
 
-        # fetch topics for this scope
-        topics = db.list_topics_by_scope(scope_id)
+            # fetch topics for this scope
+            topics = p.list_topics_by_scope(scope_id)
 
-        return render_template("admin.topics.html", scope=scope, topics=topics)
+        return render_template("admin.topics.html",
+                               scope=scope.result, topics=topics.result)
 
     @app.route("/admin/topics/<id>", methods=["DELETE"])
     @login_required
@@ -221,16 +274,18 @@ def register_routes(app, db: database.Database):
 
         scope_id = topic["scope_id"]
 
-        # Delete the topic
-        db.delete_topic(id)
+        with db.pipeline() as p:
+            # Delete the topic
+            p.delete_topic(id)
 
-        # fetch scope from database
-        scope = db.get_scope(scope_id)
+            # fetch scope from database
+            scope = p.get_scope(scope_id)
 
-        # fetch updated topics for this scope
-        topics = db.list_topics_by_scope(scope_id)
+            # fetch updated topics for this scope
+            topics = p.list_topics_by_scope(scope_id)
 
-        return render_template("admin.topics.html", scope=scope, topics=topics)
+        return render_template("admin.topics.html",
+                               scope=scope.result, topics=topics.result)
 
     @app.route("/admin/settings/talk-mode", methods=["POST"])
     @login_required
@@ -273,6 +328,7 @@ def register_routes(app, db: database.Database):
             return '<span class="text-danger">✗ Failed to update talk mode setting. Please try again or contact support if the problem persists.</span>', 500
 
     @app.route("/admin/settings/talk-mode/status")
+    @database.read_only_session
     @login_required
     @admin_required
     def get_talk_mode_status():
@@ -286,7 +342,219 @@ def register_routes(app, db: database.Database):
             # Return user-friendly error message
             return '<span class="text-danger">✗ Unable to retrieve talk mode status. Please refresh the page.</span>', 500
 
+    @app.route("/admin/metrics")
+    @database.read_only_session
+    @login_required
+    @admin_required
+    def admin_metrics():
+        """Database client metrics (connection pool usage, checkout latency)"""
+        return jsonify(db.get_metrics())
+
+    @app.route("/admin/stats")
+    @database.read_only_session
+    @login_required
+    @admin_required
+    def admin_stats():
+        """UI for interview counts, time-to-approval and backlog age"""
+        return render_template("admin.stats.html",
+                               stats=db.get_interview_stats(),
+                               statuses=list(InterviewStatus))
+
+    @app.route("/admin/stats.json")
+    @database.read_only_session
+    @login_required
+    @admin_required
+    def admin_stats_json():
+        """Interview counts, time-to-approval and backlog age"""
+        return jsonify(db.get_interview_stats())
+
+    def assign_bulk(rows):
+        """assigns interviews for (user, topic) rows, returns the report"""
+        if len(rows) > MAX_ASSIGNMENTS:
+            raise ValueError(
+                f"at most {MAX_ASSIGNMENTS} assignments can be made at once")
+
+        users = get_cognito_users()
+        topics = db.get_topic_catalog()
+        pairs, unresolved = resolve_assignments(rows, users, topics)
+        logging.info(
+            f"assigning {len(pairs)} interviews ({len(unresolved)} rows unresolved)")
+        result = {"created": [], "skipped": []}
+        if pairs:
+            result = db.assign_interviews(pairs)
+
+        usernames = {user.id: user.username for user in users}
+        topic_names = {str(topic["id"]): topic["name"] for topic in topics}
+
+        def named(pairs):
+            return [{"topic_id": topic_id, "topic": topic_names.get(topic_id),
+                     "user_id": user_id, "user": usernames.get(user_id)}
+                    for topic_id, user_id in pairs]
+
+        return {
+            "created": len(result["created"]),
+            "skipped": len(result["skipped"]),
+            "unresolved": len(unresolved),
+            "skipped_assignments": named(result["skipped"]),
+            "unresolved_rows": [{"user": user, "topic": topic}
+                                for user, topic in unresolved],
+        }
+
+    @app.route("/admin/assign")
+    @database.read_only_session
+    @login_required
+    @admin_required
+    def assign_form():
+        """UI for assigning interviews to many users and topics at once"""
+        return render_template("admin.assign.html",
+                               topics=db.get_topic_catalog(),
+                               users=get_cognito_users())
+
+    @app.route("/admin/assign", methods=["POST"])
+    @login_required
+    @admin_required
+    def assign():
+        """
+        assign interviews to every selected user for every selected
+        topic, and for each row of an uploaded CSV
+        """
+        user_ids = request.form.getlist("user_ids")
+        topic_ids = request.form.getlist("topic_ids")
+        rows = [(user_id, topic_id)
+                for user_id in user_ids for topic_id in topic_ids]
+        try:
+            file = request.files.get("file")
+            if file and file.filename:
+                rows += read_assignment_csv(file)
+            report = assign_bulk(rows)
+        except (ValueError, UnicodeDecodeError, csv.Error) as e:
+            return render_template("admin.assign.result.html", error=str(e))
+
+        return render_template("admin.assign.result.html", report=report)
+
+    @app.route("/admin/assign.json", methods=["POST"])
+    @login_required
+    @admin_required
+    def assign_json():
+        """
+        Assigns interviews in bulk, skipping users who already have one in
+        flight for the topic.
+
+        Request body (either or both):
+        {
+            "users": ["user id, username or email", ...],
+            "topics": ["topic id or name", ...],   # every user gets every topic
+            "assignments": [{"user": "...", "topic": "..."}, ...]
+        }
+        """
+        body = request.get_json(silent=True) or {}
+        try:
+            rows = [(user, topic)
+                    for user in body.get("users", [])
+                    for topic in body.get("topics", [])]
+            rows += [(a["user"], a["topic"])
+                     for a in body.get("assignments", [])]
+            if not rows:
+                raise ValueError("no assignments given")
+            return jsonify(assign_bulk(rows))
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            return jsonify({'error': f"invalid assignments: {e}"}), 400
+
+    @app.route("/admin/import")
+    @database.read_only_session
+    @login_required
+    @admin_required
+    def import_form():
+        """UI for importing scopes and topics from a file"""
+        return render_template("admin.import.html")
+
+    @app.route("/admin/import", methods=["POST"])
+    @login_required
+    @admin_required
+    def import_catalog():
+        """create or update the scopes and topics of an uploaded file"""
+
+        file = request.files.get("file")
+        if not file or not file.filename:
+            return render_template("admin.import.html",
+                                   errors=["choose a file to import"])
+        try:
+            text = file.stream.read().decode("utf-8-sig")
+            scopes = catalog_import.load(
+                text, catalog_import.format_of(file.filename))
+        except UnicodeDecodeError:
+            return render_template("admin.import.html",
+                                   errors=["the file isn't UTF-8 text"])
+        except catalog_import.CatalogImportError as e:
+            return render_template("admin.import.html", errors=e.errors)
+
+        logging.info(f"importing {len(scopes)} scopes from {file.filename}")
+        result = db.import_catalog(scopes)
+
+        # the imported scopes' topics, read once
+        scope_ids = {row["id"] for row in result["scopes"]}
+        topics = [topic for topic in db.get_topic_catalog()
+                  if topic["scope_id"] in scope_ids]
+
+        return render_template("admin.import.result.html",
+                               counts=catalog_import.summary(result),
+                               topics=topics)
+
+    @app.route("/admin/import.json", methods=["POST"])
+    @login_required
+    @admin_required
+    def import_catalog_json():
+        """
+        Creates or updates scopes and topics, see shared.data.catalog_import
+        for the format. Nothing is imported unless all of it validates.
+        """
+        try:
+            scopes = catalog_import.validate(request.get_json(silent=True))
+        except catalog_import.CatalogImportError as e:
+            return jsonify({'error': 'invalid import', 'errors': e.errors}), 400
+
+        result = db.import_catalog(scopes)
+        return jsonify({
+            **catalog_import.summary(result),
+            "scope_ids": {row["name"]: row["id"] for row in result["scopes"]},
+        })
+
+    @app.route("/admin/export/<kind>")
+    @database.read_only_session
+    @login_required
+    @admin_required
+    def admin_export(kind):
+        """
+        Streams interviews, conversations or their turns as NDJSON or CSV
+        (see shared.data.export).
+
+        Query parameters:
+        - format: ndjson (default) or csv
+        - scope_id, topic_id: only this scope's or topic's
+        - status: only interviews in this status (repeatable)
+        - since, until: created from since until before until (ISO dates)
+        """
+        format = request.args.get("format", "ndjson")
+        try:
+            values = export.filters(
+                kind, format,
+                scope_id=request.args.get("scope_id"),
+                topic_id=request.args.get("topic_id"),
+                statuses=request.args.getlist("status"),
+                since=request.args.get("since"),
+                until=request.args.get("until"))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        logging.info(f"exporting {kind} as {format}")
+        content_type, _ = export.FORMATS[format]
+        name = export.filename(kind, format, datetime.now(timezone.utc))
+        return Response(db.export(kind, format, values),
+                        content_type=content_type,
+                        headers={"Content-Disposition": f"attachment; filename={name}"})
+
     @app.route("/admin")
+    @database.read_only_session
     @login_required
     @admin_required
     def admin():
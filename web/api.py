@@ -3,6 +3,8 @@ import json
 import uuid
 from datetime import datetime, timezone
 from flask import request, abort, jsonify, Response, session
+from werkzeug.exceptions import HTTPException
+from markupsafe import escape
 import boto3
 from botocore.exceptions import ClientError
 
@@ -10,12 +12,68 @@ import chatbot
 from auth import login_required, get_current_user_id
 from shared.log import log
 from shared.llm import bedrock_kb, orchestrator
-from shared.data.database import Database
+from shared.data import queries
+from shared.data.database import Database, read_only_session
 from shared.data.data_models import InterviewStatus
 from shared.config import config
 from interviews import _complete_interview
 
 
+def page_args():
+    """reads the ?limit= and ?cursor= arguments of a paginated list endpoint"""
+    limit = request.args.get("limit", default=10, type=int)
+    limit = max(1, min(limit, 100))
+    return limit, request.args.get("cursor")
+
+
+def page_response(items, next_cursor):
+    """list response with the cursor for the next page in X-Next-Cursor"""
+    response = jsonify(items)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return response
+
+
+def interview_json(interview):
+    """json representation of an interview for list responses"""
+    return {
+        "id": interview.id,
+        "created": interview.created.isoformat(),
+        "user_id": interview.user_id,
+        "topic_id": interview.topic_id,
+        "topic_name": interview.topic_name,
+        "scope_name": interview.scope_name,
+        "status": interview.status.value,
+        "completed": interview.completed.isoformat() if interview.completed else None,
+        "voice_mode": interview.voice_mode,
+        "question_count": interview.question_count,
+    }
+
+
+def conversation_json(summary):
+    """json representation of a conversation summary for list responses"""
+    return {**summary, "created": summary["created"].isoformat()}
+
+
+def search_result_json(result):
+    """json representation of a local search result"""
+    # the headline is raw transcript text, escape it but keep the match markers
+    headline = str(escape(result["headline"]))
+    for marker in (queries.SEARCH_HIGHLIGHT_START, queries.SEARCH_HIGHLIGHT_STOP):
+        headline = headline.replace(str(escape(marker)), marker)
+    return {
+        "type": result["kind"],
+        "id": result["id"],
+        "title": result["title"],
+        "created": result["created"].isoformat() if result["created"] else None,
+        "user_id": result["user_id"],
+        "topic_id": result["topic_id"],
+        "status": result["status"],
+        "rank": result["rank"],
+        "headline": headline,
+    }
+
+
 def register_routes(app, db: Database):
     """Register API routes with the Flask app"""
 
@@ -76,30 +134,54 @@ def register_routes(app, db: Database):
         }
 
     @app.route("/api/conversations")
+    @read_only_session
     @login_required
     def conversations_list():
-        """fetch top 10 conversations"""
-        return db.list(10)
+        """fetch a page of conversations, newest first"""
+        limit, cursor = page_args()
+        try:
+            conversations, next_cursor = db.list_page(limit, cursor)
+        except ValueError:
+            return jsonify({'error': 'Invalid cursor'}), 400
+        return page_response([conversation_json(c) for c in conversations],
+                             next_cursor)
 
     @app.route("/api/conversations/users/<user_id>")
+    @read_only_session
     @login_required
     def conversations_get_by_user(user_id):
-        """fetch top 10 conversations for a user"""
-        return db.list_by_user(user_id, 10)
+        """fetch a page of conversations for a user, newest first"""
+        limit, cursor = page_args()
+        try:
+            conversations, next_cursor = db.list_by_user_page(
+                user_id, limit, cursor)
+        except ValueError:
+            return jsonify({'error': 'Invalid cursor'}), 400
+        return page_response([conversation_json(c) for c in conversations],
+                             next_cursor)
 
     @app.route("/api/conversations/<id>")
+    @read_only_session
     @login_required
     def conversations_get(id):
         """fetch a conversation by id"""
         return db.get(id)
 
     @app.route("/api/interviews")
+    @read_only_session
     @login_required
     def interviews_list():
-        """fetch top 10 interviews"""
-        return db.list_interviews(10)
+        """fetch a page of interviews, newest first"""
+        limit, cursor = page_args()
+        try:
+            interviews, next_cursor = db.list_interviews_page(limit, cursor)
+        except ValueError:
+            return jsonify({'error': 'Invalid cursor'}), 400
+        return page_response([interview_json(i) for i in interviews],
+                             next_cursor)
 
     @app.route("/api/search", methods=["POST"])
+    @read_only_session
     @login_required
     def search():
         """
@@ -129,6 +211,9 @@ def register_routes(app, db: Database):
 
             scope_name = scope['name']
 
+            # don't hold a pooled connection while bedrock searches
+            db.release()
+
             # Query the Bedrock Knowledge Base using the existing function
             relevant_docs = bedrock_kb.get_relevant_docs(
                 query=query,
@@ -163,7 +248,40 @@ def register_routes(app, db: Database):
             app.logger.error(f"Error in search API: {str(e)}")
             return jsonify({'error': 'Failed to start voice session'}), 500
 
+    @app.route("/api/search/local")
+    @read_only_session
+    @login_required
+    def search_local():
+        """
+        Full-text search over interview transcripts, interview summaries
+        and chat conversations, best match first.
+
+        Query parameters:
+        - q: search text (web search syntax: "quoted phrases", or, -exclude)
+        - type: interview, conversation or all (default)
+        - limit, cursor: pagination, see X-Next-Cursor
+        """
+        text = request.args.get("q", "").strip()
+        if not text:
+            return jsonify({'error': 'Missing required parameter: q'}), 400
+
+        kind = request.args.get("type", "all")
+        if kind not in ("all", "interview", "conversation"):
+            return jsonify({'error': 'type must be interview, conversation or all'}), 400
+
+        limit, cursor = page_args()
+        try:
+            results, next_cursor = db.search(
+                text, limit, cursor,
+                interviews=kind in ("all", "interview"),
+                conversations=kind in ("all", "conversation"))
+        except ValueError:
+            return jsonify({'error': 'Invalid cursor'}), 400
+        return page_response([search_result_json(r) for r in results],
+                             next_cursor)
+
     @app.route("/api/scopes", methods=["GET"])
+    @read_only_session
     @login_required
     def get_scopes():
         """
@@ -189,6 +307,7 @@ def register_routes(app, db: Database):
             return jsonify({'error': 'An internal error has occurred.'}), 500
 
     @app.route("/api/topics", methods=["GET"])
+    @read_only_session
     @login_required
     def get_topics():
         """
@@ -200,21 +319,8 @@ def register_routes(app, db: Database):
         try:
             scope_id = request.args.get('scope_id')
 
-            if scope_id:
-                # Get topics for a specific scope
-                topics = db.list_topics_by_scope(scope_id)
-            else:
-                # Get all topics from all scopes
-                # Since there's no direct method for this, we'll get all scopes and then get topics for each
-                scopes = db.list_scopes()
-                topics = []
-                for scope in scopes:
-                    scope_topics = db.list_topics_by_scope(scope['id'])
-                    for topic in scope_topics:
-                        # Add scope information to each topic
-                        topic['scope_name'] = scope['name']
-                        topic['scope_id'] = scope['id']
-                    topics.extend(scope_topics)
+            # topics with their scope, for one scope or all of them
+            topics = db.get_topic_catalog(scope_id)
 
             # Format the response
             formatted_topics = []
@@ -245,7 +351,7 @@ def register_routes(app, db: Database):
             if not user_id:
                 abort(401, "User not authenticated")
 
-            interview = db.get_interview(interview_id)
+            interview = db.get_interview_header(interview_id)
             if not interview:
                 abort(404, "Interview not found")
 
@@ -265,13 +371,12 @@ def register_routes(app, db: Database):
                 "voice_id": "matthew",
             }
 
-            interview.voice_mode = True
-            interview.voice_session_metadata = voice_session_metadata
-
-            if interview.status == InterviewStatus.NOT_STARTED:
-                interview.status = InterviewStatus.STARTED
+            if not db.start_voice_session(interview_id, voice_session_metadata):
+                abort(409, "Interview status changed, please reload")
 
-            db.update_interview(interview)
+            # release the interview row before the voice lambda starts writing
+            # to it, and the connection while bedrock fetches the prompt
+            db.release()
 
             topic_areas = f"- {interview.topic_areas[0]}"
             for area in interview.topic_areas[1:]:
@@ -305,9 +410,7 @@ def register_routes(app, db: Database):
             logging.info(
                 f"Voice Lambda invoked successfully. Status: {response['StatusCode']}")
 
-            voice_session_metadata['status'] = 'active'
-            interview.voice_session_metadata = voice_session_metadata
-            db.update_interview(interview)
+            db.patch_voice_session_metadata(interview_id, {'status': 'active'})
 
             return jsonify({
                 "session_id": session_id,
@@ -318,6 +421,8 @@ def register_routes(app, db: Database):
                 "message": "Voice session started successfully"
             })
 
+        except HTTPException:
+            raise
         except ClientError as e:
             logging.error(f"AWS error starting voice session: {str(e)}")
             return jsonify({'error': 'Failed to start voice session'}), 500
@@ -350,12 +455,10 @@ def register_routes(app, db: Database):
             if not session_id:
                 abort(400, "No active voice session found")
 
-            voice_session_metadata.update({
+            db.patch_voice_session_metadata(interview_id, {
                 'status': 'stopped',
                 'stopped_at': datetime.now(timezone.utc).isoformat()
             })
-            interview.voice_session_metadata = voice_session_metadata
-            db.update_interview(interview)
 
             _complete_interview(interview, db)
 
@@ -366,6 +469,8 @@ def register_routes(app, db: Database):
                 'message': 'Voice interview ended successfully'
             })
 
+        except HTTPException:
+            raise
         except ClientError as e:
             logging.error(f"AWS error ending voice interview: {str(e)}")
             return jsonify({'error': 'Failed to end voice interview'}), 500
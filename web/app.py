@@ -1,10 +1,12 @@
 from http.client import HTTPException
+import time
 import logging
 from flask import Flask, request, render_template, jsonify, redirect, g, current_app, url_for, session
 import markdown2
 from markupsafe import Markup
 
 from auth import get_current_user, is_admin, configure_auth, login_required
+from shared.config import config
 from shared.data import database
 
 # otel
@@ -75,6 +77,38 @@ def create_app():
                 f"HTTP {request.method} {request.url} {response.status_code}")
         return response
 
+    @app.before_request
+    def begin_db_session():
+        """bind a database session to the request so it uses one connection and transaction"""
+        if request.path == "/health":
+            return
+        view = app.view_functions.get(request.endpoint)
+        read_only = getattr(view, "read_only_session", False)
+        # users who just wrote read from the writer until the replica catches up
+        pinned = session.get("db_primary_until", 0) > time.time()
+        g.db_session = db.begin_session(read_only=read_only, pinned=pinned)
+
+    @app.after_request
+    def commit_db_session(response):
+        """commit the request's unit of work (roll back on server errors)"""
+        db_session = g.pop("db_session", None)
+        if db_session is not None:
+            error = None
+            if response.status_code >= 500:
+                error = RuntimeError(f"HTTP {response.status_code}")
+            db.end_session(db_session, error)
+            if error is None and db_session.wrote and db.reader_host:
+                session["db_primary_until"] = time.time() + \
+                    config.db_read_your_writes_seconds
+        return response
+
+    @app.teardown_request
+    def rollback_db_session(error):
+        """roll back a session left open by an unhandled exception"""
+        db_session = g.pop("db_session", None)
+        if db_session is not None:
+            db.end_session(db_session, error or RuntimeError("request aborted"))
+
     @app.context_processor
     def inject_user():
         """
@@ -35,23 +35,29 @@ def register_routes(app, db):
         scope_name = scope["name"]
         logging.info(f"Using scope: {scope_name} (ID: {scope_id})")
 
+        # don't hold a pooled connection while bedrock answers
+        db.release()
+
         # RAG orchestration to get answer
         answer, sources = orchestrator.orchestrate_chat(conversation, question, scope_name)
 
         # add final Q&A to conversation
+        created = datetime.now(timezone.utc)
         conversation["questions"].append({
             "q": question,
             "a": answer,
-            "created": datetime.now(timezone.utc),
+            "created": created,
         })
 
-        logging.info("updating conversation in db")
+        logging.info("appending turn to conversation in db")
         log.debug(conversation)
-        db.update(conversation)
+        db.add_conversation_turn(
+            conversation["conversationId"], question, answer, created)
 
         return answer, conversation, sources
 
     @app.route("/chat")
+    @database.read_only_session
     @login_required
     def chat():
         """chatbot"""
@@ -64,6 +70,7 @@ def register_routes(app, db):
                                scopes=scopes)
 
     @app.route("/new", methods=["POST"])
+    @database.read_only_session
     @login_required
     def new():
         """POST /new starts a new conversation"""
@@ -110,9 +117,14 @@ def register_routes(app, db):
                 user_id, datetime.now(timezone.utc).isoformat(), scope_id)
         else:
             conversation = db.get(id)
+            if conversation.get("archived"):
+                m = "archived conversations are read-only"
+                logging.error(m)
+                abort(409, m)
             # Update scope_id if it changed
             if conversation.get("scope_id") != scope_id:
                 conversation["scope_id"] = scope_id
+                db.update(conversation)
             logging.info("fetched conversation")
             log.debug(conversation)
 
@@ -129,6 +141,7 @@ def register_routes(app, db):
                                scopes=scopes)
 
     @app.route("/conversation/<id>", methods=["GET"])
+    @database.read_only_session
     @login_required
     def get_conversation(id):
         """GET /conversation/<id> fetches a conversation by id"""
@@ -166,18 +179,18 @@ def register_routes(app, db):
         """
         logging.info(f"fetching chat history for user {user_id}")
 
-        # fetch last 10 questions from db
+        # fetch last 10 conversation summaries from db
         history = db.list_by_user(user_id, 10)
 
         # build list of objects that have
         # the first question in each conversation and the date
         result = []
         for h in history:
-            if len(h["questions"]) == 0:
+            if h["question_count"] == 0:
                 continue
             result.append({
                 "conversationId": h["conversationId"],
-                "created": datetime.fromisoformat(h["created"]).strftime("%B %d, %Y"),
-                "initial_question": h["questions"][0]["q"],
+                "created": h["created"].strftime("%B %d, %Y"),
+                "initial_question": h["initial_question"],
             })
         return result
@@ -0,0 +1,4 @@
+import os
+
+# shared.data.database creates its boto3 clients at import time
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
@@ -48,3 +48,6 @@ CREATE TABLE IF NOT EXISTS settings (
 -- Insert initial talk_mode_enabled setting
 INSERT INTO settings (key, value) VALUES ('talk_mode_enabled', 'true')
 ON CONFLICT (key) DO NOTHING;
+
+-- indexes and later schema changes are versioned migrations in
+-- shared/data/migrations, apply them with: python -m shared.data.migrate
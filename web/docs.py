@@ -2,7 +2,7 @@ import logging
 from flask import render_template
 
 from auth import login_required
-from shared.data.database import Database
+from shared.data.database import Database, read_only_session
 import shared.s3 as s3
 
 
@@ -10,6 +10,7 @@ def register_routes(app, db: Database):
     """Register document-related routes with the Flask app"""
 
     @app.route("/docs/<interview_id>")
+    @read_only_session
     @login_required
     def view_document(interview_id):
         """View PDF document for an approved interview"""
@@ -17,22 +18,20 @@ def register_routes(app, db: Database):
         logging.info(f"Fetching document for interview {interview_id}")
 
         # Get the interview details
-        interview = db.get_interview(interview_id)
+        interview = db.get_interview_header(interview_id)
         if not interview:
             return render_template("error.html", message="Interview not found"), 404
 
-        # determine if this is the latest approved interview
-        latest = db.get_latest_approved_interview(interview.topic_id)
-        archived = False
-        if latest and latest.id != interview.id:
-            archived = True
+        # the topic's current document is in kb/, older ones are archived
+        current = db.get_kb_document(interview.topic_id)
 
         try:
             # Get the S3 key for the document
-            key = s3.get_interview_document_key(
-                interview.topic_name, interview.id)
-            if archived:
-                key = s3.get_archive_key(key)
+            if current and str(current["interview_id"]) == str(interview.id):
+                key = current["s3_key"]
+            else:
+                key = s3.get_archive_key(s3.get_interview_document_key(
+                    interview.topic_name, interview.id))
 
             # Generate a presigned URL for the PDF
             presigned_url = s3.generate_presigned_url(key)
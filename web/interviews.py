@@ -4,7 +4,7 @@ from flask import request, render_template, abort, Response
 
 from auth import get_current_user_id, login_required, decorate_interview_with_username, decorate_interviews_with_usernames, is_admin
 import sqs
-from shared.data.database import Database
+from shared.data.database import Database, read_only_session
 from shared.data.data_models import InterviewStatus
 from shared.llm import orchestrator
 from shared.events import EventType
@@ -18,6 +18,9 @@ def _complete_interview(interview, db):
     interview.status = status
     db.end_interview(interview)
 
+    # make the status change visible before the events lambda picks it up
+    db.commit()
+
     # post a msg to sqs to generate summary
     event_type = EventType.INTERVIEW_COMPLETE.value
     logging.info(f"posting {event_type} message to SQS")
@@ -28,6 +31,7 @@ def register_routes(app, db: Database):
     """Register interview-related routes with the Flask app"""
 
     @app.route("/interviews")
+    @read_only_session
     @login_required
     def interviews():
         """interviews"""
@@ -43,10 +47,15 @@ def register_routes(app, db: Database):
 
         # Initialize all as an empty list by default
         all = []
+        next_cursor = None
 
-        # if the user's an admin, fetch all interviews
+        # if the user's an admin, fetch a page of all interviews
         if is_admin():
-            all = db.list_interviews(100)
+            try:
+                all, next_cursor = db.list_interviews_page(
+                    100, request.args.get("cursor"))
+            except ValueError:
+                abort(400, "Invalid cursor")
             all = decorate_interviews_with_usernames(all)
 
             # whether or not an interview is "viewable"
@@ -69,10 +78,12 @@ def register_routes(app, db: Database):
                                assigned=assigned,
                                reviews=reviews,
                                all=all,
+                               next_cursor=next_cursor,
                                talk_mode_enabled=talk_mode_enabled,
                                )
 
     @app.route("/interviews/view/<id>")
+    @read_only_session
     @login_required
     def view_interview(id):
         """View a completed interview in read-only mode"""
@@ -96,23 +107,31 @@ def register_routes(app, db: Database):
         # get interview
         interview = db.get_interview(id)
 
+        # don't hold a pooled connection while bedrock answers
+        db.release()
+
         # kick off interview by invoking llm with prompt
         logging.info("orchestrator.start_interview()")
         ai_question = orchestrator.start_interview(
             interview.topic_name,
             interview.topic_areas
         )
-        interview.add_question(ai_question)
 
-        # update interview to started
-        logging.info("db.update_interview()")
-        interview.status = InterviewStatus.STARTED
-        db.update_interview(interview)
+        # update interview to started, unless another request already did
+        logging.info("db.transition_interview()")
+        if db.transition_interview(
+                id, [InterviewStatus.NOT_STARTED], InterviewStatus.STARTED):
+            interview.status = InterviewStatus.STARTED
+            interview.add_question(ai_question)
+            db.add_interview_question(id, ai_question)
+        else:
+            logging.warning(f"interview {id} was already started")
 
         logging.info("rendering interviews.conversation.body.html")
         return render_template("interviews.conversation.body.html", interview=interview)
 
     @app.route("/interviews/resume/<id>")
+    @read_only_session
     @login_required
     def resume_interview(id):
         """resume interviews"""
@@ -124,12 +143,13 @@ def register_routes(app, db: Database):
         return render_template("interviews.conversation.body.html", interview=interview)
 
     @app.route("/interviews/voice/<id>")
+    @read_only_session
     @login_required
     def voice_interview(id):
         """Start or resume a voice interview"""
 
         # get interview
-        interview = db.get_interview(id)
+        interview = db.get_interview_header(id)
         if not interview:
             abort(404, "Interview not found")
 
@@ -173,6 +193,9 @@ def register_routes(app, db: Database):
         question = interview.questions[-1]
         question.answer = answer
 
+        # don't hold a pooled connection while bedrock answers
+        db.release()
+
         # ask the ai for a new question
         new_question = orchestrator.orchestrate_answer(
             interview.questions,
@@ -183,8 +206,10 @@ def register_routes(app, db: Database):
         # add new question to interview
         interview.add_question(new_question)
 
-        logging.info("updating interview in db")
-        db.update_interview(interview)
+        logging.info("appending answer and question to interview in db")
+        db.answer_interview_question(id, answer)
+        if not db.add_interview_question(id, new_question):
+            abort(404)
 
         # render ui
         return render_template("interviews.conversation.body.html",
@@ -204,7 +229,7 @@ def register_routes(app, db: Database):
         id = request.values["interview_id"]
 
         logging.info(f"interview id: {id}")
-        interview = db.get_interview(id)
+        interview = db.get_interview_header(id)
         logging.info("fetched interview")
 
         _complete_interview(interview, db)
@@ -220,18 +245,18 @@ def register_routes(app, db: Database):
         """
         logging.info(f"fetching interview history for user {user_id}")
 
-        # fetch last 10 questions from db
+        # fetch last 10 interview summaries from db
         history = db.list_interviews_by_user(user_id, 10)
 
         # build list of objects that have
         # the first question in each interview and the date
         result = []
         for h in history:
-            if len(h["questions"]) == 0:
+            if not h.question_count:
                 continue
             result.append({
-                "interviewId": h["interviewId"],
-                "created": datetime.fromisoformat(h["created"]).strftime("%B %d, %Y"),
-                "initial_question": h["questions"][0]["q"],
+                "interviewId": h.id,
+                "created": h.created.strftime("%B %d, %Y"),
+                "initial_question": h.initial_question,
             })
         return result
@@ -1,13 +1,14 @@
 import logging
 from flask import render_template, request
 from auth import login_required, decorate_interview_with_username, get_user_by_id
-from shared.data.database import Database
+from shared.data.database import Database, read_only_session
 
 
 def register_routes(app, db: Database):
     """Register kb-related routes with the Flask app"""
 
     @app.route("/kb")
+    @read_only_session
     @login_required
     def kb():
         """knowledge base"""
@@ -25,6 +26,7 @@ def register_routes(app, db: Database):
         return render_template("kb.html", scopes=scopes, topics=topics, has_selected_scope=has_selected_scope)
 
     @app.route("/kb/topics")
+    @read_only_session
     @login_required
     def kb_scope_changed():
         """Get approved topics for scope"""
@@ -38,13 +40,14 @@ def register_routes(app, db: Database):
         """Get approved topics for scope"""
 
         logging.info(f"fetching topics for scope {scope_id}")
-        topics = db.list_topics_by_scope(scope_id)
+        if not scope_id:
+            return []
+
+        # topics come with their latest approved interview
+        topics = db.get_topic_catalog(scope_id)
 
-        # for each topic, get the latest approved interview
         for topic in topics:
-            logging.info(
-                f"fetching latest approved interview for {topic["id"]}")
-            interview = db.get_latest_approved_interview(topic["id"])
+            interview = topic["interview"]
             if interview:
                 # Decorate with both interviewer and approver usernames
                 interview = decorate_interview_with_username(interview)
@@ -62,7 +65,5 @@ def register_routes(app, db: Database):
                         interview.approved_by_user_name = "Unknown User"
                 else:
                     interview.approved_by_user_name = None
-                    
-                topic["interview"] = interview
 
         return topics
@@ -1,9 +1,10 @@
 import logging
-from flask import render_template, Response
+from datetime import datetime, timezone
+from flask import render_template, Response, abort
 
 import sqs
 from auth import login_required, decorate_interview_with_username, decorate_interviews_with_usernames, get_current_user_id
-from shared.data.database import Database
+from shared.data.database import Database, read_only_session
 from shared.data.data_models import InterviewStatus
 from shared.events import EventType
 
@@ -12,6 +13,7 @@ def register_routes(app, db: Database):
     """Register reviews-related routes with the Flask app"""
 
     @app.route("/reviews")
+    @read_only_session
     @login_required
     def reviews():
         """reviews"""
@@ -42,13 +44,16 @@ def register_routes(app, db: Database):
     def review_start(interview_id):
         """review UI"""
 
+        # update interview status to reviewing
+        if not db.transition_interview(
+                interview_id,
+                [InterviewStatus.PENDING_REVIEW, InterviewStatus.REVIEWING],
+                InterviewStatus.REVIEWING):
+            abort(409, "Interview is not ready for review")
+
         logging.info("fetching interview")
         interview = db.get_interview(interview_id)
 
-        # update interview status to reviewing
-        interview.status = InterviewStatus.REVIEWING
-        db.update_interview(interview)
-
         # decorate interview with user name info from cognito
         decorate_interview_with_username(interview)
 
@@ -59,24 +64,24 @@ def register_routes(app, db: Database):
     def review_approve(interview_id):
         """approve"""
 
-        logging.info("fetching interview")
-        interview = db.get_interview(interview_id)
-
-        status = InterviewStatus.PENDING_APPROVAL
-        logging.info(f"updating interview status to {status}")
-        interview.status = status
+        logging.info(
+            f"updating interview status to {InterviewStatus.PENDING_APPROVAL}")
+        approved = db.approve_interview(
+            interview_id,
+            approved_by_user_id=get_current_user_id(),
+            approved_on=datetime.now(timezone.utc),
+        )
+        if not approved:
+            logging.error(f"Interview not found or not under review: {interview_id}")
+            return Response("Interview is not under review", status=409)
 
-        # Set approval fields
-        from datetime import datetime, timezone
-        interview.approved_by_user_id = get_current_user_id()
-        interview.approved_on = datetime.now(timezone.utc)
-
-        db.update_interview(interview)
+        # make the status change visible before the events lambda picks it up
+        db.commit()
 
         # post a msg to sqs to generate summary
         event_type = EventType.INTERVIEW_APPROVED.value
         logging.info(f"posting {event_type} message to SQS")
-        sqs.post_message(event_type, str(interview.id))
+        sqs.post_message(event_type, str(interview_id))
 
         # redirect to reviews
         response = Response("Resource updated")
@@ -89,27 +94,23 @@ def register_routes(app, db: Database):
         """reject"""
 
         logging.info(f"Rejecting interview: {interview_id}")
-        interview = db.get_interview(interview_id)
-
-        if not interview:
-            logging.error(f"Interview not found: {interview_id}")
-            response = Response("Interview not found", status=404)
-            return response
-
-        logging.info(f"Current interview status: {interview.status}")
 
         # update interview status to rejected
-        interview.status = InterviewStatus.REJECTED
-        logging.info(f"Setting interview status to: {interview.status}")
-
         try:
-            db.update_interview(interview)
-            logging.info(f"Successfully updated interview status to rejected")
+            rejected = db.transition_interview(
+                interview_id,
+                [InterviewStatus.PENDING_REVIEW, InterviewStatus.REVIEWING],
+                InterviewStatus.REJECTED)
         except Exception as e:
             logging.error(f"Error updating interview: {str(e)}")
             response = Response(f"Error: 'An internal error has occurred.'", status=500)
             return response
 
+        if not rejected:
+            logging.error(f"Interview not found or not under review: {interview_id}")
+            return Response("Interview is not under review", status=409)
+        logging.info(f"Successfully updated interview status to rejected")
+
         # redirect to reviews
         response = Response("Resource updated")
         response.headers['HX-Redirect'] = "/interviews"
@@ -0,0 +1,58 @@
+import io
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("flask")
+
+import admin  # noqa: E402
+from shared.data.data_models import User  # noqa: E402
+
+ALICE = User("sub-alice", "alice", "alice@example.com", "CONFIRMED", True, "", "")
+BOB = User("sub-bob", "bob", "", "CONFIRMED", True, "", "")
+
+DEPLOYS = {"id": uuid.uuid4(), "name": "Deployments"}
+ONCALL_A = {"id": uuid.uuid4(), "name": "On-call"}
+ONCALL_B = {"id": uuid.uuid4(), "name": "On-call"}
+
+
+def upload(text):
+    return SimpleNamespace(stream=io.BytesIO(text.encode("utf-8")))
+
+
+def test_resolve_assignments_by_id_username_email_and_name():
+    rows = [
+        ("sub-alice", str(DEPLOYS["id"])),
+        ("BOB", "deployments"),
+        (" Alice@Example.com ", str(ONCALL_A["id"])),
+    ]
+    pairs, unresolved = admin.resolve_assignments(
+        rows, [ALICE, BOB], [DEPLOYS, ONCALL_A, ONCALL_B])
+    assert pairs == [
+        (str(DEPLOYS["id"]), "sub-alice"),
+        (str(DEPLOYS["id"]), "sub-bob"),
+        (str(ONCALL_A["id"]), "sub-alice"),
+    ]
+    assert unresolved == []
+
+
+def test_resolve_assignments_leaves_unknown_and_ambiguous_rows():
+    rows = [("carol", "Deployments"), ("alice", "On-call"), ("alice", "")]
+    pairs, unresolved = admin.resolve_assignments(
+        rows, [ALICE, BOB], [DEPLOYS, ONCALL_A, ONCALL_B])
+    assert pairs == []
+    assert unresolved == rows
+
+
+def test_read_assignment_csv():
+    rows = admin.read_assignment_csv(upload(
+        "\ufeffUser, Topic ,note\nalice,Deployments,x\n,,\nbob,On-call,\n"))
+    assert rows == [("alice", "Deployments"), ("bob", "On-call")]
+
+
+def test_read_assignment_csv_needs_user_and_topic_columns():
+    with pytest.raises(ValueError):
+        admin.read_assignment_csv(upload("user,scope\nalice,Engineering\n"))
+    with pytest.raises(ValueError):
+        admin.read_assignment_csv(upload(""))
@@ -0,0 +1,19 @@
+import pytest
+
+flask = pytest.importorskip("flask")
+
+import api  # noqa: E402
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("", (10, None)),
+    ("?limit=25", (25, None)),
+    ("?limit=0", (1, None)),
+    ("?limit=1000", (100, None)),
+    ("?limit=abc", (10, None)),
+    ("?cursor=abc", (10, "abc")),
+])
+def test_page_args(query, expected):
+    app = flask.Flask(__name__)
+    with app.test_request_context(f"/api/interviews{query}"):
+        assert api.page_args() == expected